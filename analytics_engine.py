@@ -0,0 +1,178 @@
+"""In-memory analytics over a columnar snapshot of completed events
+
+One query loads every completed event with its analysis and ticket tier
+totals into NumPy arrays. The Analysis view's KPIs, per-type table, capacity
+and top-10 lists and trend series are then computed from a date mask over
+those arrays, so changing the period doesn't touch the database. The
+snapshot is reloaded only when the database has changed.
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+SNAPSHOT_QUERY = '''
+    SELECT
+        e.id,
+        e.event_name,
+        e.event_date,
+        COALESCE(e.event_type_id, 0) as event_type_id,
+        et.name as event_type,
+        ea.id IS NOT NULL as has_analysis,
+        ea.actual_attendance,
+        ea.revenue_total,
+        ea.cost_total,
+        ea.profit_margin,
+        ea.attendee_satisfaction as satisfaction,
+        ea.event_smoothness,
+        ea.overall_success_score,
+        tiers.tickets_available
+    FROM events e
+    LEFT JOIN event_types et ON e.event_type_id = et.id
+    LEFT JOIN event_analysis ea ON e.id = ea.event_id
+    LEFT JOIN (
+        SELECT event_id, SUM(quantity_available) as tickets_available
+        FROM ticket_tiers
+        GROUP BY event_id
+    ) tiers ON tiers.event_id = e.id
+    WHERE e.is_completed = 1
+    ORDER BY e.event_date ASC, e.id ASC
+'''
+
+# Numeric columns held as float arrays (NaN where the database has NULL)
+NUMERIC_COLUMNS = [
+    'actual_attendance', 'revenue_total', 'cost_total', 'profit_margin',
+    'satisfaction', 'event_smoothness', 'overall_success_score', 'tickets_available',
+]
+
+TREND_FIELDS = ['event_date', 'event_name', 'event_type', 'actual_attendance', 'revenue_total',
+                'satisfaction', 'event_smoothness', 'overall_success_score']
+CAPACITY_FIELDS = ['event_name', 'event_date', 'tickets_available', 'actual_attendance']
+TOP_EVENT_FIELDS = ['event_name', 'event_date', 'event_type', 'actual_attendance', 'revenue_total',
+                    'profit_margin', 'satisfaction', 'event_smoothness', 'overall_success_score']
+
+
+def _sum(values) -> float:
+    return float(np.nansum(values)) if values.size else 0.0
+
+
+def _mean(values) -> float:
+    """Mean of the non-NULL values, 0 when there are none (like COALESCE(AVG(x), 0))"""
+    present = values[~np.isnan(values)]
+    return float(present.mean()) if present.size else 0.0
+
+
+class EventSnapshot:
+    """Completed events as parallel arrays, plus the original rows for display"""
+
+    def __init__(self, rows: List[Dict[str, Any]], data_version: int):
+        self.rows = rows
+        self.data_version = data_version
+        self.dates = np.array([row['event_date'] or 'NaT' for row in rows], dtype='datetime64[D]')
+        self.type_ids = np.array([row['event_type_id'] for row in rows], dtype=np.int64)
+        self.type_names = {row['event_type_id']: row['event_type'] for row in rows}
+        self.has_analysis = np.array([bool(row['has_analysis']) for row in rows], dtype=bool)
+        self.columns = {
+            name: np.array([np.nan if row[name] is None else row[name] for row in rows], dtype=float)
+            for name in NUMERIC_COLUMNS
+        }
+
+    @classmethod
+    def load(cls, db) -> 'EventSnapshot':
+        data_version = db.data_version
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(SNAPSHOT_QUERY)
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return cls(rows, data_version)
+
+    def period_mask(self, start_date: Optional[str], end_date: Optional[str] = None):
+        """Events from start_date to end_date (YYYY-MM-DD, inclusive); None leaves that end open"""
+        mask = np.ones(len(self.rows), dtype=bool)
+        if start_date is not None:
+            mask &= self.dates >= np.datetime64(start_date)  # NaT (no date) compares False
+        if end_date is not None:
+            mask &= self.dates <= np.datetime64(end_date)
+        return mask
+
+    def _pick(self, indices, fields: List[str]) -> List[Dict[str, Any]]:
+        return [{field: self.rows[i][field] for field in fields} for i in indices]
+
+    def summarise(self, start_date: Optional[str], end_date: Optional[str] = None) -> Dict[str, Any]:
+        """Everything the Analysis view shows per event for the period"""
+        period = self.period_mask(start_date, end_date)
+        analysed = period & self.has_analysis
+        col = {name: values[analysed] for name, values in self.columns.items()}
+
+        kpi = {
+            'total_attendance': _sum(col['actual_attendance']),
+            'avg_attendance': _mean(col['actual_attendance']),
+            'total_revenue': _sum(col['revenue_total']),
+            'avg_revenue': _mean(col['revenue_total']),
+            'total_costs': _sum(col['cost_total']),
+            'total_profit': _sum(col['profit_margin']),
+            'avg_satisfaction': _mean(col['satisfaction']),
+            'avg_smoothness': _mean(col['event_smoothness']),
+            'avg_overall_success': _mean(col['overall_success_score']),
+        }
+
+        # Per event type (events without analysis still count towards event_count)
+        type_performance = []
+        period_types = self.type_ids[period]
+        for type_id in np.unique(period_types):
+            in_type = analysed & (self.type_ids == type_id)
+            attendance = self.columns['actual_attendance'][in_type]
+            revenue = self.columns['revenue_total'][in_type]
+            type_performance.append({
+                'event_type': self.type_names.get(int(type_id)),
+                'event_count': int(np.count_nonzero(period_types == type_id)),
+                'total_attendance': _sum(attendance),
+                'avg_attendance': _mean(attendance),
+                'total_revenue': _sum(revenue),
+                'avg_revenue': _mean(revenue),
+                'avg_rating': _mean(self.columns['satisfaction'][in_type]),
+            })
+        type_performance.sort(key=lambda row: row['total_revenue'], reverse=True)
+
+        # Rows with analysis, already in date order
+        indices = np.flatnonzero(analysed)
+
+        # Capacity utilisation: attendance against tickets available (0 without tiers, NULL without attendance)
+        available = np.nan_to_num(col['tickets_available'])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            utilization = np.where(available > 0, col['actual_attendance'] * 100.0 / available, 0.0)
+        order = np.argsort(-np.nan_to_num(utilization, nan=-np.inf), kind='stable')[:10]
+        capacity = self._pick(indices[order], CAPACITY_FIELDS)
+        for row, i in zip(capacity, order):
+            row['tickets_available'] = int(available[i])
+            row['utilization_percent'] = None if np.isnan(utilization[i]) else float(utilization[i])
+
+        # Top events by revenue (NULL revenue last)
+        order = np.argsort(-np.nan_to_num(col['revenue_total'], nan=-np.inf), kind='stable')[:10]
+
+        return {
+            'kpi': kpi,
+            'type_performance': type_performance,
+            'capacity': capacity,
+            'top_events': self._pick(indices[order], TOP_EVENT_FIELDS),
+            'time_series': self._pick(indices, TREND_FIELDS),
+        }
+
+
+class AnalyticsEngine:
+    """Holds the current snapshot and reloads it when the database has changed"""
+
+    def __init__(self, db):
+        self.db = db
+        self.snapshot: Optional[EventSnapshot] = None
+        self._lock = threading.Lock()
+
+    def get_snapshot(self) -> EventSnapshot:
+        with self._lock:
+            if self.snapshot is None or self.snapshot.data_version != self.db.data_version:
+                self.snapshot = EventSnapshot.load(self.db)
+            return self.snapshot
+
+    def summarise(self, start_date: Optional[str], end_date: Optional[str] = None) -> Dict[str, Any]:
+        return self.get_snapshot().summarise(start_date, end_date)
@@ -0,0 +1,204 @@
+"""Analysis totals read from the analytics_rollup table
+
+The table holds per month and event type event counts (see migrations 6 and
+8 in schema_migrations.py); triggers keep it current as events change. The
+period comparison's KPI sums are aggregated straight from events. Usage to
+rebuild it from scratch:
+    python analytics_rollup.py [--db events.db]
+"""
+import argparse
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+ROLLUP_COLUMNS = ['event_count', 'cancelled_count', 'completed_count']
+
+# The rollup's columns as aggregates over events e
+ROLLUP_AGGREGATES = '''
+        COUNT(*) as event_count,
+        SUM(CASE WHEN e.is_cancelled = 1 THEN 1 ELSE 0 END) as cancelled_count,
+        SUM(CASE WHEN e.is_completed = 1 THEN 1 ELSE 0 END) as completed_count'''
+
+# The period comparison also sums completed events' analysis
+PERIOD_COLUMNS = ROLLUP_COLUMNS + [
+    'attendance_sum', 'attendance_n', 'revenue_sum', 'revenue_n', 'cost_sum', 'profit_sum',
+    'satisfaction_sum', 'satisfaction_n', 'smoothness_sum', 'smoothness_n', 'success_sum', 'success_n',
+]
+
+# PERIOD_COLUMNS as aggregates over events e LEFT JOIN event_analysis ea
+PERIOD_AGGREGATES = ROLLUP_AGGREGATES + ''',
+        SUM(CASE WHEN e.is_completed = 1 THEN COALESCE(ea.actual_attendance, 0) ELSE 0 END) as attendance_sum,
+        SUM(CASE WHEN e.is_completed = 1 AND ea.actual_attendance IS NOT NULL THEN 1 ELSE 0 END) as attendance_n,
+        SUM(CASE WHEN e.is_completed = 1 THEN COALESCE(ea.revenue_total, 0) ELSE 0 END) as revenue_sum,
+        SUM(CASE WHEN e.is_completed = 1 AND ea.revenue_total IS NOT NULL THEN 1 ELSE 0 END) as revenue_n,
+        SUM(CASE WHEN e.is_completed = 1 THEN COALESCE(ea.cost_total, 0) ELSE 0 END) as cost_sum,
+        SUM(CASE WHEN e.is_completed = 1 THEN COALESCE(ea.profit_margin, 0) ELSE 0 END) as profit_sum,
+        SUM(CASE WHEN e.is_completed = 1 THEN COALESCE(ea.attendee_satisfaction, 0) ELSE 0 END) as satisfaction_sum,
+        SUM(CASE WHEN e.is_completed = 1 AND ea.attendee_satisfaction IS NOT NULL THEN 1 ELSE 0 END) as satisfaction_n,
+        SUM(CASE WHEN e.is_completed = 1 THEN COALESCE(ea.event_smoothness, 0) ELSE 0 END) as smoothness_sum,
+        SUM(CASE WHEN e.is_completed = 1 AND ea.event_smoothness IS NOT NULL THEN 1 ELSE 0 END) as smoothness_n,
+        SUM(CASE WHEN e.is_completed = 1 THEN COALESCE(ea.overall_success_score, 0) ELSE 0 END) as success_sum,
+        SUM(CASE WHEN e.is_completed = 1 AND ea.overall_success_score IS NOT NULL THEN 1 ELSE 0 END) as success_n
+'''
+
+# The rollup's rows computed straight from events; {where} filters the events
+ROLLUP_SELECT = f'''
+    SELECT
+        COALESCE(strftime('%Y-%m', e.event_date), '') as month,
+        COALESCE(e.event_type_id, 0) as event_type_id,
+        {ROLLUP_AGGREGATES}
+    FROM events e
+    {{where}}
+    GROUP BY 1, 2
+'''
+
+# Totals for two date ranges in one pass: each event is bucketed into the
+# current or the comparison period (a NULL end means no upper bound)
+PERIOD_TOTALS_QUERY = f'''
+    SELECT
+        CASE
+            WHEN e.event_date >= :current_start AND (:current_end IS NULL OR e.event_date <= :current_end)
+            THEN 'current'
+            ELSE 'comparison'
+        END as period,
+        {PERIOD_AGGREGATES}
+    FROM events e
+    LEFT JOIN event_analysis ea ON ea.event_id = e.id
+    WHERE (e.event_date >= :current_start AND (:current_end IS NULL OR e.event_date <= :current_end))
+       OR (e.event_date >= :comparison_start AND e.event_date <= :comparison_end)
+    GROUP BY 1
+'''
+
+
+def rebuild_rollup(cursor):
+    """Recompute the whole rollup table from events (caller commits)"""
+    cursor.execute('DELETE FROM analytics_rollup')
+    cursor.execute(f'''
+        INSERT INTO analytics_rollup (month, event_type_id, {', '.join(ROLLUP_COLUMNS)})
+        {ROLLUP_SELECT.format(where='')}
+    ''')
+
+
+def _month_bounds(day: datetime) -> Tuple[str, str]:
+    """First day of day's month and of the month after, as YYYY-MM-DD"""
+    if day.month == 12:
+        return f"{day.year}-12-01", f"{day.year + 1}-01-01"
+    return f"{day.year}-{day.month:02d}-01", f"{day.year}-{day.month + 1:02d}-01"
+
+
+def get_rollup_rows(cursor, start_date: Optional[str] = None,
+                    end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Rollup rows for events from start_date to end_date (YYYY-MM-DD, inclusive; None for open)
+
+    Months wholly inside the range come from the rollup table; the months
+    the range starts and ends in are only partly covered, so their rows are
+    summed from those days' events.
+    """
+    if start_date is None and end_date is None:
+        cursor.execute('SELECT * FROM analytics_rollup')
+        return [dict(row) for row in cursor.fetchall()]
+
+    first_month = last_month = None
+    partial = []  # (from, before) date ranges summed from events
+    if start_date is not None:
+        first_month, after_first = _month_bounds(datetime.strptime(start_date, '%Y-%m-%d'))
+        partial.append((start_date, after_first))
+    if end_date is not None:
+        last_month, after_last = _month_bounds(datetime.strptime(end_date, '%Y-%m-%d'))
+        day_after_end = (datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        if first_month == last_month:
+            partial = [(start_date, day_after_end)]
+        else:
+            partial.append((last_month, day_after_end))
+
+    # Whole months strictly between the partial ones ('' is undated events)
+    cursor.execute('''
+        SELECT * FROM analytics_rollup
+        WHERE month != ''
+        AND (:first IS NULL OR month > :first)
+        AND (:last IS NULL OR month < :last)
+    ''', {'first': first_month and first_month[:7], 'last': last_month and last_month[:7]})
+    rows = [dict(row) for row in cursor.fetchall()]
+
+    for range_start, range_end in partial:
+        cursor.execute(
+            ROLLUP_SELECT.format(where='WHERE e.event_date >= ? AND e.event_date < ?'),
+            (range_start, range_end)
+        )
+        rows += [dict(row) for row in cursor.fetchall()]
+    return rows
+
+
+def get_period_totals(cursor, current: Tuple[str, Optional[str]],
+                      comparison: Tuple[str, str]) -> Dict[str, Dict[str, Any]]:
+    """PERIOD_COLUMNS for a period and the one it's compared with, from a single query
+
+    The periods must not overlap (an event is only counted in one). Returns
+    {'current': {...}, 'comparison': {...}}; either is all zeros when the
+    period has no events.
+    """
+    cursor.execute(PERIOD_TOTALS_QUERY, {
+        'current_start': current[0], 'current_end': current[1],
+        'comparison_start': comparison[0], 'comparison_end': comparison[1],
+    })
+    totals = {period: dict.fromkeys(PERIOD_COLUMNS, 0) for period in ('current', 'comparison')}
+    for row in cursor.fetchall():
+        totals[row['period']].update({column: row[column] or 0 for column in PERIOD_COLUMNS})
+    return totals
+
+
+def _average(total: float, count: int) -> float:
+    return total / count if count else 0
+
+
+def summarise(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Turn rollup rows into the Analysis view's completed count and event stats"""
+    totals = dict.fromkeys(ROLLUP_COLUMNS, 0)
+    for row in rows:
+        for column in ROLLUP_COLUMNS:
+            totals[column] += row[column] or 0
+
+    return {
+        'completed_count': totals['completed_count'],
+        'event_stats': {
+            'total_events': totals['event_count'],
+            'cancelled_events': totals['cancelled_count'],
+        },
+    }
+
+
+def summarise_totals(totals: Dict[str, Any]) -> Dict[str, Any]:
+    """Completed count, event stats and KPIs from one period's get_period_totals()"""
+    summary = summarise([totals])
+    summary['kpi'] = {
+        'total_attendance': totals['attendance_sum'],
+        'avg_attendance': _average(totals['attendance_sum'], totals['attendance_n']),
+        'total_revenue': totals['revenue_sum'],
+        'avg_revenue': _average(totals['revenue_sum'], totals['revenue_n']),
+        'total_costs': totals['cost_sum'],
+        'total_profit': totals['profit_sum'],
+        'avg_satisfaction': _average(totals['satisfaction_sum'], totals['satisfaction_n']),
+        'avg_smoothness': _average(totals['smoothness_sum'], totals['smoothness_n']),
+        'avg_overall_success': _average(totals['success_sum'], totals['success_n']),
+    }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild the analytics rollup table')
+    parser.add_argument('--db', default='events.db', help='database to rebuild')
+    args = parser.parse_args()
+
+    from database import Database
+    db = Database(args.db)
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    rebuild_rollup(cursor)
+    conn.commit()
+    cursor.execute('SELECT COUNT(*) FROM analytics_rollup')
+    print(f"[ANALYSIS] Rebuilt analytics rollup: {cursor.fetchone()[0]} month/type rows")
+    conn.close()
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,371 @@
+"""Benchmark database query latency on a large generated database
+
+Usage:
+    python benchmark_database.py [--events 50000] [--keep]
+
+Builds a throwaway database with the requested number of events (plus
+checklist items, ticket tiers and prize items for each), then times the
+events list, dashboard and per-event lookups with and without the managed
+index set, pooled vs connect-per-call lookups, Database() start-up with and
+without the schema version fast path, write/read workloads under each
+PRAGMA profile, and creating an event from a large template.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+
+from database import Database
+from event_manager import EventManager
+
+
+def seed_database(db: Database, event_count: int):
+    """Fill the database with generated events and child rows"""
+    random.seed(42)
+    conn = db.get_connection()
+    cursor = conn.cursor()
+
+    start_date = date.today() - timedelta(days=event_count // 20)
+    events = []
+    for i in range(event_count):
+        event_date = start_date + timedelta(days=i // 20)
+        events.append((
+            f"Generated Event {i}",
+            event_date.isoformat(),
+            '18:00:00',
+            '22:00:00',
+            random.randint(1, 5),
+            1 if event_date < date.today() else 0,
+            1 if random.random() < 0.02 else 0,
+        ))
+    cursor.executemany('''
+        INSERT INTO events (event_name, event_date, start_time, end_time, event_type_id, is_completed, is_deleted)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', events)
+
+    cursor.execute('SELECT id FROM events')
+    event_ids = [row['id'] for row in cursor.fetchall()]
+
+    cursor.executemany('''
+        INSERT INTO event_checklist_items (event_id, category_id, description, is_completed, sort_order, show_on_dashboard)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', (
+        (event_id, 1, f"Task {n}", random.randint(0, 1), n, 1 if n == 0 else 0)
+        for event_id in event_ids for n in range(8)
+    ))
+
+    cursor.executemany('''
+        INSERT INTO ticket_tiers (event_id, tier_name, price, quantity_available, quantity_sold)
+        VALUES (?, ?, ?, ?, ?)
+    ''', (
+        (event_id, tier, price, 20, random.randint(0, 20))
+        for event_id in event_ids for tier, price in (('Standard', 10.0), ('Premium', 25.0))
+    ))
+
+    cursor.executemany('''
+        INSERT INTO prize_items (event_id, description, quantity, cost_per_item, total_cost, is_received)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', (
+        (event_id, 'Booster pack', 4, 6.5, 26.0, 1 if random.random() < 0.8 else 0)
+        for event_id in event_ids
+    ))
+
+    conn.commit()
+    conn.close()
+    return event_ids
+
+
+def run_dashboard_queries(db: Database):
+    """Run the two dashboard queries from BGEventsApp.show_dashboard"""
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT ci.id, ci.description, ci.is_completed, e.event_name, e.event_date, e.id as event_id
+        FROM event_checklist_items ci
+        JOIN events e ON ci.event_id = e.id
+        WHERE ci.show_on_dashboard = 1
+        AND e.is_deleted = 0
+        AND e.is_completed = 0
+        ORDER BY ci.is_completed ASC, e.event_date ASC
+    ''')
+    cursor.fetchall()
+    cursor.execute('''
+        SELECT DISTINCT e.id, e.event_name, e.event_date, COUNT(p.id) as unreceived_count
+        FROM events e
+        JOIN prize_items p ON e.id = p.event_id
+        WHERE p.is_received = 0
+        AND e.is_completed = 0
+        AND e.is_deleted = 0
+        AND e.event_date >= date('now')
+        GROUP BY e.id, e.event_name, e.event_date
+        ORDER BY e.event_date ASC
+    ''')
+    cursor.fetchall()
+    conn.close()
+
+
+def run_per_event_lookups(db: Database, event_ids, sample_size: int = 200):
+    """Run the per-event child lookups used by the event cards and PDF sheet"""
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    for event_id in event_ids[:sample_size]:
+        cursor.execute('''
+            SELECT * FROM event_checklist_items
+            WHERE event_id = ? AND is_completed = 0
+            ORDER BY sort_order
+        ''', (event_id,))
+        cursor.fetchall()
+        cursor.execute('SELECT * FROM ticket_tiers WHERE event_id = ? ORDER BY price', (event_id,))
+        cursor.fetchall()
+        cursor.execute('SELECT * FROM prize_items WHERE event_id = ? ORDER BY created_at', (event_id,))
+        cursor.fetchall()
+    conn.close()
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    """Return the best wall time of several runs, in milliseconds"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_suite(db: Database, event_ids):
+    """Time every benchmark query and return {name: ms}"""
+    manager = EventManager(db)
+    sample = random.sample(event_ids, min(200, len(event_ids)))
+    return {
+        'events list (upcoming)': time_call(manager.get_all_events, False),
+        'events list (all)': time_call(manager.get_all_events, True),
+        'deleted events': time_call(manager.get_deleted_events),
+        'dashboard queries': time_call(run_dashboard_queries, db),
+        'per-event lookups x200': time_call(run_per_event_lookups, db, sample),
+    }
+
+
+def run_connect_per_call(db_path: str, calls: int):
+    """Look up a setting with a fresh connection per call (the old behaviour)"""
+    for _ in range(calls):
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute('SELECT setting_value FROM settings WHERE setting_key = ?', ('saturday_rate',)).fetchone()
+        conn.close()
+
+
+def run_pooled(db: Database, calls: int):
+    """Look up a setting through the pooled connection"""
+    for _ in range(calls):
+        conn = db.get_connection()
+        conn.execute('SELECT setting_value FROM settings WHERE setting_key = ?', ('saturday_rate',)).fetchone()
+        conn.close()
+
+
+def run_cached(db: Database, calls: int):
+    """Look up a setting through the settings cache"""
+    for _ in range(calls):
+        db.get_setting_float('saturday_rate', 30.0)
+
+
+def benchmark_connections(db: Database, calls: int = 2000):
+    """Compare connect-per-call against the pooled connection"""
+    db.connections.reset_stats()
+    per_call = time_call(run_connect_per_call, db.db_path, calls)
+    pooled = time_call(run_pooled, db, calls)
+    stats = db.get_connection_stats()
+    cached = time_call(run_cached, db, calls)
+
+    print(f"\n{calls} setting lookups: connect-per-call {per_call:.1f}ms, pooled {pooled:.1f}ms, "
+          f"settings cache {cached:.2f}ms")
+    print(f"Pooled connections opened: {stats['connections_opened']}, "
+          f"checkouts: {stats['checkouts']}, reused: {stats['reused']}")
+
+
+def open_database(db_path: str, force_migrations: bool):
+    """Construct a Database, optionally resetting the schema version first"""
+    if force_migrations:
+        conn = sqlite3.connect(db_path)
+        conn.execute('PRAGMA user_version = 0')
+        conn.close()
+    Database(db_path).close()
+
+
+def benchmark_startup(db_path: str):
+    """Compare Database() start-up with and without the schema version fast path"""
+    full = time_call(open_database, db_path, True)
+    fast = time_call(open_database, db_path, False)
+    print(f"\nDatabase() start-up: all migrations {full:.1f}ms, version current {fast:.1f}ms")
+
+
+def run_checklist_toggles(db: Database, event_ids, toggles: int = 500):
+    """Toggle checklist items one commit at a time, like the checklist tab"""
+    for n in range(toggles):
+        conn = db.get_connection()
+        conn.execute('''
+            UPDATE event_checklist_items
+            SET is_completed = 1 - is_completed
+            WHERE event_id = ? AND sort_order = ?
+        ''', (event_ids[n % len(event_ids)], n % 8))
+        conn.commit()
+        conn.close()
+
+
+def run_post_event_saves(db: Database, event_ids, saves: int = 200):
+    """Save post-event analysis one event at a time, like the post-event tab"""
+    for event_id in event_ids[:saves]:
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM event_analysis WHERE event_id = ?', (event_id,))
+        cursor.execute('''
+            INSERT INTO event_analysis (event_id, actual_attendance, attendee_satisfaction,
+                                        profit_margin, revenue_total, cost_total)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (event_id, 16, 7.5, 120.0, 300.0, 180.0))
+        cursor.execute('UPDATE events SET is_completed = 1, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+                       (event_id,))
+        conn.commit()
+        conn.close()
+
+
+def run_analysis_reads(db: Database, repeat: int = 20):
+    """Run analysis-style aggregates over completed events"""
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    for _ in range(repeat):
+        cursor.execute('''
+            SELECT e.event_type_id, COUNT(*) as events,
+                   SUM(tt.revenue) as revenue, AVG(ea.actual_attendance) as attendance
+            FROM events e
+            LEFT JOIN (
+                SELECT event_id, SUM(price * quantity_sold) as revenue
+                FROM ticket_tiers GROUP BY event_id
+            ) tt ON tt.event_id = e.id
+            LEFT JOIN event_analysis ea ON ea.event_id = e.id
+            WHERE e.is_completed = 1 AND e.is_deleted = 0
+            GROUP BY e.event_type_id
+        ''')
+        cursor.fetchall()
+    conn.close()
+
+
+def benchmark_pragma_profiles(event_count: int):
+    """Compare write-heavy and read-heavy workloads under each PRAGMA profile"""
+    print(f"\n{'Workload':<28}{'safe':>14}{'performance':>14}")
+    print("-" * 56)
+    results = {}
+    for profile in ('safe', 'performance'):
+        db_dir = tempfile.mkdtemp(prefix='tt_events_bench_')
+        db_path = os.path.join(db_dir, 'profile.db')
+        db = Database(db_path, pragma_profile=profile)
+        event_ids = seed_database(db, event_count)
+        results[profile] = {
+            'checklist toggles x500': time_call(run_checklist_toggles, db, event_ids, repeat=1),
+            'post-event saves x200': time_call(run_post_event_saves, db, event_ids, repeat=1),
+            'analysis aggregates x20': time_call(run_analysis_reads, db, repeat=1),
+        }
+        db.close()
+        for name in os.listdir(db_dir):
+            os.remove(os.path.join(db_dir, name))
+        os.rmdir(db_dir)
+
+    for name in results['safe']:
+        print(f"{name:<28}{results['safe'][name]:>12.1f}ms{results['performance'][name]:>12.1f}ms")
+
+
+def seed_template(db: Database, checklist_items: int = 200) -> int:
+    """Create a template with a large checklist plus tiers, prizes, notes and feedback"""
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO event_templates (name) VALUES ('Benchmark Template')")
+    template_id = cursor.lastrowid
+    cursor.executemany('''
+        INSERT INTO template_checklist_items (template_id, description, sort_order)
+        VALUES (?, ?, ?)
+    ''', [(template_id, f"Task {n}", n) for n in range(checklist_items)])
+    cursor.executemany('''
+        INSERT INTO template_ticket_tiers (template_id, tier_name, price, quantity_available)
+        VALUES (?, ?, ?, ?)
+    ''', [(template_id, f"Tier {n}", 10.0 + n, 20) for n in range(10)])
+    cursor.executemany('''
+        INSERT INTO template_prize_items (template_id, description, quantity, cost_per_item, total_cost)
+        VALUES (?, ?, 1, 5.0, 5.0)
+    ''', [(template_id, f"Prize {n}") for n in range(10)])
+    cursor.executemany('''
+        INSERT INTO template_notes (template_id, note_text) VALUES (?, ?)
+    ''', [(template_id, f"Note {n}") for n in range(20)])
+    cursor.executemany('''
+        INSERT INTO template_feedback (template_id, event_id, feedback_text)
+        VALUES (?, (SELECT COALESCE(MIN(id), 0) FROM events), ?)
+    ''', [(template_id, f"Feedback {n}") for n in range(20)])
+    conn.commit()
+    conn.close()
+    return template_id
+
+
+def benchmark_template_copy(db: Database, checklist_items: int = 200):
+    """Time creating an event from a template with a large checklist"""
+    template_id = seed_template(db, checklist_items)
+    manager = EventManager(db)
+    elapsed = time_call(manager.create_event_from_template, template_id, date.today().isoformat())
+    print(f"\nCreate event from {checklist_items}-item template: {elapsed:.1f}ms")
+
+
+def print_results(before, after):
+    """Print a before/after comparison table"""
+    print(f"\n{'Query':<28}{'No indexes':>14}{'Indexed':>14}{'Speedup':>10}")
+    print("-" * 66)
+    for name in before:
+        speedup = before[name] / after[name] if after[name] else float('inf')
+        print(f"{name:<28}{before[name]:>12.1f}ms{after[name]:>12.1f}ms{speedup:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=50000, help='number of events to generate')
+    parser.add_argument('--keep', action='store_true', help='keep the generated database file')
+    args = parser.parse_args()
+
+    db_dir = tempfile.mkdtemp(prefix='tt_events_bench_')
+    db_path = os.path.join(db_dir, 'benchmark.db')
+
+    print(f"Generating {args.events} events in {db_path}...")
+    db = Database(db_path)
+    started = time.perf_counter()
+    event_ids = seed_database(db, args.events)
+    print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+    db.drop_indexes()
+    conn = db.get_connection()
+    conn.execute('ANALYZE')
+    conn.close()
+    before = run_suite(db, event_ids)
+
+    conn = db.get_connection()
+    db.create_indexes(conn.cursor())
+    conn.execute('ANALYZE')
+    conn.commit()
+    conn.close()
+    after = run_suite(db, event_ids)
+
+    print_results(before, after)
+    benchmark_connections(db)
+    benchmark_template_copy(db)
+    db.close()
+    benchmark_startup(db_path)
+    benchmark_pragma_profiles(min(args.events, 10000))
+
+    if args.keep:
+        print(f"\nDatabase kept at: {db_path}")
+    else:
+        for name in os.listdir(db_dir):
+            os.remove(os.path.join(db_dir, name))
+        os.rmdir(db_dir)
+
+
+if __name__ == '__main__':
+    main()
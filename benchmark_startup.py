@@ -0,0 +1,86 @@
+"""Benchmark application start-up (time to the first painted dashboard)
+
+Usage:
+    python benchmark_startup.py [--runs 5] [--db events.db]
+
+Launches main.py with --trace-startup --quit-after-startup several times in
+a scratch directory (holding a copy of the database, so the real one and its
+backups folder are left alone) and reports the median of each traced phase
+and of the time until the dashboard was painted. On Linux without a display
+the app is run under xvfb-run.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from startup_trace import QUIT_FLAG, TRACE_FLAG, TRACE_LOG, read_trace_log
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+
+
+def launch_command():
+    """Command that starts the app once, headless where needed"""
+    command = [sys.executable, APP_SCRIPT, TRACE_FLAG, QUIT_FLAG]
+    if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+        if not shutil.which('xvfb-run'):
+            sys.exit("No display available and xvfb-run is not installed")
+        command = ['xvfb-run', '--auto-servernum'] + command
+    return command
+
+
+def run_benchmark(runs: int, db_path: str):
+    work_dir = tempfile.mkdtemp(prefix='tt_startup_')
+    try:
+        if db_path and os.path.exists(db_path):
+            shutil.copy2(db_path, os.path.join(work_dir, 'events.db'))
+        else:
+            print(f"{db_path} not found; starting from an empty database")
+
+        command = launch_command()
+        process_ms = []
+        for run in range(runs):
+            started = time.perf_counter()
+            result = subprocess.run(command, cwd=work_dir, capture_output=True, text=True, timeout=120)
+            process_ms.append((time.perf_counter() - started) * 1000)
+            if result.returncode != 0:
+                print(result.stderr)
+                sys.exit(f"Run {run + 1} failed with exit code {result.returncode}")
+
+        traces = read_trace_log(os.path.join(work_dir, TRACE_LOG))[-runs:]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if not traces:
+        sys.exit("No start-up traces were recorded")
+
+    # The first run also creates the daily backup and (for a new database) the schema
+    print(f"Start-up over {len(traces)} runs (median, first run included)")
+    phase_names = [phase['name'] for phase in traces[0]['phases']]
+    for name in phase_names:
+        wall = [p['wall_ms'] for t in traces for p in t['phases'] if p['name'] == name]
+        cpu = [p['cpu_ms'] for t in traces for p in t['phases'] if p['name'] == name]
+        print(f"  {name:<24} {statistics.median(wall):8.1f} ms wall {statistics.median(cpu):8.1f} ms CPU")
+
+    mark_names = [mark['name'] for mark in traces[0]['marks']]
+    for name in mark_names:
+        at = [m['wall_ms'] for t in traces for m in t['marks'] if m['name'] == name]
+        print(f"  {name:<24} at {statistics.median(at):7.1f} ms")
+
+    print(f"  {'whole process':<24} {statistics.median(process_ms):8.1f} ms (launch to exit)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='number of launches to time')
+    parser.add_argument('--db', default='events.db', help='database to start with (copied, not modified)')
+    args = parser.parse_args()
+    run_benchmark(args.runs, args.db)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,9 @@ import subprocess
 import shutil
 from pathlib import Path
 
+# Packages that should only be imported when the view that needs them is opened
+DEFERRED_IMPORTS = ['matplotlib', 'numpy', 'reportlab', 'tkcalendar', 'babel']
+
 def clean_build_dirs():
     """Clean up build and dist directories"""
     print("Cleaning build directories...")
@@ -32,6 +35,44 @@ def check_pyinstaller():
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
         return True
 
+def report_import_times(top: int = 10):
+    """Summarise `python -X importtime` for importing main.py
+
+    Prints the slowest top-level packages and the total import time, and
+    returns False if any DEFERRED_IMPORTS package is imported at startup
+    (i.e. a view's heavy dependency has crept back into the startup path).
+    """
+    print("Measuring startup imports...")
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main'],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(f"  Could not import main.py:\n{result.stderr.strip().splitlines()[-1]}")
+        return False
+
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    package_us = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        package = parts[2].strip().split('.')[0]
+        package_us[package] = package_us.get(package, 0) + int(parts[0])
+
+    total_ms = sum(package_us.values()) / 1000
+    print(f"  Total import time: {total_ms:.0f} ms across {len(package_us)} packages")
+    for package, us in sorted(package_us.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"    {us / 1000:8.1f} ms  {package}")
+
+    loaded = [package for package in DEFERRED_IMPORTS if package in package_us]
+    if loaded:
+        print(f"  Error: imported at startup but should load on first use: {', '.join(loaded)}")
+        return False
+    return True
+
 def build_executable():
     """Build the executable using PyInstaller"""
     print("\nBuilding executable...")
@@ -138,6 +179,12 @@ def main():
     print("=" * 60)
     print()
 
+    # Catch heavy imports that have crept into startup
+    if not report_import_times():
+        return 1
+    if '--import-report' in sys.argv:
+        return 0
+
     # Check PyInstaller
     if not check_pyinstaller():
         print("Failed to install PyInstaller")
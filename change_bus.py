@@ -0,0 +1,117 @@
+"""Process-wide publish/subscribe bus for data changes"""
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Change kinds
+CREATED = 'created'
+UPDATED = 'updated'
+DELETED = 'deleted'
+
+
+class Change:
+    """One changed row: what kind of entity, which one, and what happened to it"""
+
+    __slots__ = ('entity', 'entity_id', 'kind')
+
+    def __init__(self, entity: str, entity_id: Optional[int], kind: str):
+        self.entity = entity
+        self.entity_id = entity_id
+        self.kind = kind
+
+    def __repr__(self):
+        return f"Change({self.entity!r}, {self.entity_id!r}, {self.kind!r})"
+
+
+class ChangeBus:
+    """Tells open views which rows changed so they can update just those
+
+    Managers (and dialogs that write directly) publish a Change after their
+    commit; views subscribe to the entities they display and update or
+    replace only the affected card. Subscribers are called on the publishing
+    thread, so publish from the Tk thread.
+
+    Inside batch(), changes are held back and delivered once when the
+    outermost batch ends, with repeats of the same row merged.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[int, Tuple[Callable[[Change], None], Tuple[str, ...]]] = {}
+        self._next_token = 0
+        self._batch_depth = 0
+        self._pending: Dict[Tuple[str, Optional[int]], Change] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[Change], None], *entities: str) -> Callable[[], None]:
+        """Call callback(change) for changes to the given entities (all if none given)
+
+        Returns a function that removes the subscription; views call it when
+        they are destroyed.
+        """
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscribers[token] = (callback, entities)
+        return lambda: self._unsubscribe(token)
+
+    def _unsubscribe(self, token: int):
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def publish(self, entity: str, entity_id: Optional[int], kind: str = UPDATED):
+        """Announce a committed change to one row"""
+        change = Change(entity, entity_id, kind)
+        if self._batch_depth:
+            key = (entity, entity_id)
+            previous = self._pending.get(key)
+            # A row created and then edited in the same batch is still new to subscribers
+            if previous and previous.kind == CREATED and kind == UPDATED:
+                return
+            self._pending[key] = change
+            return
+        self._deliver([change])
+
+    def publish_many(self, entity: str, entity_ids: List[int], kind: str = UPDATED):
+        with self.batch():
+            for entity_id in entity_ids:
+                self.publish(entity, entity_id, kind)
+
+    @contextmanager
+    def batch(self):
+        """Hold changes back until the block ends, then deliver each row once"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending:
+                changes = list(self._pending.values())
+                self._pending.clear()
+                self._deliver(changes)
+
+    def _deliver(self, changes: List[Change]):
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+        for change in changes:
+            for callback, entities in subscribers:
+                if entities and change.entity not in entities:
+                    continue
+                try:
+                    callback(change)
+                except Exception as e:
+                    # A broken view must not stop the others (or the write) from completing
+                    print(f"[CHANGES] Subscriber failed for {change}: {e}")
+
+
+_buses: Dict[str, ChangeBus] = {}
+_buses_lock = threading.Lock()
+
+
+def get_change_bus(db_path: str) -> ChangeBus:
+    """Get the shared bus for a database file (one per file per process)"""
+    key = os.path.abspath(db_path)
+    with _buses_lock:
+        if key not in _buses:
+            _buses[key] = ChangeBus()
+        return _buses[key]
@@ -0,0 +1,235 @@
+"""Trend charts for the Analysis view, rendered off screen to PNG
+
+Figures are drawn with the Agg backend (no pyplot, so it's safe on the
+database worker thread), saved to PNG and cleared straight away. PNGs are
+cached by period, detail level and a hash of the plotted data, so switching
+back to a period that hasn't changed reuses the image.
+
+Long histories aren't plotted one marker per event: in Auto detail they are
+grouped into weekly or monthly totals and averages, and Every Event detail
+thins the line with LTTB (largest triangle three buckets) downsampling.
+"""
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+CHART_DPI = 100
+CHART_SIZE = (12, 14)  # inches
+CHART_CACHE_SIZE = 8  # PNGs kept (a few hundred KB each)
+
+TREND_COLUMNS = ['actual_attendance', 'revenue_total', 'satisfaction', 'event_smoothness', 'overall_success_score']
+SUM_COLUMNS = ('actual_attendance', 'revenue_total')  # Bucketed as totals; the scores are averaged
+
+TREND_DETAILS = ['Auto', 'Every Event', 'Weekly', 'Monthly']
+MARKER_LIMIT = 60  # Auto plots each event with a marker up to this many events
+LINE_POINT_LIMIT = 400  # Every Event downsamples lines longer than this
+WEEKLY_BUCKET_LIMIT = 104  # Auto uses months once a history spans more weeks than this
+OVERLAY_TYPES = 4  # Event types (most events first) overlaid on the bucketed totals
+
+
+def lttb(x, y, threshold: int):
+    """Indices of the points Largest-Triangle-Three-Buckets keeps (first and last always)
+
+    The points between the ends are split into threshold - 2 buckets; from
+    each, the point forming the largest triangle with the previously kept
+    point and the next bucket's average is kept, which preserves peaks and
+    troughs that plain striding would drop.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    kept = np.empty(threshold, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[edges[i + 1]:edges[i + 2]].mean()
+            next_y = y[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        kept[i + 1] = previous
+    return kept
+
+
+def _bucket_starts(dates, interval: str):
+    """Start day of each date's week (Monday) or month"""
+    if interval == 'week':
+        monday = np.datetime64('1969-12-29')  # Weeks counted from a Monday
+        return monday + ((dates - monday) // np.timedelta64(7, 'D')) * 7
+    return dates.astype('datetime64[M]').astype('datetime64[D]')
+
+
+def prepare_trends(time_series: List[Dict[str, Any]], detail: str = 'Auto') -> Dict[str, Any]:
+    """Points to plot for each trend column at the chosen detail
+
+    Returns the interval ('week', 'month' or None for per event), whether
+    to draw markers, {column: (dates, values)} and, for bucketed totals,
+    {column: [(event type, dates, values)]} overlays built from the same
+    buckets.
+    """
+    dates = np.array([row['event_date'] for row in time_series], dtype='datetime64[D]')
+    values = {
+        c: np.array([np.nan if row[c] is None else row[c] for row in time_series], dtype=float)
+        for c in TREND_COLUMNS
+    }
+
+    interval = {'Weekly': 'week', 'Monthly': 'month', 'Every Event': None}.get(detail)
+    if detail == 'Auto' and len(dates) > MARKER_LIMIT:
+        weeks = int((dates[-1] - dates[0]) // np.timedelta64(7, 'D')) + 1
+        interval = 'week' if weeks <= WEEKLY_BUCKET_LIMIT else 'month'
+
+    if interval is None:
+        # One point per event (missing values drawn as 0, as they always were)
+        x = dates.astype(float)
+        series = {}
+        for column, column_values in values.items():
+            y = np.nan_to_num(column_values)
+            kept = lttb(x, y, LINE_POINT_LIMIT)
+            series[column] = (dates[kept], y[kept])
+        return {'interval': None, 'markers': len(dates) <= MARKER_LIMIT, 'series': series, 'overlays': {}}
+
+    buckets, index = np.unique(_bucket_starts(dates, interval), return_inverse=True)
+
+    def aggregate(column_values, rows=None):
+        present = ~np.isnan(column_values) if rows is None else ~np.isnan(column_values) & rows
+        totals = np.bincount(index, weights=np.where(present, column_values, 0), minlength=len(buckets))
+        counts = np.bincount(index, weights=present, minlength=len(buckets))
+        return totals, counts
+
+    series = {}
+    for column, column_values in values.items():
+        totals, counts = aggregate(column_values)
+        if column in SUM_COLUMNS:
+            series[column] = (buckets, totals)
+        else:
+            with np.errstate(invalid='ignore'):
+                series[column] = (buckets, np.where(counts > 0, totals / counts, np.nan))
+
+    types = np.array([row.get('event_type') or 'Unknown' for row in time_series], dtype=object)
+    names, type_counts = np.unique(types, return_counts=True)
+    overlays = {column: [] for column in SUM_COLUMNS}
+    if len(names) > 1:
+        for name in names[np.argsort(-type_counts, kind='stable')][:OVERLAY_TYPES]:
+            rows = types == name
+            has_rows = np.bincount(index, weights=rows, minlength=len(buckets)) > 0
+            for column in SUM_COLUMNS:
+                totals, _ = aggregate(values[column], rows)
+                overlays[column].append((name, buckets[has_rows], totals[has_rows]))
+
+    return {'interval': interval, 'markers': len(buckets) <= MARKER_LIMIT, 'series': series, 'overlays': overlays}
+
+
+def data_hash(time_series: List[Dict[str, Any]]) -> str:
+    """Hash of the values the trend charts plot"""
+    digest = hashlib.sha1()
+    for row in time_series:
+        digest.update(repr((row['event_date'], row.get('event_type'), *(row[c] for c in TREND_COLUMNS))).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def build_trend_figure(time_series: List[Dict[str, Any]], detail: str = 'Auto'):
+    """Build the five trend subplots as a matplotlib Figure (not registered with pyplot)"""
+    from matplotlib.figure import Figure
+    import matplotlib.dates as mdates
+
+    trends = prepare_trends(time_series, detail)
+    interval = trends['interval']
+
+    # Every subplot spans the whole history, even a column with no values yet
+    first = datetime.strptime(time_series[0]['event_date'], '%Y-%m-%d')
+    last = datetime.strptime(time_series[-1]['event_date'], '%Y-%m-%d')
+    margin = max((last - first) * 0.02, timedelta(days=1))
+
+    fig = Figure(figsize=CHART_SIZE, facecolor='#F9F9F9')
+
+    # (column, marker, marker size, colour, y label, title, 0-10 scale), colours matching the app theme
+    subplots = [
+        ('actual_attendance', 'o', 8, '#8B5FBF', 'Attendees', 'Attendance Over Time', False),
+        ('revenue_total', 's', 8, '#C5A8D9', 'Revenue ($)', 'Ticket Revenue Over Time', False),
+        ('satisfaction', '^', 8, '#4A2D5E', 'Satisfaction (0-10)', 'Attendee Satisfaction Over Time', True),
+        ('event_smoothness', 'D', 8, '#81C784', 'Smoothness (0-10)', 'Event Smoothness Over Time', True),
+        ('overall_success_score', '*', 10, '#4CAF50', 'Success Score (0-10)',
+         'Overall Event Success Score Over Time', True),
+    ]
+    for index, (column, marker, marker_size, color, ylabel, title, scored) in enumerate(subplots, start=1):
+        ax = fig.add_subplot(len(subplots), 1, index)
+        dates, values = trends['series'][column]
+        ax.plot(dates.astype(datetime), values, marker=marker if trends['markers'] else None,
+                linewidth=2, markersize=marker_size, color=color, label='All events')
+        for name, type_dates, type_values in trends['overlays'].get(column, []):
+            ax.plot(type_dates.astype(datetime), type_values, linewidth=1, linestyle='--', alpha=0.8, label=name)
+        if trends['overlays'].get(column):
+            ax.legend(fontsize=9, loc='upper left')
+
+        if interval:
+            kind = 'Total' if column in SUM_COLUMNS else 'Average'
+            title = f"{title} ({'Weekly' if interval == 'week' else 'Monthly'} {kind})"
+        ax.set_ylabel(ylabel, fontsize=11, fontweight='bold', color='#4A2D5E')
+        ax.set_title(title, fontsize=13, fontweight='bold', color='#8B5FBF', pad=10)
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.set_facecolor('white')
+        if scored:
+            ax.set_ylim(0, 10)
+        ax.tick_params(colors='#4A2D5E')
+        ax.set_xlim(first - margin, last + margin)
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator(maxticks=10))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y' if interval == 'month' else '%d %b %Y'))
+        if index == 1:
+            fig.autofmt_xdate(rotation=45)
+    ax.set_xlabel('Event Date', fontsize=11, fontweight='bold', color='#4A2D5E')
+
+    fig.tight_layout(pad=2.0)
+    return fig
+
+
+class TrendChartRenderer:
+    """Renders trend charts to PNG bytes, caching the most recent ones"""
+
+    def __init__(self, max_entries: int = CHART_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[Tuple[str, str], bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, period: str, time_series: List[Dict[str, Any]], detail: str = 'Auto') -> bytes:
+        """PNG of the trend charts for a period (call on a worker thread)"""
+        key = (period, detail, data_hash(time_series))
+        with self._lock:
+            png = self._cache.get(key)
+            if png is not None:
+                self._cache.move_to_end(key)
+                return png
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        fig = build_trend_figure(time_series, detail)
+        try:
+            FigureCanvasAgg(fig)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=CHART_DPI, facecolor=fig.get_facecolor())
+            png = buffer.getvalue()
+        finally:
+            fig.clear()  # Release the artists now rather than whenever the figure is collected
+
+        with self._lock:
+            self._cache[key] = png
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return png
+
+    def cached(self, period: str, time_series: List[Dict[str, Any]], detail: str = 'Auto') -> Optional[bytes]:
+        """The cached PNG for a period, detail and data, if there is one"""
+        with self._lock:
+            return self._cache.get((period, detail, data_hash(time_series)))
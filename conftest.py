@@ -0,0 +1,11 @@
+"""Shared pytest fixtures"""
+import pytest
+from database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A fresh, fully migrated database in a temporary directory"""
+    database = Database(str(tmp_path / 'test.db'))
+    yield database
+    database.close()
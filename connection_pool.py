@@ -0,0 +1,229 @@
+"""Reusable SQLite connections for the Database class"""
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class PooledConnection:
+    """Handle to a shared sqlite3 connection
+
+    Behaves like a sqlite3.Connection, but close() releases the handle back to
+    the ConnectionManager instead of closing the underlying connection. When the
+    last handle on a thread is released, any uncommitted work is rolled back so
+    the next caller starts clean, just as if the connection had been closed.
+    """
+
+    def __init__(self, manager: 'ConnectionManager', conn: sqlite3.Connection):
+        self._manager = manager
+        self._conn = conn
+        self._acquired_at = time.perf_counter()
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Same semantics as sqlite3.Connection: commit on success, rollback on error
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def commit(self):
+        self._conn.commit()
+        self._manager.note_commit(self._conn)
+
+    def rollback(self):
+        self._conn.rollback()
+        self._manager.note_rollback(self._conn)
+
+    def close(self):
+        """Release this handle (the underlying connection stays open)"""
+        if not self._released:
+            self._released = True
+            self._manager.release(self)
+
+    def __del__(self):
+        # Handles dropped without close() (e.g. after an exception) are still released
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionManager:
+    """Hands out reusable connections to a single SQLite database
+
+    The thread that created the manager (the Tk thread) keeps one long-lived
+    connection. Other threads borrow a connection from a small pool and return
+    it when their last handle is released. Nested get_connection() calls on the
+    same thread share the same connection.
+
+    data_version goes up by one for every commit that changed rows, so callers
+    (e.g. cached views) can cheaply tell whether anything was written since
+    they last read.
+    """
+
+    def __init__(self, db_path: str, pool_size: int = 4,
+                 on_connect: Optional[Callable[[sqlite3.Connection], None]] = None):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self.on_connect = on_connect
+        self.owner_thread = threading.get_ident()
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._owner_conn: Optional[sqlite3.Connection] = None
+        self._idle: List[sqlite3.Connection] = []
+        self._all: List[sqlite3.Connection] = []
+        self._changes_seen: Dict[sqlite3.Connection, int] = {}
+        self.data_version = 0
+
+        # Counters for get_stats()
+        self._opened = 0
+        self._closed = 0
+        self._checkouts = 0
+        self._reused = 0
+        self._open_seconds = 0.0
+        self._held_seconds = 0.0
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a new configured connection"""
+        started = time.perf_counter()
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        if self.on_connect:
+            self.on_connect(conn)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self._opened += 1
+            self._open_seconds += elapsed
+            self._all.append(conn)
+            self._changes_seen[conn] = conn.total_changes
+        return conn
+
+    def acquire(self) -> PooledConnection:
+        """Check out a connection handle for the current thread"""
+        local = self._local
+        conn = getattr(local, 'conn', None)
+
+        if conn is None:
+            if threading.get_ident() == self.owner_thread:
+                if self._owner_conn is None:
+                    self._owner_conn = self._open()
+                else:
+                    self._count_reuse()
+                conn = self._owner_conn
+            else:
+                with self._lock:
+                    conn = self._idle.pop() if self._idle else None
+                if conn is None:
+                    conn = self._open()
+                else:
+                    self._count_reuse()
+            local.conn = conn
+            local.depth = 0
+        else:
+            self._count_reuse()
+
+        local.depth += 1
+        with self._lock:
+            self._checkouts += 1
+        return PooledConnection(self, conn)
+
+    def note_commit(self, conn: sqlite3.Connection):
+        """Bump data_version if the connection changed rows since its last commit"""
+        changes = conn.total_changes
+        with self._lock:
+            if changes != self._changes_seen.get(conn):
+                self._changes_seen[conn] = changes
+                self.data_version += 1
+
+    def note_rollback(self, conn: sqlite3.Connection):
+        """Rolled-back changes still count in total_changes; don't report them later"""
+        with self._lock:
+            self._changes_seen[conn] = conn.total_changes
+
+    def _count_reuse(self):
+        with self._lock:
+            self._reused += 1
+
+    def release(self, handle: PooledConnection):
+        """Release a handle; return the connection to the pool when unused"""
+        held = time.perf_counter() - handle._acquired_at
+        with self._lock:
+            self._held_seconds += held
+
+        local = self._local
+        if getattr(local, 'conn', None) is not handle._conn:
+            # Released from a different thread (e.g. garbage collected); nothing to track
+            return
+
+        local.depth -= 1
+        if local.depth > 0:
+            return
+
+        conn = local.conn
+        local.conn = None
+        if conn.in_transaction:
+            conn.rollback()
+            self.note_rollback(conn)
+
+        if conn is self._owner_conn:
+            return
+
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+            self._all.remove(conn)
+            self._changes_seen.pop(conn, None)
+            self._closed += 1
+        conn.close()
+
+    def close_all(self):
+        """Close every connection (call on application shutdown)"""
+        with self._lock:
+            connections = list(self._all)
+            self._all.clear()
+            self._idle.clear()
+            self._changes_seen.clear()
+            self._owner_conn = None
+            self._closed += len(connections)
+        self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection counters: how many were opened vs reused, and timings"""
+        with self._lock:
+            return {
+                'connections_opened': self._opened,
+                'connections_closed': self._closed,
+                'connections_open': len(self._all),
+                'pool_idle': len(self._idle),
+                'checkouts': self._checkouts,
+                'reused': self._reused,
+                'open_ms_total': self._open_seconds * 1000,
+                'open_ms_avg': (self._open_seconds * 1000 / self._opened) if self._opened else 0.0,
+                'held_ms_total': self._held_seconds * 1000,
+            }
+
+    def reset_stats(self):
+        """Reset the counters (open connections are kept)"""
+        with self._lock:
+            self._opened = 0
+            self._closed = 0
+            self._checkouts = 0
+            self._reused = 0
+            self._open_seconds = 0.0
+            self._held_seconds = 0.0
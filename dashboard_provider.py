@@ -0,0 +1,100 @@
+"""Dashboard alert data"""
+from database import Database
+from datetime import date
+from typing import Optional, List, Dict, Any
+
+# Both alert sets in one round-trip. Urgency is bucketed in SQL from the days
+# until the event; the first parameter is today's date (local time, ISO
+# format). {event_filter} optionally limits both sets to some events.
+DASHBOARD_ALERTS_QUERY = '''
+    WITH params AS (SELECT julianday(?) AS today),
+    unreceived AS (
+        SELECT
+            'prize' as kind,
+            0 as section,
+            e.id as alert_id,
+            e.id as event_id,
+            e.event_name,
+            e.event_date,
+            NULL as description,
+            COUNT(p.id) as unreceived_count,
+            0 as is_completed,
+            CAST(julianday(e.event_date) - params.today AS INTEGER) as days_until
+        FROM events e
+        JOIN prize_items p ON e.id = p.event_id
+        CROSS JOIN params
+        WHERE p.is_received = 0
+        AND e.is_completed = 0
+        AND e.is_deleted = 0
+        AND julianday(e.event_date) >= params.today
+        {event_filter}
+        GROUP BY e.id, e.event_name, e.event_date
+    ),
+    checklist AS (
+        SELECT
+            'checklist' as kind,
+            1 as section,
+            ci.id as alert_id,
+            e.id as event_id,
+            e.event_name,
+            e.event_date,
+            ci.description,
+            NULL as unreceived_count,
+            ci.is_completed,
+            CAST(julianday(e.event_date) - params.today AS INTEGER) as days_until
+        FROM event_checklist_items ci
+        JOIN events e ON ci.event_id = e.id
+        CROSS JOIN params
+        WHERE ci.show_on_dashboard = 1
+        AND e.is_deleted = 0
+        AND e.is_completed = 0
+        {event_filter}
+    )
+    SELECT
+        *,
+        CASE
+            WHEN is_completed THEN 'completed'
+            WHEN days_until IS NULL THEN 'none'
+            WHEN days_until < 0 THEN 'overdue'
+            WHEN days_until = 0 THEN 'today'
+            WHEN days_until <= 7 THEN 'soon'
+            ELSE 'later'
+        END as urgency
+    FROM (SELECT * FROM unreceived UNION ALL SELECT * FROM checklist)
+    ORDER BY section, is_completed, event_date, alert_id
+'''
+
+
+class DashboardProvider:
+    """Computes the dashboard's alerts: unreceived prizes and dashboard checklist items"""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def get_alerts(self, today: Optional[date] = None,
+                   event_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """Get every dashboard alert, prizes first, in display order
+
+        Each alert has a kind ('prize' or 'checklist'), an alert_id that is
+        unique within its kind (the event id for prizes, the checklist item id
+        otherwise), the event's id, name and date, days_until the event and
+        an urgency bucket: 'completed', 'none', 'overdue', 'today', 'soon'
+        (within a week) or 'later'. With event_ids only those events' alerts
+        are returned.
+        """
+        today = today or date.today()
+        params = [today.isoformat()]
+        event_filter = ''
+        if event_ids is not None:
+            if not event_ids:
+                return []
+            event_filter = f"AND e.id IN ({','.join('?' * len(event_ids))})"
+            params += list(event_ids) * 2  # Once for each alert set
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(DASHBOARD_ALERTS_QUERY.format(event_filter=event_filter), params)
+        alerts = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+
+        return alerts
@@ -0,0 +1,160 @@
+"""Background thread for slow database reads"""
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import tkinter as tk
+
+
+class DatabaseWorker:
+    """Runs queries on a worker thread and hands the results back to Tk
+
+    submit() queues a function and returns a concurrent.futures.Future. The
+    function runs on the worker thread, where db.get_connection() returns the
+    worker's own connection (borrowed from the ConnectionManager pool and
+    kept between jobs), so existing manager methods can be submitted as-is.
+
+    run() also delivers the result to a callback on the Tk thread: completed
+    futures are picked up by polling with after(), because Tk must only be
+    touched from the thread that created it.
+
+    run() requests can be given a key. A new request with the same key
+    supersedes the old one: it is cancelled if it hasn't started, and its
+    result is dropped if it has. Results for widgets that have since been
+    destroyed are dropped as well.
+
+    Use the worker for reads. Writes that publish to the change bus should
+    stay on the Tk thread, as subscribers are called on the publishing thread.
+    submit() and run() must be called from the Tk thread.
+    """
+
+    def __init__(self, db, poll_ms: int = 20):
+        self.db = db
+        self.poll_ms = poll_ms
+
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._latest: Dict[Hashable, Future] = {}
+        self._deliveries: List[tuple] = []
+        self._poll_root: Optional[tk.Misc] = None
+        self._poll_pending = False
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Run fn(*args, **kwargs) on the worker thread"""
+        future = Future()
+        self._start()
+        self._jobs.put((future, fn, args, kwargs))
+        return future
+
+    def run(self, widget: tk.Misc, fn: Callable, *args, on_done: Callable[[Any], None],
+            on_error: Optional[Callable[[BaseException], None]] = None,
+            key: Optional[Hashable] = None, **kwargs) -> Future:
+        """Run fn on the worker thread and call on_done(result) on the Tk thread
+
+        on_error(exception) is called instead if fn raises; without it the
+        error is printed. Neither is called if the request was superseded or
+        widget has been destroyed.
+        """
+        future = self.submit(fn, *args, **kwargs)
+        if key is not None:
+            self.cancel(key)
+            self._latest[key] = future
+        self._deliveries.append((future, widget, on_done, on_error, key))
+        self._schedule_poll(widget)
+        return future
+
+    def cancel(self, key: Hashable):
+        """Drop the pending request with this key, if there is one"""
+        future = self._latest.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Whether a request with this key is still waiting to be delivered"""
+        return key in self._latest
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker thread once the queued jobs have finished"""
+        if self._thread is None:
+            return
+        self._jobs.put(None)
+        if wait:
+            self._thread.join()
+        self._thread = None
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name="DatabaseWorker", daemon=True)
+            self._thread.start()
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, fn, args, kwargs = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            # Held for the whole job so nested get_connection() calls share it;
+            # releasing it rolls back anything the job left uncommitted
+            conn = self.db.get_connection()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            finally:
+                conn.close()
+
+    def _schedule_poll(self, widget: tk.Misc):
+        if self._poll_root is None:
+            # Poll from the root window so closing the requesting view doesn't cancel it
+            self._poll_root = widget.nametowidget('.')
+        if not self._poll_pending:
+            self._poll_pending = True
+            self._poll_root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """Deliver finished results on the Tk thread"""
+        self._poll_pending = False
+        deliveries, self._deliveries = self._deliveries, []
+
+        for delivery in deliveries:
+            future = delivery[0]
+            if future.done():
+                self._deliver(*delivery)
+            else:
+                self._deliveries.append(delivery)
+
+        if self._deliveries and self._poll_root is not None:
+            self._poll_pending = True
+            self._poll_root.after(self.poll_ms, self._poll)
+
+    def _deliver(self, future: Future, widget: tk.Misc, on_done, on_error, key):
+        if key is not None:
+            if self._latest.get(key) is not future:
+                return  # Superseded by a newer request
+            del self._latest[key]
+        if future.cancelled():
+            return
+
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        error = future.exception()
+        try:
+            if error is None:
+                on_done(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                print(f"[WORKER] Background query failed: {error}")
+        except Exception as e:
+            # Keep delivering the other results
+            print(f"[WORKER] Result callback failed: {e}")
@@ -0,0 +1,176 @@
+"""In-process scheduler that keeps the dashboard alerts current"""
+import heapq
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from change_bus import DELETED
+from dashboard_provider import DashboardProvider
+
+# Urgency buckets that count towards the sidebar badge
+ATTENTION_URGENCIES = ('overdue', 'today', 'soon')
+SOON_DAYS = 7  # Matches the 'soon' bucket in DASHBOARD_ALERTS_QUERY
+MAX_SLEEP_MS = 60 * 60 * 1000  # Re-check hourly so clock changes and suspend are picked up
+
+
+def next_boundary(event_date: Optional[str], today: date) -> Optional[date]:
+    """First day after today on which an event's alerts change urgency bucket
+
+    Alerts move from 'later' to 'soon' a week before the event, to 'today' on
+    the day and to 'overdue' (prizes drop off) the day after.
+    """
+    if not event_date:
+        return None
+    day = datetime.strptime(event_date, '%Y-%m-%d').date()
+    for boundary in (day - timedelta(days=SOON_DAYS), day, day + timedelta(days=1)):
+        if boundary > today:
+            return boundary
+    return None
+
+
+class DeadlineScheduler:
+    """Keeps the set of dashboard alerts up to date without polling
+
+    The alerts are loaded once; after that only the events named by 'event'
+    change notifications are re-read. Upcoming urgency changes sit in a
+    min-heap of (day, event_id) and a single Tk timer sleeps until the
+    earliest one, when just the events due are re-read; on other new days
+    the day counts are moved on in memory. Listeners added with subscribe()
+    are called whenever the alert set changes.
+    """
+
+    def __init__(self, db, widget):
+        self.db = db
+        self.widget = widget
+        self.provider = DashboardProvider(db)
+        self.alerts: Dict[int, List[Dict[str, Any]]] = {}  # event_id -> its alerts
+        self.boundaries: Dict[int, date] = {}  # event_id -> its next boundary
+        self.heap: List[Tuple[date, int]] = []
+        self.listeners: List[Callable[[], None]] = []
+        self.timer = None
+        self.today = date.today()
+
+        self.reload()
+        self.unsubscribe_changes = db.changes.subscribe(self.on_event_changed, 'event')
+
+    def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call callback() after the alerts change; returns an unsubscribe function"""
+        self.listeners.append(callback)
+        return lambda: self.listeners.remove(callback) if callback in self.listeners else None
+
+    def get_alerts(self) -> List[Dict[str, Any]]:
+        """Every current alert, in the dashboard's display order"""
+        alerts = [alert for event_alerts in self.alerts.values() for alert in event_alerts]
+        alerts.sort(key=lambda a: (a['section'], a['is_completed'], a['event_date'] or '', a['alert_id']))
+        return alerts
+
+    @property
+    def badge_count(self) -> int:
+        """Alerts that need attention now (overdue, due today or within a week)"""
+        return sum(
+            1 for event_alerts in self.alerts.values() for alert in event_alerts
+            if alert['urgency'] in ATTENTION_URGENCIES
+        )
+
+    def reload(self):
+        """Read every alert and rebuild the heap"""
+        self.today = date.today()
+        self.alerts.clear()
+        self.boundaries.clear()
+        self.heap.clear()
+        self._store(self.provider.get_alerts(self.today))
+        self._schedule()
+        self._notify()
+
+    def refresh_events(self, event_ids):
+        """Re-read the alerts of some events (e.g. after they changed)"""
+        event_ids = list(event_ids)
+        for event_id in event_ids:
+            self.alerts.pop(event_id, None)
+            self.boundaries.pop(event_id, None)
+        self._store(self.provider.get_alerts(self.today, event_ids=event_ids))
+        self._schedule()
+        self._notify()
+
+    def on_event_changed(self, change):
+        if date.today() != self.today:
+            self._on_timer()  # Catch up on a new day first
+        if change.entity_id is None:
+            self.reload()
+        elif change.kind == DELETED:
+            self.alerts.pop(change.entity_id, None)
+            self.boundaries.pop(change.entity_id, None)  # Its heap entry goes stale
+            self._notify()
+        else:
+            self.refresh_events([change.entity_id])
+
+    def stop(self):
+        if self.timer is not None:
+            self.widget.after_cancel(self.timer)
+            self.timer = None
+        self.unsubscribe_changes()
+
+    def _store(self, alerts: List[Dict[str, Any]]):
+        """Add alerts to the set and push each new event's next boundary"""
+        for alert in alerts:
+            event_id = alert['event_id']
+            if event_id not in self.alerts:
+                self.alerts[event_id] = []
+                boundary = next_boundary(alert['event_date'], self.today)
+                if boundary is not None:
+                    self.boundaries[event_id] = boundary
+                    heapq.heappush(self.heap, (boundary, event_id))
+            self.alerts[event_id].append(alert)
+
+    def _schedule(self):
+        """Sleep until midnight before the earliest live boundary"""
+        # Drop entries for events whose boundary moved or that have no alerts left
+        while self.heap and self.boundaries.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+
+        if self.timer is not None:
+            self.widget.after_cancel(self.timer)
+            self.timer = None
+        if not self.heap:
+            return
+
+        wake_at = datetime.combine(self.heap[0][0], datetime.min.time())
+        delay_ms = int((wake_at - datetime.now()).total_seconds() * 1000)
+        self.timer = self.widget.after(min(max(delay_ms, 0), MAX_SLEEP_MS), self._on_timer)
+
+    def _on_timer(self):
+        if self.timer is not None:  # Called early, by a change notification
+            self.widget.after_cancel(self.timer)
+            self.timer = None
+        today = date.today()
+        elapsed = 0
+        if today < self.today:  # Clock went backwards
+            self.reload()
+            return
+        if today > self.today:
+            elapsed = (today - self.today).days
+            # New dicts, so the dashboard's cards see the change
+            for event_id, event_alerts in self.alerts.items():
+                self.alerts[event_id] = [
+                    alert if alert['days_until'] is None
+                    else dict(alert, days_until=alert['days_until'] - elapsed)
+                    for alert in event_alerts
+                ]
+            self.today = today
+
+        due = set()
+        while self.heap and self.heap[0][0] <= today:
+            boundary, event_id = heapq.heappop(self.heap)
+            if self.boundaries.get(event_id) == boundary:
+                due.add(event_id)
+
+        if due:
+            print(f"[DEADLINES] Urgency changed for {len(due)} event(s)")
+            self.refresh_events(due)
+        else:
+            self._schedule()
+            if elapsed:
+                self._notify()
+
+    def _notify(self):
+        for callback in list(self.listeners):
+            callback()
@@ -1,7 +1,64 @@
 """Event management functionality"""
 from database import Database
-from datetime import datetime, time
-from typing import Optional, List, Dict, Any
+from change_bus import CREATED, UPDATED, DELETED
+from datetime import date, datetime, time
+from typing import Optional, List, Dict, Any, Tuple
+
+# (id column on events, lookup table, name column added to each event dict)
+REFERENCE_NAME_COLUMNS = [
+    ('event_type_id', 'event_types', 'event_type_name'),
+    ('playing_format_id', 'playing_formats', 'format_name'),
+    ('pairing_method_id', 'pairing_methods', 'pairing_method_name'),
+    ('pairing_app_id', 'pairing_apps', 'pairing_app_name'),
+    ('template_id', 'event_templates', 'template_name'),
+]
+
+# Status filters for get_events_page (conditions on the events alias e)
+EVENT_STATUS_FILTERS = {
+    'not_organised': 'e.is_organised = 0',
+    'organised': 'e.is_organised = 1',
+    'tickets_live': 'e.tickets_live = 1',
+    'not_advertised': 'e.is_advertised = 0',
+    'advertised': 'e.is_advertised = 1',
+    'cancelled': 'e.is_cancelled = 1',
+}
+
+# Child rows of one event, as read by the event dialog's tabs (event_id is the only parameter)
+EVENT_CHILD_QUERIES = {
+    'ticket_tiers': 'SELECT * FROM ticket_tiers WHERE event_id = ? ORDER BY price',
+    'prize_items': 'SELECT * FROM prize_items WHERE event_id = ? ORDER BY created_at',
+    'players': 'SELECT * FROM event_players WHERE event_id = ? ORDER BY sort_order, player_name',
+    'checklist_items': '''
+        SELECT ci.*, cc.name as category_name
+        FROM event_checklist_items ci
+        LEFT JOIN checklist_categories cc ON ci.category_id = cc.id
+        WHERE ci.event_id = ?
+        ORDER BY cc.sort_order, ci.sort_order, ci.description
+    ''',
+    'notes': 'SELECT * FROM event_notes WHERE event_id = ? ORDER BY created_at DESC',
+    'labour_costs': 'SELECT * FROM labour_costs WHERE event_id = ? ORDER BY id',
+    'event_costs': 'SELECT * FROM event_costs WHERE event_id = ?',
+    'analysis': 'SELECT * FROM event_analysis WHERE event_id = ?',
+    'financials': 'SELECT * FROM event_financials WHERE event_id = ?',
+}
+
+FINANCIAL_COLUMNS = [
+    'ticket_revenue', 'tickets_sold', 'ticket_capacity', 'max_ticket_revenue',
+    'labour_cost', 'prize_cost', 'other_cost',
+]
+
+
+def summarise_financials(row: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """An event_financials row (zeros when the event has none) plus its cost total and profit
+
+    cost_total is labour plus other costs, as saved to event_analysis;
+    prize support is reported separately in prize_cost.
+    """
+    financials = {column: (row or {}).get(column) or 0 for column in FINANCIAL_COLUMNS}
+    financials['cost_total'] = financials['labour_cost'] + financials['other_cost']
+    financials['profit'] = financials['ticket_revenue'] - financials['cost_total']
+    return financials
+
 
 class EventManager:
     """Manages event CRUD operations"""
@@ -15,19 +72,8 @@ class EventManager:
         cursor = conn.cursor()
 
         query = '''
-            SELECT
-                e.*,
-                et.name as event_type_name,
-                pf.name as format_name,
-                pm.name as pairing_method_name,
-                pa.name as pairing_app_name,
-                temp.name as template_name
+            SELECT e.*
             FROM events e
-            LEFT JOIN event_types et ON e.event_type_id = et.id
-            LEFT JOIN playing_formats pf ON e.playing_format_id = pf.id
-            LEFT JOIN pairing_methods pm ON e.pairing_method_id = pm.id
-            LEFT JOIN pairing_apps pa ON e.pairing_app_id = pa.id
-            LEFT JOIN event_templates temp ON e.template_id = temp.id
         '''
 
         # Build WHERE clause
@@ -43,7 +89,159 @@ class EventManager:
         cursor.execute(query)
         events = [dict(row) for row in cursor.fetchall()]
         conn.close()
-        return events
+        return self.attach_reference_names(events)
+
+    def get_events_page(self, order: str = 'upcoming', after: Optional[Tuple[str, int]] = None,
+                        limit: int = 50, include_completed: bool = True,
+                        event_type_id: Optional[int] = None, template_id: Optional[int] = None,
+                        status: Optional[str] = None,
+                        todo_limit: int = 3) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """Get one page of events, with to-do summaries, using keyset pagination
+
+        Args:
+            order: 'upcoming' (today onwards plus overdue events not yet
+                completed, soonest first) or 'past' (before today, newest first)
+            after: Cursor returned with the previous page; None for the first page
+            limit: Page size
+            include_completed: Whether completed events are included
+            event_type_id, template_id: Optional filters
+            status: Optional key of EVENT_STATUS_FILTERS
+
+        Returns:
+            (events, next_cursor). next_cursor is None when there are no more pages.
+
+        Pages are keyed on (event_date, id) rather than OFFSET, so every page
+        costs the same however far the user has scrolled.
+        """
+        where_conditions, params, sort = self._event_list_conditions(
+            order, include_completed, event_type_id, template_id, status
+        )
+        if after:
+            where_conditions.append(f"(e.event_date, e.id) {'>' if sort == 'ASC' else '<'} (?, ?)")
+            params.extend(after)
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        # One extra row tells us whether there is another page
+        cursor.execute(f'''
+            SELECT e.*
+            FROM events e
+            WHERE {' AND '.join(where_conditions)}
+            ORDER BY e.event_date {sort}, e.id {sort}
+            LIMIT ?
+        ''', params + [limit + 1])
+        events = [dict(row) for row in cursor.fetchall()]
+
+        next_cursor = None
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = (events[-1]['event_date'], events[-1]['id'])
+
+        if events:
+            placeholders = ', '.join('?' for _ in events)
+            self._attach_todo_summaries(cursor, events, f'e.id IN ({placeholders})',
+                                        tuple(event['id'] for event in events), todo_limit)
+        conn.close()
+
+        return self.attach_reference_names(events), next_cursor
+
+    def get_events_by_ids(self, event_ids: List[int], order: str = 'upcoming',
+                          include_completed: bool = True, event_type_id: Optional[int] = None,
+                          template_id: Optional[int] = None, status: Optional[str] = None,
+                          todo_limit: int = 3) -> List[Dict[str, Any]]:
+        """Get the given events in get_events_page() form, if they pass the same filters
+
+        Used to update single cards after a change; events that no longer
+        match the filters (or are deleted) are left out.
+        """
+        if not event_ids:
+            return []
+
+        where_conditions, params, sort = self._event_list_conditions(
+            order, include_completed, event_type_id, template_id, status
+        )
+        placeholders = ', '.join('?' for _ in event_ids)
+        where_conditions.append(f'e.id IN ({placeholders})')
+        params.extend(event_ids)
+        where_clause = ' AND '.join(where_conditions)
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT e.*
+            FROM events e
+            WHERE {where_clause}
+            ORDER BY e.event_date {sort}, e.id {sort}
+        ''', params)
+        events = [dict(row) for row in cursor.fetchall()]
+
+        if events:
+            self._attach_todo_summaries(cursor, events, where_clause, tuple(params), todo_limit)
+        conn.close()
+
+        return self.attach_reference_names(events)
+
+    def _event_list_conditions(self, order: str, include_completed: bool, event_type_id: Optional[int],
+                               template_id: Optional[int], status: Optional[str]) -> Tuple[List[str], List[Any], str]:
+        """WHERE conditions, parameters and sort direction for the events list filters"""
+        if order not in ('upcoming', 'past'):
+            raise ValueError(f"Unknown event order: {order}")
+
+        where_conditions = ['e.is_deleted = 0']
+        if order == 'upcoming':
+            # Past events nobody has completed yet stay at the top until they are
+            where_conditions.append('(e.event_date >= ? OR e.is_completed = 0)')
+            sort = 'ASC'
+        else:
+            where_conditions.append('e.event_date < ?')
+            sort = 'DESC'
+        params: List[Any] = [date.today().isoformat()]
+
+        if not include_completed:
+            where_conditions.append('e.is_completed = 0')
+        if event_type_id is not None:
+            where_conditions.append('e.event_type_id = ?')
+            params.append(event_type_id)
+        if template_id is not None:
+            where_conditions.append('e.template_id = ?')
+            params.append(template_id)
+        if status:
+            if status not in EVENT_STATUS_FILTERS:
+                raise ValueError(f"Unknown event status filter: {status}")
+            where_conditions.append(EVENT_STATUS_FILTERS[status])
+
+        return where_conditions, params, sort
+
+    def _attach_todo_summaries(self, cursor, events: List[Dict[str, Any]], event_filter: str,
+                               params: tuple, todo_limit: int):
+        """Add todo_count/todo_items to events in one query (event_filter is on alias e)"""
+        # Number the incomplete items per event and count them in the same pass
+        cursor.execute(f'''
+            SELECT event_id, description, todo_count
+            FROM (
+                SELECT
+                    ci.event_id,
+                    ci.description,
+                    ROW_NUMBER() OVER (PARTITION BY ci.event_id ORDER BY ci.sort_order, ci.id) as position,
+                    COUNT(*) OVER (PARTITION BY ci.event_id) as todo_count
+                FROM event_checklist_items ci
+                JOIN events e ON e.id = ci.event_id
+                WHERE ci.is_completed = 0 AND {event_filter}
+            )
+            WHERE position <= ?
+            ORDER BY event_id, position
+        ''', params + (todo_limit,))
+
+        summaries = {}
+        for row in cursor.fetchall():
+            summary = summaries.setdefault(row['event_id'], {'todo_count': row['todo_count'], 'todo_items': []})
+            summary['todo_items'].append(row['description'])
+
+        for event in events:
+            summary = summaries.get(event['id'], {'todo_count': 0, 'todo_items': []})
+            event['todo_count'] = summary['todo_count']
+            event['todo_items'] = summary['todo_items']
 
     def get_event_by_id(self, event_id: int) -> Optional[Dict[str, Any]]:
         """Get a single event by ID"""
@@ -51,31 +249,62 @@ class EventManager:
         cursor = conn.cursor()
 
         cursor.execute('''
-            SELECT
-                e.*,
-                et.name as event_type_name,
-                pf.name as format_name,
-                pm.name as pairing_method_name,
-                pa.name as pairing_app_name,
-                temp.name as template_name
+            SELECT e.*
             FROM events e
-            LEFT JOIN event_types et ON e.event_type_id = et.id
-            LEFT JOIN playing_formats pf ON e.playing_format_id = pf.id
-            LEFT JOIN pairing_methods pm ON e.pairing_method_id = pm.id
-            LEFT JOIN pairing_apps pa ON e.pairing_app_id = pa.id
-            LEFT JOIN event_templates temp ON e.template_id = temp.id
             WHERE e.id = ?
         ''', (event_id,))
 
         result = cursor.fetchone()
         conn.close()
-        return dict(result) if result else None
+        return self.attach_reference_names([dict(result)])[0] if result else None
+
+    def get_event_children(self, event_id: int, tables: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Read an event's child rows (all of EVENT_CHILD_QUERIES, or just tables) in one batch
+
+        The reads share one connection and one read transaction, so the tabs
+        of the event dialog all see the same snapshot.
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        own_transaction = not conn.in_transaction
+        if own_transaction:
+            cursor.execute('BEGIN')
+        try:
+            children = {}
+            for table in tables or EVENT_CHILD_QUERIES:
+                cursor.execute(EVENT_CHILD_QUERIES[table], (event_id,))
+                children[table] = [dict(row) for row in cursor.fetchall()]
+        finally:
+            if own_transaction:
+                conn.rollback()
+            conn.close()
+        return children
+
+    def attach_reference_names(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill in lookup names (event_type_name, format_name, ...) from the reference data cache"""
+        name_maps = [
+            (id_column, name_column, self.db.get_reference_name_map(table))
+            for id_column, table, name_column in REFERENCE_NAME_COLUMNS
+        ]
+        for event in events:
+            for id_column, name_column, name_map in name_maps:
+                event[name_column] = name_map.get(event.get(id_column))
+        return events
 
     def create_event(self, event_data: Dict[str, Any]) -> int:
         """Create a new event"""
         conn = self.db.get_connection()
         cursor = conn.cursor()
 
+        event_id = self._insert_event(cursor, event_data)
+        conn.commit()
+        conn.close()
+
+        self.db.changes.publish('event', event_id, CREATED)
+        return event_id
+
+    def _insert_event(self, cursor, event_data: Dict[str, Any]) -> int:
+        """Insert an events row on the caller's cursor (no commit)"""
         cursor.execute('''
             INSERT INTO events (
                 template_id, event_name, event_date, start_time, end_time,
@@ -105,14 +334,14 @@ class EventManager:
             event_data.get('number_of_rounds')
         ))
 
-        event_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-
-        return event_id
+        return cursor.lastrowid
 
     def update_event(self, event_id: int, event_data: Dict[str, Any]):
-        """Update an existing event"""
+        """Update an existing event
+
+        include_attendees keeps its saved value when event_data leaves it out
+        (e.g. the dialog's Players tab was never opened).
+        """
         conn = self.db.get_connection()
         cursor = conn.cursor()
 
@@ -134,7 +363,7 @@ class EventManager:
                 tickets_live = ?,
                 is_advertised = ?,
                 is_completed = ?,
-                include_attendees = ?,
+                include_attendees = COALESCE(?, include_attendees),
                 number_of_rounds = ?,
                 updated_at = ?
             WHERE id = ?
@@ -155,7 +384,7 @@ class EventManager:
             event_data.get('tickets_live', 0),
             event_data.get('is_advertised', 0),
             event_data.get('is_completed', 0),
-            event_data.get('include_attendees', 0),
+            event_data.get('include_attendees'),
             event_data.get('number_of_rounds'),
             datetime.now(),
             event_id
@@ -163,6 +392,7 @@ class EventManager:
 
         conn.commit()
         conn.close()
+        self.db.changes.publish('event', event_id, UPDATED)
 
     def delete_event(self, event_id: int):
         """Soft delete an event (marks as deleted instead of removing)"""
@@ -175,6 +405,7 @@ class EventManager:
         ''', (event_id,))
         conn.commit()
         conn.close()
+        self.db.changes.publish('event', event_id, DELETED)
 
     def get_deleted_events(self) -> List[Dict[str, Any]]:
         """Get all deleted events"""
@@ -182,25 +413,14 @@ class EventManager:
         cursor = conn.cursor()
 
         cursor.execute('''
-            SELECT
-                e.*,
-                et.name as event_type_name,
-                pf.name as format_name,
-                pm.name as pairing_method_name,
-                pa.name as pairing_app_name,
-                temp.name as template_name
+            SELECT e.*
             FROM events e
-            LEFT JOIN event_types et ON e.event_type_id = et.id
-            LEFT JOIN playing_formats pf ON e.playing_format_id = pf.id
-            LEFT JOIN pairing_methods pm ON e.pairing_method_id = pm.id
-            LEFT JOIN pairing_apps pa ON e.pairing_app_id = pa.id
-            LEFT JOIN event_templates temp ON e.template_id = temp.id
             WHERE e.is_deleted = 1
             ORDER BY e.deleted_at DESC
         ''')
         events = [dict(row) for row in cursor.fetchall()]
         conn.close()
-        return events
+        return self.attach_reference_names(events)
 
     def restore_event(self, event_id: int):
         """Restore a deleted event"""
@@ -213,6 +433,8 @@ class EventManager:
         ''', (event_id,))
         conn.commit()
         conn.close()
+        # Back in the events list, so it's new as far as open views are concerned
+        self.db.changes.publish('event', event_id, CREATED)
 
     def permanently_delete_event(self, event_id: int):
         """Permanently delete an event and all related data"""
@@ -221,40 +443,42 @@ class EventManager:
         cursor.execute('DELETE FROM events WHERE id = ?', (event_id,))
         conn.commit()
         conn.close()
+        self.db.changes.publish('event', event_id, DELETED)
 
     def create_event_from_template(self, template_id: int, event_date: str, event_name: str = None) -> int:
-        """Create a new event from a template"""
-        template = self.get_template_by_id(template_id)
-        if not template:
-            raise ValueError(f"Template {template_id} not found")
-
-        # Get template feedback notes to add to new event
-        feedback_notes = self.get_template_feedback(template_id)
-
-        event_data = {
-            'template_id': template_id,
-            'event_name': event_name or template['name'],
-            'event_date': event_date,
-            'event_type_id': template['event_type_id'],
-            'playing_format_id': template['playing_format_id'],
-            'pairing_method_id': template['pairing_method_id'],
-            'pairing_app_id': template['pairing_app_id'],
-            'max_capacity': template['max_capacity'],
-            'description': template['description']
-        }
-
-        event_id = self.create_event(event_data)
-
-        # Copy template data to event
-        self.copy_template_checklist(template_id, event_id)
-        self.copy_template_ticket_tiers(template_id, event_id)
-        self.copy_template_prize_items(template_id, event_id)
-        self.copy_template_notes(template_id, event_id)
-
-        # Add feedback notes from previous events
-        for feedback in feedback_notes:
-            self.add_event_note(event_id, f"Previous feedback: {feedback['feedback_text']}", include_in_printout=True)
-
+        """Create a new event from a template
+
+        The event and everything copied from the template (checklist, ticket
+        tiers, prizes, notes and previous feedback) are written in a single
+        transaction, so either all of it is created or none of it is.
+        """
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM event_templates WHERE id = ?', (template_id,))
+            template = cursor.fetchone()
+            if not template:
+                raise ValueError(f"Template {template_id} not found")
+
+            event_data = {
+                'template_id': template_id,
+                'event_name': event_name or template['name'],
+                'event_date': event_date,
+                'event_type_id': template['event_type_id'],
+                'playing_format_id': template['playing_format_id'],
+                'pairing_method_id': template['pairing_method_id'],
+                'pairing_app_id': template['pairing_app_id'],
+                'max_capacity': template['max_capacity'],
+                'description': template['description']
+            }
+
+            event_id = self._insert_event(cursor, event_data)
+
+            # Copy template data to event
+            self.copy_template_data(cursor, template_id, [event_id])
+
+        with self.db.changes.batch() as changes:
+            changes.publish('event', event_id, CREATED)
+            changes.publish('template', template_id, UPDATED)  # its event count changed
         return event_id
 
     def get_template_by_id(self, template_id: int) -> Optional[Dict[str, Any]]:
@@ -266,98 +490,71 @@ class EventManager:
         conn.close()
         return dict(result) if result else None
 
-    def copy_template_checklist(self, template_id: int, event_id: int):
-        """Copy checklist items from template to event"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT * FROM template_checklist_items
+    def copy_template_data(self, cursor, template_id: int, event_ids: List[int]):
+        """Copy everything a template carries onto one or more new events (no commit)"""
+        self.copy_template_checklist(cursor, template_id, event_ids)
+        self.copy_template_ticket_tiers(cursor, template_id, event_ids)
+        self.copy_template_prize_items(cursor, template_id, event_ids)
+        self.copy_template_notes(cursor, template_id, event_ids)
+        self.copy_template_feedback(cursor, template_id, event_ids)
+
+    def copy_template_checklist(self, cursor, template_id: int, event_ids: List[int]):
+        """Copy checklist items from template to events (on the caller's cursor)"""
+        cursor.executemany('''
+            INSERT INTO event_checklist_items (
+                event_id, category_id, description, sort_order, include_in_pdf, show_on_dashboard
+            )
+            SELECT ?, category_id, description, sort_order, include_in_pdf, show_on_dashboard
+            FROM template_checklist_items
             WHERE template_id = ?
             ORDER BY sort_order
-        ''', (template_id,))
-
-        template_items = [dict(row) for row in cursor.fetchall()]
-
-        for item in template_items:
-            cursor.execute('''
-                INSERT INTO event_checklist_items (
-                    event_id, category_id, description, sort_order, include_in_pdf, show_on_dashboard
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (event_id, item['category_id'], item['description'], item['sort_order'],
-                  item.get('include_in_pdf', 1), item.get('show_on_dashboard', 0)))
-
-        conn.commit()
-        conn.close()
-
-    def copy_template_ticket_tiers(self, template_id: int, event_id: int):
-        """Copy ticket tiers from template to event"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT * FROM template_ticket_tiers
+        ''', [(event_id, template_id) for event_id in event_ids])
+
+    def copy_template_ticket_tiers(self, cursor, template_id: int, event_ids: List[int]):
+        """Copy ticket tiers from template to events (on the caller's cursor)"""
+        cursor.executemany('''
+            INSERT INTO ticket_tiers (
+                event_id, tier_name, price, quantity_available, quantity_sold
+            )
+            SELECT ?, tier_name, price, quantity_available, 0
+            FROM template_ticket_tiers
             WHERE template_id = ?
             ORDER BY price
-        ''', (template_id,))
-
-        template_tickets = [dict(row) for row in cursor.fetchall()]
-
-        for ticket in template_tickets:
-            cursor.execute('''
-                INSERT INTO ticket_tiers (
-                    event_id, tier_name, price, quantity_available, quantity_sold
-                ) VALUES (?, ?, ?, ?, 0)
-            ''', (event_id, ticket['tier_name'], ticket['price'], ticket.get('quantity_available')))
-
-        conn.commit()
-        conn.close()
-
-    def copy_template_prize_items(self, template_id: int, event_id: int):
-        """Copy prize items from template to event"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT * FROM template_prize_items
+        ''', [(event_id, template_id) for event_id in event_ids])
+
+    def copy_template_prize_items(self, cursor, template_id: int, event_ids: List[int]):
+        """Copy prize items from template to events (on the caller's cursor)"""
+        cursor.executemany('''
+            INSERT INTO prize_items (
+                event_id, description, quantity, cost_per_item, total_cost, supplier, is_received, recipients, quantity_handed_out
+            )
+            SELECT ?, description, quantity, cost_per_item, total_cost, supplier, 0, 0, 0
+            FROM template_prize_items
             WHERE template_id = ?
             ORDER BY created_at
-        ''', (template_id,))
-
-        template_prizes = [dict(row) for row in cursor.fetchall()]
-
-        for prize in template_prizes:
-            cursor.execute('''
-                INSERT INTO prize_items (
-                    event_id, description, quantity, cost_per_item, total_cost, supplier, is_received, recipients, quantity_handed_out
-                ) VALUES (?, ?, ?, ?, ?, ?, 0, 0, 0)
-            ''', (event_id, prize['description'], prize.get('quantity'), prize.get('cost_per_item'), prize.get('total_cost'), prize.get('supplier')))
-
-        conn.commit()
-        conn.close()
-
-    def copy_template_notes(self, template_id: int, event_id: int):
-        """Copy notes from template to event"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT * FROM template_notes
+        ''', [(event_id, template_id) for event_id in event_ids])
+
+    def copy_template_notes(self, cursor, template_id: int, event_ids: List[int]):
+        """Copy notes from template to events (on the caller's cursor)"""
+        cursor.executemany('''
+            INSERT INTO event_notes (
+                event_id, note_text, include_in_printout, send_to_template
+            )
+            SELECT ?, note_text, include_in_printout, 0
+            FROM template_notes
             WHERE template_id = ?
             ORDER BY created_at DESC
-        ''', (template_id,))
-
-        template_notes = [dict(row) for row in cursor.fetchall()]
-
-        for note in template_notes:
-            cursor.execute('''
-                INSERT INTO event_notes (
-                    event_id, note_text, include_in_printout, send_to_template
-                ) VALUES (?, ?, ?, 0)
-            ''', (event_id, note['note_text'], note.get('include_in_printout', 0)))
+        ''', [(event_id, template_id) for event_id in event_ids])
 
-        conn.commit()
-        conn.close()
+    def copy_template_feedback(self, cursor, template_id: int, event_ids: List[int]):
+        """Add feedback from previous events as printable notes on events (on the caller's cursor)"""
+        cursor.executemany('''
+            INSERT INTO event_notes (event_id, note_text, include_in_printout)
+            SELECT ?, 'Previous feedback: ' || feedback_text, 1
+            FROM template_feedback
+            WHERE template_id = ?
+            ORDER BY created_at DESC
+        ''', [(event_id, template_id) for event_id in event_ids])
 
     def get_template_feedback(self, template_id: int) -> List[Dict[str, Any]]:
         """Get feedback notes from previous events using this template"""
@@ -382,36 +579,17 @@ class EventManager:
         ''', (event_id, note_text, include_in_printout))
         conn.commit()
         conn.close()
+        self.db.changes.publish('event', event_id, UPDATED)
 
     def get_reference_data(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Get all reference data for dropdowns"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        data = {}
-
-        # Event types
-        cursor.execute('SELECT * FROM event_types ORDER BY name')
-        data['event_types'] = [dict(row) for row in cursor.fetchall()]
-
-        # Playing formats
-        cursor.execute('SELECT * FROM playing_formats ORDER BY name')
-        data['playing_formats'] = [dict(row) for row in cursor.fetchall()]
-
-        # Pairing methods
-        cursor.execute('SELECT * FROM pairing_methods ORDER BY name')
-        data['pairing_methods'] = [dict(row) for row in cursor.fetchall()]
-
-        # Pairing apps
-        cursor.execute('SELECT * FROM pairing_apps ORDER BY name')
-        data['pairing_apps'] = [dict(row) for row in cursor.fetchall()]
-
-        # Templates
-        cursor.execute('SELECT * FROM event_templates ORDER BY name')
-        data['templates'] = [dict(row) for row in cursor.fetchall()]
-
-        conn.close()
-        return data
+        """Get all reference data for dropdowns (served from the reference data cache)"""
+        return {
+            'event_types': self.db.get_reference_rows('event_types'),
+            'playing_formats': self.db.get_reference_rows('playing_formats'),
+            'pairing_methods': self.db.get_reference_rows('pairing_methods'),
+            'pairing_apps': self.db.get_reference_rows('pairing_apps'),
+            'templates': self.db.get_reference_rows('event_templates')
+        }
 
     def calculate_labour_cost(self, event_id: int, staff_count: int = 1) -> float:
         """Calculate labour cost based on event timing and award rates"""
@@ -437,14 +615,14 @@ class EventManager:
 
         # Get appropriate rate
         if day_of_week == 6:  # Sunday
-            rate = float(self.db.get_setting('sunday_rate') or 35.0)
+            rate = self.db.get_setting_float('sunday_rate', 35.0)
         elif day_of_week == 5:  # Saturday
-            rate = float(self.db.get_setting('saturday_rate') or 30.0)
+            rate = self.db.get_setting_float('saturday_rate', 30.0)
         else:  # Weekday - check if after 6pm
             if start.hour >= 18:
-                rate = float(self.db.get_setting('weekday_after_6pm_rate') or 25.5)
+                rate = self.db.get_setting_float('weekday_after_6pm_rate', 25.5)
             else:
-                rate = float(self.db.get_setting('weekday_after_6pm_rate') or 25.5)  # Default to same rate
+                rate = self.db.get_setting_float('weekday_after_6pm_rate', 25.5)  # Default to same rate
 
         total_cost = hours_worked * rate * staff_count
 
@@ -536,17 +714,19 @@ class EventManager:
         conn.commit()
         conn.close()
 
-    def get_total_labour_cost(self, event_id: int) -> float:
-        """Calculate total labour cost for an event from all entries"""
+    def get_event_financials(self, event_id: int) -> Dict[str, Any]:
+        """Ticket revenue, costs and profit for an event (see summarise_financials)
+
+        Read from the event_financials row that triggers keep current.
+        """
         conn = self.db.get_connection()
         cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT SUM(total_cost) as total FROM labour_costs
-            WHERE event_id = ?
-        ''', (event_id,))
-
+        cursor.execute(EVENT_CHILD_QUERIES['financials'], (event_id,))
         result = cursor.fetchone()
         conn.close()
 
-        return result['total'] if result and result['total'] else 0.0
+        return summarise_financials(dict(result) if result else None)
+
+    def get_total_labour_cost(self, event_id: int) -> float:
+        """Total labour cost for an event from all entries"""
+        return float(self.get_event_financials(event_id)['labour_cost'])
@@ -1,32 +1,34 @@
+from startup_trace import QUIT_FLAG, get_tracer
+tracer = get_tracer()  # Created first so its clock includes the imports below
+
 import customtkinter as ctk
 from database import Database
-from views.events_view import EventsView
-from views.templates_view import TemplatesView
-from views.settings_view import SettingsView
-from views.help_view import HelpView
-from views.analysis_view import AnalysisView
-from views.feature_requests_view import FeatureRequestsView
-from views.deleted_events_view import DeletedEventsView
-from views.table_booking_view import TableBookingView
 from utils.text_selection import setup_global_text_selection
 from utils.navigation import NavigationManager
+from utils.view_cache import ViewCache
+from deadline_scheduler import DeadlineScheduler
+from views.dashboard_view import DashboardView
 import sys
 import os
-import shutil
 from datetime import datetime
 from pathlib import Path
 
+tracer.mark("imports done")
+
 class BGEventsApp(ctk.CTk):
     """Main application window for TT Events Manager"""
 
     def __init__(self):
-        super().__init__()
+        with tracer.phase("window"):
+            super().__init__()
 
         # Initialize database
-        self.db = Database()
+        with tracer.phase("database"):
+            self.db = Database()
 
         # Perform automatic daily backup
-        self.perform_automatic_backup()
+        with tracer.phase("automatic backup"):
+            self.perform_automatic_backup()
 
         # Configure window
         self.title("TT Events Manager")
@@ -51,7 +53,14 @@ class BGEventsApp(ctk.CTk):
         self.grid_columnconfigure(1, weight=1)
 
         # Create sidebar
-        self.create_sidebar()
+        with tracer.phase("sidebar"):
+            self.create_sidebar()
+
+        # Dashboard alerts, kept current as deadlines pass and events change
+        with tracer.phase("deadlines"):
+            self.deadlines = DeadlineScheduler(self.db, self)
+            self.deadlines.subscribe(self.update_dashboard_badge)
+            self.update_dashboard_badge()
 
         # Create main content area
         self.main_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="#F5F0F6")
@@ -60,14 +69,30 @@ class BGEventsApp(ctk.CTk):
         # Initialize navigation manager
         self.navigation_manager = NavigationManager(self.main_frame)
 
+        # Sidebar views are kept alive and only reloaded when the data has changed
+        self.view_cache = ViewCache(self.main_frame, lambda: self.db.data_version)
+
         # Set up keyboard shortcuts
         self.setup_keyboard_shortcuts()
 
         # Enable text selection and copying throughout the app
-        setup_global_text_selection(self)
+        with tracer.phase("text selection"):
+            setup_global_text_selection(self)
 
         # Show dashboard by default
-        self.show_dashboard()
+        with tracer.phase("dashboard"):
+            self.show_dashboard()
+
+        if tracer.enabled:
+            self.after_idle(self.finish_startup_trace)
+
+    def finish_startup_trace(self):
+        """Record the first paint of the dashboard and write the startup trace"""
+        self.update_idletasks()
+        tracer.mark("dashboard painted")
+        tracer.write_log()
+        if QUIT_FLAG in sys.argv:
+            self.after(0, self.destroy)
 
     def create_sidebar(self):
         """Create the navigation sidebar"""
@@ -95,6 +120,18 @@ class BGEventsApp(ctk.CTk):
         )
         self.btn_dashboard.grid(row=1, column=0, padx=20, pady=10, sticky="ew")
 
+        # Count of alerts needing attention, over the right end of the button
+        self.dashboard_badge = ctk.CTkLabel(
+            self.sidebar,
+            text="",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            fg_color="#E57373",
+            text_color="white",
+            corner_radius=10,
+            width=24,
+            height=20
+        )
+
         self.btn_events = ctk.CTkButton(
             self.sidebar,
             text="Events",
@@ -215,320 +252,36 @@ class BGEventsApp(ctk.CTk):
         self.credit_label.grid(row=13, column=0, padx=20, pady=(5, 20))
 
     def clear_main_frame(self):
-        """Clear all widgets from main frame"""
-        # Clear navigation stack when switching main views
+        """Close any navigation sub-views before switching main views"""
+        # Sub-views pushed by the calendar etc. aren't cached; the root of the stack is
         if hasattr(self, 'navigation_manager'):
+            for view, _, _ in self.navigation_manager.view_stack[1:]:
+                view.destroy()
             self.navigation_manager.view_stack.clear()
             self.navigation_manager.current_view = None
 
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+    def show_view(self, name, create_view):
+        """Show a cached main view, creating it with create_view() the first time"""
+        self.clear_main_frame()
+        return self.view_cache.show(name, create_view)
 
     def show_dashboard(self):
         """Display the dashboard view"""
-        self.clear_main_frame()
-
-        # Title
-        title = ctk.CTkLabel(
-            self.main_frame,
-            text="Dashboard",
-            font=ctk.CTkFont(size=32, weight="bold"),
-            text_color="#8B5FBF"
-        )
-        title.pack(pady=30, padx=30, anchor="w")
-
-        # Get checklist items marked as show_on_dashboard
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT
-                ci.id,
-                ci.description,
-                ci.is_completed,
-                e.event_name,
-                e.event_date,
-                e.id as event_id
-            FROM event_checklist_items ci
-            JOIN events e ON ci.event_id = e.id
-            WHERE ci.show_on_dashboard = 1
-            AND e.is_deleted = 0
-            AND e.is_completed = 0
-            ORDER BY
-                ci.is_completed ASC,
-                e.event_date ASC
-        ''')
-
-        dashboard_items = [dict(row) for row in cursor.fetchall()]
-
-        # Get events with unreceived materials/prize support (exclude deleted)
-        cursor.execute('''
-            SELECT DISTINCT
-                e.id,
-                e.event_name,
-                e.event_date,
-                COUNT(p.id) as unreceived_count
-            FROM events e
-            JOIN prize_items p ON e.id = p.event_id
-            WHERE p.is_received = 0
-            AND e.is_completed = 0
-            AND e.is_deleted = 0
-            AND e.event_date >= date('now')
-            GROUP BY e.id, e.event_name, e.event_date
-            ORDER BY e.event_date ASC
-        ''')
-
-        unreceived_prizes = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-
-        # Check if we have anything to display
-        has_content = bool(dashboard_items or unreceived_prizes)
-
-        if has_content:
-            # Scrollable frame for all dashboard items
-            scroll = ctk.CTkScrollableFrame(self.main_frame, fg_color="white")
-            scroll.pack(fill="both", expand=True, padx=30, pady=(0, 30))
-
-        # Display unreceived items section first (higher priority)
-        if unreceived_prizes:
-            # Section header
-            ctk.CTkLabel(
-                scroll,
-                text="Materials & Prizes Not Received",
-                font=ctk.CTkFont(size=20, weight="bold"),
-                text_color="#E57373"
-            ).pack(pady=(10, 15), padx=10, anchor="w")
-
-            from datetime import datetime, date
-
-            for prize_item in unreceived_prizes:
-                # Determine urgency based on event date
-                event_date = datetime.strptime(prize_item['event_date'], '%Y-%m-%d').date()
-                today = date.today()
-                days_until = (event_date - today).days
-
-                if days_until < 0:
-                    bg_color = "#FFEBEE"  # Light red for past events
-                    border_color = "#E57373"
-                    urgency_text = f"EVENT PASSED {abs(days_until)} day(s) ago"
-                elif days_until == 0:
-                    bg_color = "#FFEBEE"  # Light red for today
-                    border_color = "#E57373"
-                    urgency_text = "EVENT IS TODAY"
-                elif days_until <= 7:
-                    bg_color = "#FFF3E0"  # Light orange for soon
-                    border_color = "#FFB74D"
-                    urgency_text = f"Event in {days_until} day(s)"
-                else:
-                    bg_color = "#FFF9C4"  # Light yellow for future
-                    border_color = "#FFD54F"
-                    urgency_text = f"Event in {days_until} days"
-
-                # Create card
-                card = ctk.CTkFrame(scroll, fg_color=bg_color, border_width=2, border_color=border_color)
-                card.pack(fill="x", padx=10, pady=5)
-
-                # Make card clickable
-                event_id = prize_item['id']
-                card.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                card.configure(cursor="hand2")
-
-                content = ctk.CTkFrame(card, fg_color="transparent")
-                content.pack(fill="x", padx=15, pady=12)
-
-                # Make content frame also clickable
-                content.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                content.configure(cursor="hand2")
-
-                # Left side - info
-                left_content = ctk.CTkFrame(content, fg_color="transparent")
-                left_content.pack(side="left", fill="both", expand=True)
-                left_content.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                left_content.configure(cursor="hand2")
-
-                # Event name
-                event_label = ctk.CTkLabel(
-                    left_content,
-                    text=prize_item['event_name'],
-                    font=ctk.CTkFont(size=15, weight="bold"),
-                    text_color="#8B5FBF",
-                    anchor="w"
-                )
-                event_label.pack(anchor="w")
-                event_label.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                event_label.configure(cursor="hand2")
-
-                # Materials/Prize support message
-                msg_label = ctk.CTkLabel(
-                    left_content,
-                    text=f"{prize_item['unreceived_count']} item(s) not yet received from supplier",
-                    font=ctk.CTkFont(size=15),
-                    text_color="#4A2D5E",
-                    anchor="w"
-                )
-                msg_label.pack(anchor="w", pady=(3, 0))
-                msg_label.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                msg_label.configure(cursor="hand2")
-
-                # Urgency and event date
-                formatted_date = event_date.strftime('%A, %d %B %Y')
-                info_text = f"{urgency_text} - {formatted_date}"
-
-                info_label = ctk.CTkLabel(
-                    left_content,
-                    text=info_text,
-                    font=ctk.CTkFont(size=15),
-                    text_color="#666666",
-                    anchor="w"
-                )
-                info_label.pack(anchor="w", pady=(3, 0))
-                info_label.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                info_label.configure(cursor="hand2")
-
-                # Right side - button
-                right_content = ctk.CTkFrame(content, fg_color="transparent")
-                right_content.pack(side="right", padx=(10, 0))
-
-                ctk.CTkButton(
-                    right_content,
-                    text="View/Edit Event",
-                    command=lambda eid=event_id: self.open_event_from_dashboard(eid),
-                    fg_color="#8B5FBF",
-                    hover_color="#7A4FB0",
-                    text_color="white",
-                    width=120,
-                    height=32
-                ).pack()
-
-        if dashboard_items:
-            # Section header
-            ctk.CTkLabel(
-                scroll,
-                text="Important Checklist Items",
-                font=ctk.CTkFont(size=20, weight="bold"),
-                text_color="#4A2D5E"
-            ).pack(pady=(20, 15), padx=10, anchor="w")
-
-            from datetime import datetime, date
-
-            for item in dashboard_items:
-                # Determine urgency and color
-                if item['is_completed']:
-                    bg_color = "#E8F5E9"  # Light green for completed
-                    border_color = "#81C784"
-                    urgency_text = "Completed"
-                elif item['event_date']:
-                    event_date = datetime.strptime(item['event_date'], '%Y-%m-%d').date()
-                    today = date.today()
-                    days_until = (event_date - today).days
-
-                    if days_until < 0:
-                        bg_color = "#FFEBEE"  # Light red for overdue
-                        border_color = "#E57373"
-                        urgency_text = f"OVERDUE by {abs(days_until)} day(s)"
-                    elif days_until == 0:
-                        bg_color = "#FFF3E0"  # Light orange for today
-                        border_color = "#FFB74D"
-                        urgency_text = "DUE TODAY"
-                    elif days_until <= 7:
-                        bg_color = "#FFF9C4"  # Light yellow for soon
-                        border_color = "#FFD54F"
-                        urgency_text = f"Due in {days_until} day(s)"
-                    else:
-                        bg_color = "#F5F5F5"  # Light gray for future
-                        border_color = "#BDBDBD"
-                        urgency_text = f"Due in {days_until} days"
-                else:
-                    bg_color = "#F5F5F5"
-                    border_color = "#BDBDBD"
-                    urgency_text = "No due date"
-
-                # Create card for each item (clickable)
-                card = ctk.CTkFrame(scroll, fg_color=bg_color, border_width=2, border_color=border_color)
-                card.pack(fill="x", padx=10, pady=5)
-
-                # Make card clickable
-                event_id = item['event_id']
-                card.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                card.configure(cursor="hand2")
-
-                content = ctk.CTkFrame(card, fg_color="transparent")
-                content.pack(fill="x", padx=15, pady=12)
-
-                # Make content frame also clickable
-                content.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                content.configure(cursor="hand2")
-
-                # Left side - info
-                left_content = ctk.CTkFrame(content, fg_color="transparent")
-                left_content.pack(side="left", fill="both", expand=True)
-                left_content.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                left_content.configure(cursor="hand2")
-
-                # Event name
-                event_label = ctk.CTkLabel(
-                    left_content,
-                    text=item['event_name'],
-                    font=ctk.CTkFont(size=15, weight="bold"),
-                    text_color="#8B5FBF",
-                    anchor="w"
-                )
-                event_label.pack(anchor="w")
-                event_label.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                event_label.configure(cursor="hand2")
-
-                # Checklist item description
-                desc_label = ctk.CTkLabel(
-                    left_content,
-                    text=item['description'],
-                    font=ctk.CTkFont(size=15),
-                    text_color="#4A2D5E",
-                    anchor="w"
-                )
-                desc_label.pack(anchor="w", pady=(3, 0))
-                desc_label.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                desc_label.configure(cursor="hand2")
-
-                # Urgency and event date
-                info_text = f"{urgency_text}"
-                if item['event_date']:
-                    formatted_date = datetime.strptime(item['event_date'], '%Y-%m-%d').strftime('%A, %d %B %Y')
-                    info_text += f" - {formatted_date}"
-
-                info_label = ctk.CTkLabel(
-                    left_content,
-                    text=info_text,
-                    font=ctk.CTkFont(size=15),
-                    text_color="#666666",
-                    anchor="w"
-                )
-                info_label.pack(anchor="w", pady=(3, 0))
-                info_label.bind("<Button-1>", lambda e, eid=event_id: self.open_event_from_dashboard(eid))
-                info_label.configure(cursor="hand2")
-
-                # Right side - button
-                right_content = ctk.CTkFrame(content, fg_color="transparent")
-                right_content.pack(side="right", padx=(10, 0))
-
-                ctk.CTkButton(
-                    right_content,
-                    text="View/Edit Event",
-                    command=lambda eid=event_id: self.open_event_from_dashboard(eid),
-                    fg_color="#8B5FBF",
-                    hover_color="#7A4FB0",
-                    text_color="white",
-                    width=120,
-                    height=32
-                ).pack()
-
-        # Show message if nothing to display
-        if not has_content:
-            ctk.CTkLabel(
-                self.main_frame,
-                text="No important items to display.\n\nMark checklist items as 'Show on Dashboard' to see them here.\nPrizes not yet received from suppliers will also appear here.",
-                font=ctk.CTkFont(size=15),
-                text_color="#999999"
-            ).pack(pady=40, padx=30)
+        self.show_view('dashboard', self.create_dashboard)
+
+    def create_dashboard(self):
+        """Build the dashboard frame"""
+        return DashboardView(self.main_frame, self.db, self.deadlines,
+                             on_open_event=self.open_event_from_dashboard, fg_color="#F5F0F6")
+
+    def update_dashboard_badge(self):
+        """Show how many dashboard alerts need attention on the sidebar button"""
+        count = self.deadlines.badge_count
+        if count:
+            self.dashboard_badge.configure(text=str(count) if count < 100 else "99+")
+            self.dashboard_badge.grid(row=1, column=0, padx=(0, 28), sticky="e")
+        else:
+            self.dashboard_badge.grid_remove()
 
     def open_event_from_dashboard(self, event_id):
         """Open event details dialog from dashboard"""
@@ -540,85 +293,57 @@ class BGEventsApp(ctk.CTk):
 
     def show_events(self):
         """Display the events view"""
-        self.clear_main_frame()
-
-        # Create and display events view
-        events_view = EventsView(self.main_frame, self.db, fg_color="#F5F0F6")
-        events_view.pack(fill="both", expand=True)
+        from views.events_view import EventsView
+        self.show_view('events', lambda: EventsView(self.main_frame, self.db, fg_color="#F5F0F6"))
 
     def show_templates(self):
         """Display the templates view"""
-        self.clear_main_frame()
-
-        # Create and display templates view
-        templates_view = TemplatesView(self.main_frame, self.db, fg_color="#F5F0F6")
-        templates_view.pack(fill="both", expand=True)
+        from views.templates_view import TemplatesView
+        self.show_view('templates', lambda: TemplatesView(self.main_frame, self.db, fg_color="#F5F0F6"))
 
     def show_analysis(self):
         """Display the analysis view"""
-        self.clear_main_frame()
-
-        # Create and display analysis view
-        analysis_view = AnalysisView(self.main_frame, self.db, fg_color="#F5F0F6")
-        analysis_view.pack(fill="both", expand=True)
+        from views.analysis_view import AnalysisView
+        self.show_view('analysis', lambda: AnalysisView(self.main_frame, self.db, fg_color="#F5F0F6"))
 
     def show_table_booking(self):
         """Display the table booking view"""
-        self.clear_main_frame()
-
-        # Create and display table booking view
-        table_booking_view = TableBookingView(self.main_frame, self.db, navigation_manager=self.navigation_manager, fg_color="#F5F0F6")
-        table_booking_view.pack(fill="both", expand=True)
+        from views.table_booking_view import TableBookingView
+        self.show_view('table_booking', lambda: TableBookingView(
+            self.main_frame, self.db, navigation_manager=self.navigation_manager, fg_color="#F5F0F6"))
 
     def show_settings(self):
         """Display the settings view"""
-        self.clear_main_frame()
-
-        # Create and display settings view
-        settings_view = SettingsView(self.main_frame, self.db, fg_color="#F5F0F6")
-        settings_view.pack(fill="both", expand=True)
+        from views.settings_view import SettingsView
+        self.show_view('settings', lambda: SettingsView(self.main_frame, self.db, fg_color="#F5F0F6"))
 
     def show_help(self):
         """Display the help view"""
-        self.clear_main_frame()
-
-        # Create and display help view
-        help_view = HelpView(self.main_frame, self.db, fg_color="#F5F0F6")
-        help_view.pack(fill="both", expand=True)
+        from views.help_view import HelpView
+        self.show_view('help', lambda: HelpView(self.main_frame, self.db, fg_color="#F5F0F6"))
 
     def show_feature_requests(self):
         """Display the feature requests view"""
-        self.clear_main_frame()
-
-        # Create and display feature requests view
-        feature_requests_view = FeatureRequestsView(self.main_frame, self.db, fg_color="#F5F0F6")
-        feature_requests_view.pack(fill="both", expand=True)
+        from views.feature_requests_view import FeatureRequestsView
+        self.show_view('feature_requests', lambda: FeatureRequestsView(self.main_frame, self.db, fg_color="#F5F0F6"))
 
     def show_feedback(self):
         """Display the feedback view"""
-        self.clear_main_frame()
-
         # Import here to avoid circular imports
         from views.feedback_view import FeedbackView
-        feedback_view = FeedbackView(self.main_frame, self.db, fg_color="#F5F0F6")
-        feedback_view.pack(fill="both", expand=True)
+        self.show_view('feedback', lambda: FeedbackView(self.main_frame, self.db, fg_color="#F5F0F6"))
 
     def show_deleted_events(self):
         """Display the deleted events view"""
-        self.clear_main_frame()
-
-        # Create and display deleted events view
-        deleted_events_view = DeletedEventsView(self.main_frame, self.db, fg_color="#F5F0F6")
-        deleted_events_view.pack(fill="both", expand=True)
+        from views.deleted_events_view import DeletedEventsView
+        self.show_view('deleted_events', lambda: DeletedEventsView(self.main_frame, self.db, fg_color="#F5F0F6"))
 
     def show_calendar(self):
         """Display the calendar view"""
-        self.clear_main_frame()
-
         # Import here to avoid circular imports
         from views.calendar_view import CalendarView
-        calendar_view = CalendarView(self.main_frame, self.db, navigation_manager=self.navigation_manager, fg_color="#F5F0F6")
-        calendar_view.pack(fill="both", expand=True)
+        calendar_view = self.show_view('calendar', lambda: CalendarView(
+            self.main_frame, self.db, navigation_manager=self.navigation_manager, fg_color="#F5F0F6"))
 
         # Set as root view in navigation stack
         self.navigation_manager.view_stack.append((calendar_view, "Calendar", {}))
@@ -662,28 +387,30 @@ class BGEventsApp(ctk.CTk):
 
     def _trigger_new_event(self):
         """Trigger new event dialog in events view"""
-        # Find the EventsView widget and call its method
-        for widget in self.main_frame.winfo_children():
-            if hasattr(widget, 'show_new_event_dialog'):
-                widget.show_new_event_dialog()
-                break
+        view = self.view_cache.current_view
+        if hasattr(view, 'show_new_event_dialog'):
+            view.show_new_event_dialog()
+
+    def get_active_view(self):
+        """The view the user is looking at (a navigation sub-view or a cached main view)"""
+        return self.navigation_manager.current_view or self.view_cache.current_view
 
     def save_current_view(self):
         """Save current view if it has a save method"""
-        for widget in self.main_frame.winfo_children():
-            if hasattr(widget, 'save'):
-                widget.save()
-                return
+        view = self.get_active_view()
+        if hasattr(view, 'save'):
+            view.save()
+            return
         # If no save method found, show message
         from tkinter import messagebox
         messagebox.showinfo("Save", "No active form to save")
 
     def print_current_view(self):
         """Print current view if it has a print method"""
-        for widget in self.main_frame.winfo_children():
-            if hasattr(widget, 'print_view'):
-                widget.print_view()
-                return
+        view = self.get_active_view()
+        if hasattr(view, 'print_view'):
+            view.print_view()
+            return
         # If no print method found, show message
         from tkinter import messagebox
         messagebox.showinfo("Print", "Current view does not support printing")
@@ -705,7 +432,7 @@ class BGEventsApp(ctk.CTk):
 
         if filename:
             try:
-                shutil.copy2("events.db", filename)
+                self.db.backup_to(filename)
                 messagebox.showinfo("Backup Complete", f"Database backed up to:\n{filename}")
             except Exception as e:
                 messagebox.showerror("Backup Failed", f"Failed to create backup:\n{str(e)}")
@@ -723,7 +450,7 @@ class BGEventsApp(ctk.CTk):
 
             if not today_backup.exists() and os.path.exists("events.db"):
                 # Create backup
-                shutil.copy2("events.db", today_backup)
+                self.db.backup_to(str(today_backup))
                 print(f"[AUTO-BACKUP] Created: {today_backup}")
 
                 # Clean up old backups (keep only last 7)
@@ -828,6 +555,7 @@ def main():
     """Main entry point"""
     app = BGEventsApp()
     app.mainloop()
+    app.db.close()
 
 
 if __name__ == "__main__":
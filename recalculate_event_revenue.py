@@ -1,20 +1,27 @@
 """Bulk recalculate revenue for all completed events"""
-import sqlite3
-from datetime import datetime
+from database import Database
+from event_manager import summarise_financials
 
 def recalculate_all_event_revenue():
     """Recalculate revenue, costs, and profit for all completed events"""
-    conn = sqlite3.connect('events.db')
-    conn.row_factory = sqlite3.Row
+    # Opening through Database applies pending migrations, so event_financials exists
+    db = Database('events.db')
+    conn = db.get_connection()
     cursor = conn.cursor()
 
-    # Get all completed events
-    cursor.execute('SELECT id, event_name FROM events WHERE is_completed = 1')
+    # Get all completed events with their financials (kept current by triggers)
+    cursor.execute('''
+        SELECT e.id, e.event_name, f.*
+        FROM events e
+        LEFT JOIN event_financials f ON f.event_id = e.id
+        WHERE e.is_completed = 1
+    ''')
     completed_events = cursor.fetchall()
 
     if not completed_events:
         print("No completed events found.")
         conn.close()
+        db.close()
         return
 
     print(f"Found {len(completed_events)} completed events to recalculate.\n")
@@ -26,36 +33,12 @@ def recalculate_all_event_revenue():
         event_id = event['id']
         event_name = event['event_name']
 
-        # Calculate revenue from ticket sales
-        cursor.execute('''
-            SELECT SUM(price * COALESCE(quantity_sold, 0)) as revenue
-            FROM ticket_tiers
-            WHERE event_id = ?
-        ''', (event_id,))
-        result = cursor.fetchone()
-        revenue = float(result['revenue']) if result and result['revenue'] else 0.0
-
-        # Calculate labour costs
-        cursor.execute('''
-            SELECT SUM(total_cost) as labour_cost
-            FROM labour_costs
-            WHERE event_id = ?
-        ''', (event_id,))
-        result = cursor.fetchone()
-        labour_cost = float(result['labour_cost']) if result and result['labour_cost'] else 0.0
-
-        # Calculate other costs
-        cursor.execute('''
-            SELECT SUM(amount) as other_costs
-            FROM event_costs
-            WHERE event_id = ?
-        ''', (event_id,))
-        result = cursor.fetchone()
-        other_costs = float(result['other_costs']) if result and result['other_costs'] else 0.0
-
-        # Calculate totals
-        total_cost = labour_cost + other_costs
-        profit_margin = revenue - total_cost
+        financials = summarise_financials(dict(event))
+        revenue = float(financials['ticket_revenue'])
+        labour_cost = float(financials['labour_cost'])
+        other_costs = float(financials['other_cost'])
+        total_cost = float(financials['cost_total'])
+        profit_margin = float(financials['profit'])
 
         # Check if event_analysis record exists
         cursor.execute('SELECT id FROM event_analysis WHERE event_id = ?', (event_id,))
@@ -95,6 +78,7 @@ def recalculate_all_event_revenue():
 
     conn.commit()
     conn.close()
+    db.close()
 
     print("=" * 60)
     print(f"[SUCCESS] Recalculation complete!")
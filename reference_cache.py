@@ -0,0 +1,84 @@
+"""Process-wide cache of the small lookup tables used by dropdowns"""
+import os
+import threading
+from typing import Any, Callable, Dict, List
+
+# Cached lookup tables and the column each is ordered by
+REFERENCE_TABLES = {
+    'event_types': 'name',
+    'playing_formats': 'name',
+    'pairing_methods': 'name',
+    'pairing_apps': 'name',
+    'event_templates': 'name',
+    'checklist_categories': 'sort_order',
+    'cost_categories': 'name',
+}
+
+
+class ReferenceDataCache:
+    """Versioned cache of the reference (lookup) tables
+
+    Each table is loaded on first use and kept until it is invalidated.
+    Every invalidation bumps the table's version and the overall version,
+    so views can tell whether what they displayed is stale.
+    """
+
+    def __init__(self):
+        self._rows: Dict[str, List[Dict[str, Any]]] = {}
+        self._name_maps: Dict[str, Dict[int, str]] = {}
+        self._table_versions: Dict[str, int] = {table: 0 for table in REFERENCE_TABLES}
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def get_rows(self, table: str, load: Callable[[str, str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Get a copy of a table's rows, loading them with load(table, order_by) if needed"""
+        if table not in REFERENCE_TABLES:
+            raise ValueError(f"{table} is not a cached reference table")
+
+        rows = self._rows.get(table)
+        if rows is None:
+            rows = load(table, REFERENCE_TABLES[table])
+            with self._lock:
+                self._rows[table] = rows
+                self._name_maps.pop(table, None)
+
+        # Copies, so callers can't modify the cached rows
+        return [dict(row) for row in rows]
+
+    def get_name_map(self, table: str, load: Callable[[str, str], List[Dict[str, Any]]]) -> Dict[int, str]:
+        """Get an {id: name} map for a table"""
+        name_map = self._name_maps.get(table)
+        if name_map is None:
+            self.get_rows(table, load)
+            name_map = {row['id']: row['name'] for row in self._rows[table]}
+            with self._lock:
+                self._name_maps[table] = name_map
+        return name_map
+
+    def get_table_version(self, table: str) -> int:
+        return self._table_versions.get(table, 0)
+
+    def invalidate(self, *tables: str):
+        """Drop the cached rows for the given tables (all tables if none given)"""
+        tables = tables or tuple(REFERENCE_TABLES)
+        with self._lock:
+            for table in tables:
+                if table not in REFERENCE_TABLES:
+                    continue
+                self._rows.pop(table, None)
+                self._name_maps.pop(table, None)
+                self._table_versions[table] += 1
+            self.version += 1
+
+
+_caches: Dict[str, ReferenceDataCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_reference_cache(db_path: str) -> ReferenceDataCache:
+    """Get the shared cache for a database file (one per file per process)"""
+    key = os.path.abspath(db_path)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = ReferenceDataCache()
+        return _caches[key]
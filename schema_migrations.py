@@ -0,0 +1,1124 @@
+"""Versioned schema migrations for the TT Events Manager database
+
+The schema version is stored in PRAGMA user_version. On startup
+Database.init_database reads it once; when it matches SCHEMA_VERSION no DDL or
+seeding runs at all. Otherwise every pending migration in MIGRATIONS is applied
+in order inside a single transaction and recorded in the schema_migrations
+table.
+
+To change the schema, append a new (version, description, function) entry to
+MIGRATIONS. Never edit a migration that has already shipped. Migrations must
+tolerate databases that were upgraded by hand with the old one-off scripts in
+migrations/, so use IF NOT EXISTS and add_column_if_missing().
+"""
+import sqlite3
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+# Managed indexes: (index name, table, column list and optional WHERE clause).
+# event_analysis.event_id is already covered by its UNIQUE constraint.
+MANAGED_INDEXES = [
+    # Events list (is_deleted/is_completed filter, ordered by date) and deleted events view
+    ('idx_events_status_date', 'events', '(is_deleted, is_completed, event_date)'),
+    ('idx_events_deleted_at', 'events', '(is_deleted, deleted_at)'),
+    ('idx_events_template', 'events', '(template_id)'),
+
+    # Per-event child tables
+    ('idx_ticket_tiers_event', 'ticket_tiers', '(event_id, price)'),
+    ('idx_event_checklist_items_event', 'event_checklist_items', '(event_id, is_completed, sort_order)'),
+    ('idx_event_checklist_items_dashboard', 'event_checklist_items', '(event_id) WHERE show_on_dashboard = 1'),
+    ('idx_prize_items_event', 'prize_items', '(event_id, is_received)'),
+    ('idx_labour_costs_event', 'labour_costs', '(event_id)'),
+    ('idx_event_costs_event', 'event_costs', '(event_id)'),
+    ('idx_event_notes_event', 'event_notes', '(event_id, created_at)'),
+    ('idx_event_players_event', 'event_players', '(event_id, sort_order)'),
+    ('idx_feedback_items_event', 'feedback_items', '(event_id)'),
+
+    # Per-template child tables
+    ('idx_template_checklist_items_template', 'template_checklist_items', '(template_id, sort_order)'),
+    ('idx_template_ticket_tiers_template', 'template_ticket_tiers', '(template_id, price)'),
+    ('idx_template_prize_items_template', 'template_prize_items', '(template_id)'),
+    ('idx_template_notes_template', 'template_notes', '(template_id)'),
+    ('idx_template_feedback_template', 'template_feedback', '(template_id)'),
+
+    # Calendar lookups by date
+    ('idx_calendar_entries_date', 'calendar_entries', '(entry_date)'),
+]
+
+
+def get_table_names(cursor) -> set:
+    """Get the names of all tables in the database"""
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def get_column_names(cursor, table_name: str) -> set:
+    """Get the column names of a table"""
+    cursor.execute(f'PRAGMA table_info({table_name})')
+    return {row[1] for row in cursor.fetchall()}
+
+
+def add_column_if_missing(cursor, table_name: str, column_name: str, definition: str):
+    """Add a column unless an earlier one-off script already added it"""
+    if column_name not in get_column_names(cursor, table_name):
+        cursor.execute(f'ALTER TABLE {table_name} ADD COLUMN {column_name} {definition}')
+
+
+def create_managed_indexes(cursor):
+    """Create the managed index set, skipping tables that don't exist yet"""
+    existing_tables = get_table_names(cursor)
+    for index_name, table_name, definition in MANAGED_INDEXES:
+        if table_name not in existing_tables:
+            continue
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}{definition}')
+
+
+def migration_001_base_schema(cursor):
+    """Core tables and default reference data"""
+    # Event types table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_types (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Playing formats table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS playing_formats (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Pairing methods table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS pairing_methods (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Pairing apps table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS pairing_apps (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Event templates table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_templates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            event_type_id INTEGER,
+            playing_format_id INTEGER,
+            pairing_method_id INTEGER,
+            pairing_app_id INTEGER,
+            max_capacity INTEGER,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_type_id) REFERENCES event_types(id),
+            FOREIGN KEY (playing_format_id) REFERENCES playing_formats(id),
+            FOREIGN KEY (pairing_method_id) REFERENCES pairing_methods(id),
+            FOREIGN KEY (pairing_app_id) REFERENCES pairing_apps(id)
+        )
+    ''')
+
+    # Events table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            template_id INTEGER,
+            event_name TEXT NOT NULL,
+            event_date DATE NOT NULL,
+            start_time TIME,
+            end_time TIME,
+            event_type_id INTEGER,
+            playing_format_id INTEGER,
+            pairing_method_id INTEGER,
+            pairing_app_id INTEGER,
+            max_capacity INTEGER,
+            tickets_available INTEGER,
+            description TEXT,
+            number_of_rounds INTEGER,
+            tables_booked INTEGER DEFAULT 0,
+            include_attendees INTEGER DEFAULT 0,
+            is_organised BOOLEAN DEFAULT 0,
+            tickets_live BOOLEAN DEFAULT 0,
+            is_advertised BOOLEAN DEFAULT 0,
+            is_completed BOOLEAN DEFAULT 0,
+            is_cancelled BOOLEAN DEFAULT 0,
+            is_deleted BOOLEAN DEFAULT 0,
+            deleted_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (template_id) REFERENCES event_templates(id),
+            FOREIGN KEY (event_type_id) REFERENCES event_types(id),
+            FOREIGN KEY (playing_format_id) REFERENCES playing_formats(id),
+            FOREIGN KEY (pairing_method_id) REFERENCES pairing_methods(id),
+            FOREIGN KEY (pairing_app_id) REFERENCES pairing_apps(id)
+        )
+    ''')
+
+    # Ticket tiers table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ticket_tiers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            tier_name TEXT NOT NULL,
+            price DECIMAL(10,2) NOT NULL,
+            quantity_available INTEGER NOT NULL,
+            quantity_sold INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Checklist categories table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS checklist_categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            sort_order INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Template checklist items table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS template_checklist_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            template_id INTEGER NOT NULL,
+            category_id INTEGER,
+            description TEXT NOT NULL,
+            sort_order INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (template_id) REFERENCES event_templates(id) ON DELETE CASCADE,
+            FOREIGN KEY (category_id) REFERENCES checklist_categories(id)
+        )
+    ''')
+
+    # Event checklist items table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_checklist_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            category_id INTEGER,
+            description TEXT NOT NULL,
+            is_completed BOOLEAN DEFAULT 0,
+            sort_order INTEGER DEFAULT 0,
+            show_on_dashboard BOOLEAN DEFAULT 0,
+            include_in_pdf BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE,
+            FOREIGN KEY (category_id) REFERENCES checklist_categories(id)
+        )
+    ''')
+
+    # Cost categories table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cost_categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Event costs table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_costs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            category_id INTEGER,
+            description TEXT NOT NULL,
+            amount DECIMAL(10,2) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE,
+            FOREIGN KEY (category_id) REFERENCES cost_categories(id)
+        )
+    ''')
+
+    # Labour costs table (calculated automatically)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS labour_costs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            staff_count INTEGER DEFAULT 1,
+            hours_worked DECIMAL(5,2),
+            hourly_rate DECIMAL(10,2),
+            total_cost DECIMAL(10,2),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Prize support items table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS prize_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            description TEXT NOT NULL,
+            quantity INTEGER DEFAULT 1,
+            cost_per_item DECIMAL(10,2),
+            total_cost DECIMAL(10,2),
+            is_received BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            recipients INTEGER DEFAULT 1,
+            quantity_handed_out INTEGER DEFAULT 0,
+            item_type TEXT DEFAULT 'prize',
+            quantity_per_player INTEGER,
+            supplier TEXT,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Event notes table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_notes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            note_text TEXT NOT NULL,
+            show_in_notes_tab BOOLEAN DEFAULT 0,
+            include_in_printout BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Template feedback notes table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS template_feedback (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            template_id INTEGER NOT NULL,
+            event_id INTEGER NOT NULL,
+            feedback_text TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (template_id) REFERENCES event_templates(id) ON DELETE CASCADE,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Post-event analysis table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_analysis (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL UNIQUE,
+            actual_attendance INTEGER,
+            attendee_satisfaction DECIMAL(3,1) CHECK(attendee_satisfaction >= 0 AND attendee_satisfaction <= 10),
+            satisfaction_loved_pct INTEGER CHECK(satisfaction_loved_pct >= 0 AND satisfaction_loved_pct <= 100),
+            satisfaction_liked_pct INTEGER CHECK(satisfaction_liked_pct >= 0 AND satisfaction_liked_pct <= 100),
+            satisfaction_disliked_pct INTEGER CHECK(satisfaction_disliked_pct >= 0 AND satisfaction_disliked_pct <= 100),
+            profit_margin DECIMAL(10,2),
+            revenue_total DECIMAL(10,2),
+            cost_total DECIMAL(10,2),
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Settings table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS settings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            setting_key TEXT NOT NULL UNIQUE,
+            setting_value TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Feature requests table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS feature_requests (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL,
+            priority TEXT DEFAULT 'Medium',
+            status TEXT DEFAULT 'Submitted',
+            submitted_by TEXT,
+            submitted_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Help content table (editable help sections)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS help_content (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            section_name TEXT NOT NULL UNIQUE,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            sort_order INTEGER DEFAULT 0,
+            current_version INTEGER DEFAULT 1,
+            last_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            modified_by TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Event type guides table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_type_guides (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_type_id INTEGER NOT NULL UNIQUE,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            current_version INTEGER DEFAULT 1,
+            last_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            modified_by TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_type_id) REFERENCES event_types(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Guide revisions table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS guide_revisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guide_id INTEGER NOT NULL,
+            version_number INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            change_notes TEXT,
+            modified_by TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (guide_id) REFERENCES event_type_guides(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Help content revisions table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS help_revisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            help_content_id INTEGER NOT NULL,
+            version_number INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            change_notes TEXT,
+            modified_by TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (help_content_id) REFERENCES help_content(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Calendar entries table (for manual entries like public holidays)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS calendar_entries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entry_date DATE NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            entry_type TEXT DEFAULT 'misc',
+            color TEXT DEFAULT '#90EE90',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Insert default checklist categories
+    default_categories = [
+        ('Before the Event', 1),
+        ('During the Event', 2),
+        ('After the Event', 3),
+        ('Other', 4)
+    ]
+
+    for category, order in default_categories:
+        cursor.execute('''
+            INSERT OR IGNORE INTO checklist_categories (name, sort_order)
+            VALUES (?, ?)
+        ''', (category, order))
+
+    # Only insert defaults if tables are empty (first-time setup)
+    # Check if event_types table is empty
+    cursor.execute('SELECT COUNT(*) as count FROM event_types')
+    if cursor.fetchone()['count'] == 0:
+        # Insert default cost categories
+        default_cost_categories = [
+            'Labour',
+            'Prize Support',
+            'Materials',
+            'Food & Drink',
+            'Other'
+        ]
+
+        for category in default_cost_categories:
+            cursor.execute('''
+                INSERT OR IGNORE INTO cost_categories (name)
+                VALUES (?)
+            ''', (category,))
+
+        # Insert default event types
+        default_event_types = [
+            'Magic: The Gathering',
+            'Lorcana',
+            'Riftbound',
+            'Other TCG',
+            'Board Game Night',
+            'Board Game Tournament',
+            'D&D Session',
+            'Warhammer 40k',
+            'Kill Team',
+            'Blood Bowl',
+            'Other Warhammer'
+        ]
+
+        for event_type in default_event_types:
+            cursor.execute('''
+                INSERT OR IGNORE INTO event_types (name)
+                VALUES (?)
+            ''', (event_type,))
+
+        # Insert default playing formats
+        default_formats = [
+            'Standard',
+            'Modern',
+            'Commander',
+            'Draft',
+            'Sealed',
+            'Pioneer',
+            'Legacy',
+            'Vintage',
+            'Pauper',
+            'Casual'
+        ]
+
+        for format_name in default_formats:
+            cursor.execute('''
+                INSERT OR IGNORE INTO playing_formats (name)
+                VALUES (?)
+            ''', (format_name,))
+
+        # Insert default pairing methods
+        default_pairing_methods = [
+            'Swiss',
+            'Single Elimination',
+            'Double Elimination',
+            'Round Robin',
+            'Pods',
+            'Free Play'
+        ]
+
+        for method in default_pairing_methods:
+            cursor.execute('''
+                INSERT OR IGNORE INTO pairing_methods (name)
+                VALUES (?)
+            ''', (method,))
+
+        # Insert default pairing apps
+        default_pairing_apps = [
+            'EventLink',
+            'Melee',
+            'Challonge',
+            'Companion App',
+            'Manual'
+        ]
+
+        for app in default_pairing_apps:
+            cursor.execute('''
+                INSERT OR IGNORE INTO pairing_apps (name)
+                VALUES (?)
+            ''', (app,))
+
+    # Insert default help content sections
+    default_help_sections = [
+        ('getting_started', 'Getting Started', '''
+<h1>Welcome to TT Events Manager</h1>
+
+<p>TT Events Manager is a comprehensive event management system designed specifically for tabletop gaming stores and event organizers.</p>
+
+<h2>Quick Start Guide</h2>
+
+<ol>
+<li><b>Create Event Templates</b> - Set up reusable templates for your regular events</li>
+<li><b>Schedule Events</b> - Use templates or create custom events</li>
+<li><b>Manage Tickets</b> - Set up ticket tiers and track sales</li>
+<li><b>Track Costs</b> - Record labour, prize support, and other expenses</li>
+<li><b>Post-Event Analysis</b> - Review attendance, satisfaction, and profitability</li>
+</ol>
+
+<h2>Navigation</h2>
+
+<ul>
+<li><b>Dashboard</b> - View important checklist items and prize tracking</li>
+<li><b>Events</b> - Manage your upcoming and past events</li>
+<li><b>Templates</b> - Create and edit event templates</li>
+<li><b>Analysis</b> - View trends and performance metrics</li>
+<li><b>Settings</b> - Configure labour rates and backup settings</li>
+</ul>
+        ''', 1),
+        ('faq', 'Frequently Asked Questions', '''
+<h1>Frequently Asked Questions</h1>
+
+<h2>Events</h2>
+
+<h3>How do I create a new event?</h3>
+<p>Click the "Events" button in the sidebar, then click "New Event". You can either create an event from scratch or use an existing template.</p>
+
+<h3>How do I cancel an event?</h3>
+<p>Open the event details and check the "Event Cancelled" checkbox. You can also add a cancellation reason for your records.</p>
+
+<h2>Templates</h2>
+
+<h3>What are event templates?</h3>
+<p>Templates let you save common event configurations (event type, format, capacity, checklist items) that you can reuse when creating new events.</p>
+
+<h2>Analysis</h2>
+
+<h3>What satisfaction score should I aim for?</h3>
+<p>The satisfaction score ranges from 0-10. A score of 7+ is generally considered good, while 8+ is excellent.</p>
+
+<h3>How is the satisfaction score calculated?</h3>
+<p>The score is calculated from the breakdown percentages: (Loved% × 9 + Liked% × 6 + Didn't Enjoy% × 2.5) ÷ 100</p>
+        ''', 2),
+        ('troubleshooting', 'Troubleshooting', '''
+<h1>Troubleshooting</h1>
+
+<h2>Database Issues</h2>
+
+<h3>Creating Backups</h3>
+<p>Always create regular backups of your database. Go to Settings > Backup to create a manual backup or configure automatic backups.</p>
+
+<h3>Restoring from Backup</h3>
+<p>If you need to restore from a backup, close the application and replace events.db with your backup file.</p>
+
+<h2>Performance</h2>
+
+<h3>Application Running Slowly</h3>
+<p>If the application is slow, try these steps:</p>
+<ol>
+<li>Close other applications to free up memory</li>
+<li>Create a backup and restart the application</li>
+<li>Archive old completed events if you have many events in the database</li>
+</ol>
+
+<h2>Need More Help?</h2>
+
+<p>For additional support or feature requests, use the Feature Requests menu to submit your feedback.</p>
+        ''', 3)
+    ]
+
+    for section_name, title, content, sort_order in default_help_sections:
+        cursor.execute('''
+            INSERT OR IGNORE INTO help_content (section_name, title, content, sort_order)
+            VALUES (?, ?, ?, ?)
+        ''', (section_name, title, content, sort_order))
+
+    # Insert default settings
+    default_settings = [
+        ('weekday_before_6pm_rate', '22.00'),
+        ('weekday_after_6pm_rate', '25.50'),
+        ('saturday_rate', '30.00'),
+        ('sunday_rate', '35.00'),
+        ('public_holiday_rate', '40.00'),
+        ('backup_location', ''),
+        ('colour_scheme', 'pastel')
+    ]
+
+    for key, value in default_settings:
+        cursor.execute('''
+            INSERT OR IGNORE INTO settings (setting_key, setting_value)
+            VALUES (?, ?)
+        ''', (key, value))
+
+
+def migration_002_fold_in_scripts(cursor):
+    """Tables and columns previously added by the one-off scripts in migrations/"""
+    # Template child tables (add_template_tables.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS template_ticket_tiers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            template_id INTEGER NOT NULL,
+            tier_name TEXT NOT NULL,
+            price REAL NOT NULL,
+            quantity_available INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (template_id) REFERENCES event_templates(id) ON DELETE CASCADE
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS template_prize_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            template_id INTEGER NOT NULL,
+            description TEXT NOT NULL,
+            quantity INTEGER,
+            cost_per_item REAL,
+            total_cost REAL,
+            supplier TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (template_id) REFERENCES event_templates(id) ON DELETE CASCADE
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS template_notes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            template_id INTEGER NOT NULL,
+            note_text TEXT NOT NULL,
+            include_in_printout INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (template_id) REFERENCES event_templates(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Players (add_players_table.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_players (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            player_name TEXT NOT NULL,
+            sort_order INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Feedback menu items (update_materials_and_feedback.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS feedback_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            feedback_text TEXT NOT NULL,
+            is_dismissed BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Table booking (add_operating_hours.py, add_date_specific_hours.py,
+    # add_table_booking_features.py, add_standalone_bookings.py)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS operating_hours (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            day_of_week INTEGER NOT NULL UNIQUE,
+            is_open INTEGER DEFAULT 1,
+            open_time TIME,
+            close_time TIME,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            CHECK (day_of_week >= 0 AND day_of_week <= 6)
+        )
+    ''')
+
+    cursor.executemany('''
+        INSERT OR IGNORE INTO operating_hours (day_of_week, is_open, open_time, close_time)
+        VALUES (?, 1, '10:00:00', '22:00:00')
+    ''', [(day,) for day in range(7)])
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS date_specific_hours (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            specific_date DATE NOT NULL UNIQUE,
+            is_open INTEGER DEFAULT 1,
+            open_time TIME,
+            close_time TIME,
+            reason TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS daily_capacity_overrides (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            override_date DATE NOT NULL UNIQUE,
+            total_tables INTEGER NOT NULL,
+            reason TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_type_padding (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_type_id INTEGER NOT NULL UNIQUE,
+            setup_padding_minutes INTEGER DEFAULT 30,
+            breakdown_padding_minutes INTEGER DEFAULT 15,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_type_id) REFERENCES event_types(id) ON DELETE CASCADE
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS standalone_bookings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            booking_name TEXT NOT NULL,
+            booking_description TEXT,
+            booking_date DATE NOT NULL,
+            start_time TIME,
+            end_time TIME,
+            tables_booked INTEGER NOT NULL DEFAULT 1,
+            notes TEXT,
+            is_deleted INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_date_specific_hours_date
+        ON date_specific_hours(specific_date)
+    ''')
+
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_standalone_bookings_date
+        ON standalone_bookings(booking_date)
+        WHERE is_deleted = 0
+    ''')
+
+    table_booking_settings = [
+        ('total_tables_available', '10'),
+        ('default_setup_padding_minutes', '30'),
+        ('default_breakdown_padding_minutes', '15'),
+        ('show_table_warnings', '1'),
+    ]
+    cursor.executemany('''
+        INSERT OR IGNORE INTO settings (setting_key, setting_value)
+        VALUES (?, ?)
+    ''', table_booking_settings)
+
+    # Columns added over time by the individual scripts
+    add_column_if_missing(cursor, 'events', 'cancelled_date', 'TIMESTAMP')
+    add_column_if_missing(cursor, 'events', 'cancellation_reason', 'TEXT')
+    add_column_if_missing(cursor, 'template_checklist_items', 'include_in_pdf', 'INTEGER DEFAULT 1')
+    add_column_if_missing(cursor, 'template_checklist_items', 'show_on_dashboard', 'INTEGER DEFAULT 0')
+    add_column_if_missing(cursor, 'event_checklist_items', 'due_date', 'DATE')
+    add_column_if_missing(cursor, 'event_notes', 'send_to_template', 'BOOLEAN DEFAULT 0')
+    add_column_if_missing(cursor, 'labour_costs', 'rate_type', "TEXT DEFAULT 'weekday'")
+    add_column_if_missing(cursor, 'labour_costs', 'work_status', "TEXT DEFAULT 'full'")
+    add_column_if_missing(cursor, 'labour_costs', 'staff_name', 'TEXT')
+    add_column_if_missing(cursor, 'event_analysis', 'event_smoothness', 'DECIMAL(3,1)')
+    add_column_if_missing(cursor, 'event_analysis', 'overall_success_score', 'DECIMAL(3,1)')
+
+
+def migration_003_managed_indexes(cursor):
+    """Indexes for per-event lookups and the events list/dashboard filters"""
+    create_managed_indexes(cursor)
+
+
+def migration_004_event_series(cursor):
+    """Recurring event series and the link from generated events"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_series (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            template_id INTEGER NOT NULL,
+            series_name TEXT NOT NULL,
+            recurrence TEXT NOT NULL DEFAULT 'weekly',
+            weekday INTEGER NOT NULL,
+            week_of_month INTEGER,
+            start_date DATE NOT NULL,
+            end_date DATE NOT NULL,
+            start_time TIME,
+            end_time TIME,
+            skip_closed_days INTEGER DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (template_id) REFERENCES event_templates(id) ON DELETE CASCADE,
+            CHECK (recurrence IN ('weekly', 'fortnightly', 'monthly')),
+            CHECK (weekday >= 0 AND weekday <= 6)
+        )
+    ''')
+
+    add_column_if_missing(cursor, 'events', 'series_id', 'INTEGER REFERENCES event_series(id)')
+
+    # One occurrence per series per date; this is what makes regenerate/extend idempotent
+    cursor.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_events_series_date
+        ON events(series_id, event_date) WHERE series_id IS NOT NULL
+    ''')
+
+
+def migration_005_events_date_index(cursor):
+    """Index for paging through events by date"""
+    # Keyset paging on (event_date, id); id is the rowid, so it's implicitly the last column
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_date ON events(is_deleted, event_date)')
+
+
+def migration_006_analytics_rollup(cursor):
+    """Per month and event type totals for the Analysis view, kept current by triggers
+
+    Each event contributes to the row for its month ('' when undated) and
+    event type (0 when none). Triggers subtract an event's contribution
+    before a relevant change to events or event_analysis and add it back
+    afterwards, so the rollup never needs a full rescan.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS analytics_rollup (
+            month TEXT NOT NULL,
+            event_type_id INTEGER NOT NULL,
+            event_count INTEGER NOT NULL DEFAULT 0,
+            cancelled_count INTEGER NOT NULL DEFAULT 0,
+            completed_count INTEGER NOT NULL DEFAULT 0,
+            attendance_sum REAL NOT NULL DEFAULT 0,
+            attendance_n INTEGER NOT NULL DEFAULT 0,
+            revenue_sum REAL NOT NULL DEFAULT 0,
+            revenue_n INTEGER NOT NULL DEFAULT 0,
+            cost_sum REAL NOT NULL DEFAULT 0,
+            profit_sum REAL NOT NULL DEFAULT 0,
+            satisfaction_sum REAL NOT NULL DEFAULT 0,
+            satisfaction_n INTEGER NOT NULL DEFAULT 0,
+            smoothness_sum REAL NOT NULL DEFAULT 0,
+            smoothness_n INTEGER NOT NULL DEFAULT 0,
+            success_sum REAL NOT NULL DEFAULT 0,
+            success_n INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (month, event_type_id)
+        )
+    ''')
+
+    # Completed-event measures from event_analysis: (rollup prefix, analysis column, keeps a count)
+    measures = [
+        ('attendance', 'actual_attendance', True),
+        ('revenue', 'revenue_total', True),
+        ('cost', 'cost_total', False),
+        ('profit', 'profit_margin', False),
+        ('satisfaction', 'attendee_satisfaction', True),
+        ('smoothness', 'event_smoothness', True),
+        ('success', 'overall_success_score', True),
+    ]
+    columns = ['event_count', 'cancelled_count', 'completed_count']
+    for prefix, _, counted in measures:
+        columns += [f'{prefix}_sum', f'{prefix}_n'] if counted else [f'{prefix}_sum']
+
+    def delta(sign: str, event_id: str) -> str:
+        """Upsert that adds (sign '+') or removes (sign '-') one event's contribution"""
+        values = [
+            f"{sign}1",
+            f"CASE WHEN e.is_cancelled = 1 THEN {sign}1 ELSE 0 END",
+            f"CASE WHEN e.is_completed = 1 THEN {sign}1 ELSE 0 END",
+        ]
+        for _, column, counted in measures:
+            values.append(f"CASE WHEN e.is_completed = 1 THEN {sign}COALESCE(ea.{column}, 0) ELSE 0 END")
+            if counted:
+                values.append(f"CASE WHEN e.is_completed = 1 AND ea.{column} IS NOT NULL THEN {sign}1 ELSE 0 END")
+        return f'''
+            INSERT INTO analytics_rollup (month, event_type_id, {', '.join(columns)})
+            SELECT COALESCE(strftime('%Y-%m', e.event_date), ''), COALESCE(e.event_type_id, 0),
+                   {', '.join(values)}
+            FROM events e
+            LEFT JOIN event_analysis ea ON ea.event_id = e.id
+            WHERE e.id = {event_id}
+            ON CONFLICT (month, event_type_id) DO UPDATE SET
+                {', '.join(f'{c} = {c} + excluded.{c}' for c in columns)};
+        '''
+
+    events_columns = 'event_date, event_type_id, is_completed, is_cancelled'
+    analysis_columns = ', '.join(column for _, column, _ in measures)
+    triggers = [
+        ('trg_rollup_events_insert', 'AFTER INSERT ON events', delta('+', 'NEW.id')),
+        ('trg_rollup_events_update_old', f'BEFORE UPDATE OF {events_columns} ON events', delta('-', 'OLD.id')),
+        ('trg_rollup_events_update_new', f'AFTER UPDATE OF {events_columns} ON events', delta('+', 'NEW.id')),
+        ('trg_rollup_events_delete', 'BEFORE DELETE ON events', delta('-', 'OLD.id')),
+        ('trg_rollup_analysis_insert_old', 'BEFORE INSERT ON event_analysis', delta('-', 'NEW.event_id')),
+        ('trg_rollup_analysis_insert_new', 'AFTER INSERT ON event_analysis', delta('+', 'NEW.event_id')),
+        ('trg_rollup_analysis_update_old', f'BEFORE UPDATE OF {analysis_columns} ON event_analysis',
+         delta('-', 'OLD.event_id')),
+        ('trg_rollup_analysis_update_new', f'AFTER UPDATE OF {analysis_columns} ON event_analysis',
+         delta('+', 'NEW.event_id')),
+        ('trg_rollup_analysis_delete_old', 'BEFORE DELETE ON event_analysis', delta('-', 'OLD.event_id')),
+        ('trg_rollup_analysis_delete_new', 'AFTER DELETE ON event_analysis', delta('+', 'OLD.event_id')),
+    ]
+    for name, timing, body in triggers:
+        cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {timing} BEGIN {body} END')
+
+    # Existing events
+    cursor.execute('DELETE FROM analytics_rollup')
+    cursor.execute('SELECT id FROM events')
+    for (event_id,) in cursor.fetchall():
+        cursor.execute(delta('+', '?'), (event_id,))
+
+
+def migration_007_event_financials(cursor):
+    """One row of ticket and cost totals per event, kept current by triggers
+
+    Any insert, update or delete on ticket_tiers, labour_costs, prize_items
+    or event_costs recomputes the affected event's row (both events when a
+    row moves between them), so reading an event's financials is a primary
+    key lookup rather than four aggregates.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS event_financials (
+            event_id INTEGER PRIMARY KEY,
+            ticket_revenue REAL NOT NULL DEFAULT 0,
+            tickets_sold INTEGER NOT NULL DEFAULT 0,
+            ticket_capacity INTEGER NOT NULL DEFAULT 0,
+            max_ticket_revenue REAL NOT NULL DEFAULT 0,
+            labour_cost REAL NOT NULL DEFAULT 0,
+            prize_cost REAL NOT NULL DEFAULT 0,
+            other_cost REAL NOT NULL DEFAULT 0,
+            FOREIGN KEY (event_id) REFERENCES events(id) ON DELETE CASCADE
+        )
+    ''')
+
+    # Every event's totals computed from its child tables
+    compute = '''
+        INSERT INTO event_financials (event_id, ticket_revenue, tickets_sold, ticket_capacity,
+                                      max_ticket_revenue, labour_cost, prize_cost, other_cost)
+        SELECT e.id,
+               (SELECT COALESCE(SUM(price * COALESCE(quantity_sold, 0)), 0) FROM ticket_tiers WHERE event_id = e.id),
+               (SELECT COALESCE(SUM(quantity_sold), 0) FROM ticket_tiers WHERE event_id = e.id),
+               (SELECT COALESCE(SUM(quantity_available), 0) FROM ticket_tiers WHERE event_id = e.id),
+               (SELECT COALESCE(SUM(price * quantity_available), 0) FROM ticket_tiers WHERE event_id = e.id),
+               (SELECT COALESCE(SUM(total_cost), 0) FROM labour_costs WHERE event_id = e.id),
+               (SELECT COALESCE(SUM(total_cost), 0) FROM prize_items WHERE event_id = e.id),
+               (SELECT COALESCE(SUM(amount), 0) FROM event_costs WHERE event_id = e.id)
+        FROM events e
+    '''
+
+    def refresh(event_id: str) -> str:
+        """Upsert that recomputes one event's row (nothing once the event is gone)"""
+        return compute + f'''
+            WHERE e.id = {event_id}
+            ON CONFLICT (event_id) DO UPDATE SET
+                ticket_revenue = excluded.ticket_revenue,
+                tickets_sold = excluded.tickets_sold,
+                ticket_capacity = excluded.ticket_capacity,
+                max_ticket_revenue = excluded.max_ticket_revenue,
+                labour_cost = excluded.labour_cost,
+                prize_cost = excluded.prize_cost,
+                other_cost = excluded.other_cost;
+        '''
+
+    for table in ('ticket_tiers', 'labour_costs', 'prize_items', 'event_costs'):
+        triggers = [
+            ('insert', 'AFTER INSERT', refresh('NEW.event_id')),
+            ('update', 'AFTER UPDATE', refresh('OLD.event_id') + refresh('NEW.event_id')),
+            ('delete', 'AFTER DELETE', refresh('OLD.event_id')),
+        ]
+        for action, timing, body in triggers:
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_financials_{table}_{action}
+                {timing} ON {table} BEGIN {body} END
+            ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_financials_events_delete
+        AFTER DELETE ON events
+        BEGIN DELETE FROM event_financials WHERE event_id = OLD.id; END
+    ''')
+
+    # Existing events
+    cursor.execute('DELETE FROM event_financials')
+    cursor.execute(compute)
+
+
+
+def migration_008_slim_analytics_rollup(cursor):
+    """Cut analytics_rollup down to the event counts the Analysis view reads
+
+    Its KPIs come from the analytics engine's snapshot, so the event_analysis
+    sums migration 6 kept (and the triggers on event_analysis that kept them)
+    were maintained on every save but never read.
+    """
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_rollup_%'")
+    for (name,) in cursor.fetchall():
+        cursor.execute(f'DROP TRIGGER {name}')
+    cursor.execute('DROP TABLE IF EXISTS analytics_rollup')
+    cursor.execute('''
+        CREATE TABLE analytics_rollup (
+            month TEXT NOT NULL,
+            event_type_id INTEGER NOT NULL,
+            event_count INTEGER NOT NULL DEFAULT 0,
+            cancelled_count INTEGER NOT NULL DEFAULT 0,
+            completed_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (month, event_type_id)
+        )
+    ''')
+
+    def delta(sign: str, event_id: str) -> str:
+        """Upsert that adds (sign '+') or removes (sign '-') one event's counts"""
+        return f'''
+            INSERT INTO analytics_rollup (month, event_type_id, event_count, cancelled_count, completed_count)
+            SELECT COALESCE(strftime('%Y-%m', e.event_date), ''), COALESCE(e.event_type_id, 0),
+                   {sign}1,
+                   CASE WHEN e.is_cancelled = 1 THEN {sign}1 ELSE 0 END,
+                   CASE WHEN e.is_completed = 1 THEN {sign}1 ELSE 0 END
+            FROM events e
+            WHERE e.id = {event_id}
+            ON CONFLICT (month, event_type_id) DO UPDATE SET
+                event_count = event_count + excluded.event_count,
+                cancelled_count = cancelled_count + excluded.cancelled_count,
+                completed_count = completed_count + excluded.completed_count;
+        '''
+
+    events_columns = 'event_date, event_type_id, is_completed, is_cancelled'
+    triggers = [
+        ('trg_rollup_events_insert', 'AFTER INSERT ON events', delta('+', 'NEW.id')),
+        ('trg_rollup_events_update_old', f'BEFORE UPDATE OF {events_columns} ON events', delta('-', 'OLD.id')),
+        ('trg_rollup_events_update_new', f'AFTER UPDATE OF {events_columns} ON events', delta('+', 'NEW.id')),
+        ('trg_rollup_events_delete', 'BEFORE DELETE ON events', delta('-', 'OLD.id')),
+    ]
+    for name, timing, body in triggers:
+        cursor.execute(f'CREATE TRIGGER {name} {timing} BEGIN {body} END')
+
+    # Existing events
+    cursor.execute('''
+        INSERT INTO analytics_rollup (month, event_type_id, event_count, cancelled_count, completed_count)
+        SELECT COALESCE(strftime('%Y-%m', e.event_date), ''), COALESCE(e.event_type_id, 0),
+               COUNT(*),
+               SUM(CASE WHEN e.is_cancelled = 1 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN e.is_completed = 1 THEN 1 ELSE 0 END)
+        FROM events e
+        GROUP BY 1, 2
+    ''')
+
+# Ordered registry: (version, description, function). Append only.
+MIGRATIONS: List[Tuple[int, str, Callable]] = [
+    (1, 'Base schema and default data', migration_001_base_schema),
+    (2, 'Fold in one-off migration scripts', migration_002_fold_in_scripts),
+    (3, 'Managed indexes', migration_003_managed_indexes),
+    (4, 'Recurring event series', migration_004_event_series),
+    (5, 'Events date index for paging', migration_005_events_date_index),
+    (6, 'Analytics rollup table and triggers', migration_006_analytics_rollup),
+    (7, 'Per-event financials table and triggers', migration_007_event_financials),
+    (8, 'Analytics rollup keeps event counts only', migration_008_slim_analytics_rollup),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn) -> int:
+    """Read the schema version stored in the database header"""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def apply_migrations(conn) -> List[int]:
+    """Apply all pending migrations in a single transaction
+
+    Returns:
+        The versions that were applied (empty when already current)
+    """
+    current_version = get_schema_version(conn)
+    pending = [m for m in MIGRATIONS if m[0] > current_version]
+    if not pending:
+        return []
+
+    cursor = conn.cursor()
+    cursor.execute('BEGIN')
+    try:
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL,
+                applied_at TIMESTAMP NOT NULL
+            )
+        ''')
+
+        for version, description, migration in pending:
+            migration(cursor)
+            cursor.execute('''
+                INSERT OR REPLACE INTO schema_migrations (version, description, applied_at)
+                VALUES (?, ?, ?)
+            ''', (version, description, datetime.now()))
+
+        # PRAGMA doesn't accept parameters; the version is an int from MIGRATIONS
+        cursor.execute(f'PRAGMA user_version = {pending[-1][0]}')
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+
+    return [m[0] for m in pending]
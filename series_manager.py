@@ -0,0 +1,445 @@
+"""Recurring event series functionality"""
+import calendar
+from database import Database
+from event_manager import EventManager
+from change_bus import CREATED, UPDATED
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Dict, Any, Set
+
+# Recurrence rules an event series can use
+RECURRENCE_RULES = {
+    'weekly': 'Weekly',
+    'fortnightly': 'Fortnightly',
+    'monthly': 'Monthly (nth weekday)',
+}
+
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# week_of_month values for monthly series (-1 = last occurrence in the month)
+WEEK_OF_MONTH_NAMES = {1: 'First', 2: 'Second', 3: 'Third', 4: 'Fourth', -1: 'Last'}
+
+
+def to_date(value) -> date:
+    """Accept a date or a 'YYYY-MM-DD' string"""
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def normalize_time(value: Optional[str], label: str) -> Optional[str]:
+    """Turn 'HH:MM' or 'HH:MM:SS' into the 'HH:MM:SS' events store (None/blank stays None)"""
+    if value is None or not str(value).strip():
+        return None
+    time_str = str(value).strip()
+    if len(time_str.split(':')) == 2:
+        time_str += ':00'
+    try:
+        datetime.strptime(time_str, '%H:%M:%S')
+    except ValueError:
+        raise ValueError(f"{label} must be in HH:MM format")
+    return time_str
+
+
+def nth_weekday_of_month(year: int, month: int, weekday: int, week_of_month: int) -> Optional[date]:
+    """Get e.g. the 2nd Tuesday (week_of_month=2) or last Friday (-1) of a month"""
+    days_in_month = calendar.monthrange(year, month)[1]
+    if week_of_month == -1:
+        last = date(year, month, days_in_month)
+        return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+    first = date(year, month, 1)
+    day = first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (week_of_month - 1))
+    return day if day.month == month else None
+
+
+def generate_series_dates(recurrence: str, weekday: int, anchor_date, start_date, end_date,
+                          week_of_month: Optional[int] = None) -> List[date]:
+    """List the dates a recurrence rule produces between start_date and end_date (inclusive)
+
+    anchor_date is the series' own start date. Fortnightly series count their
+    weeks from it, so extending or regenerating a series keeps the same
+    alternate weeks.
+    """
+    anchor_date, start_date, end_date = to_date(anchor_date), to_date(start_date), to_date(end_date)
+    start_date = max(start_date, anchor_date)
+    dates = []
+
+    if recurrence in ('weekly', 'fortnightly'):
+        step = 7 if recurrence == 'weekly' else 14
+        current = anchor_date + timedelta(days=(weekday - anchor_date.weekday()) % 7)
+        if current < start_date:
+            steps = (start_date - current).days // step
+            current += timedelta(days=step * steps)
+            if current < start_date:
+                current += timedelta(days=step)
+        while current <= end_date:
+            dates.append(current)
+            current += timedelta(days=step)
+
+    elif recurrence == 'monthly':
+        if week_of_month not in WEEK_OF_MONTH_NAMES:
+            raise ValueError("Monthly series need a week of the month (1-4 or -1 for last)")
+        year, month = start_date.year, start_date.month
+        while date(year, month, 1) <= end_date:
+            day = nth_weekday_of_month(year, month, weekday, week_of_month)
+            if day and start_date <= day <= end_date:
+                dates.append(day)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    else:
+        raise ValueError(f"Unknown recurrence rule: {recurrence}")
+
+    return dates
+
+
+class SeriesManager:
+    """Manages recurring event series and the events generated from them
+
+    A series is a template plus a recurrence rule. Materializing a series
+    creates one event per matching date, copying the template's checklist,
+    ticket tiers, prizes and notes, all in a single transaction. Each series
+    has at most one event per date (enforced by idx_events_series_date), and
+    dates that already have an event (even a deleted one) are left alone, so
+    extending or regenerating a series never duplicates events.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+        self.event_manager = EventManager(db)
+
+    def get_all_series(self, template_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get all series (optionally for one template) with occurrence counts"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        query = '''
+            SELECT
+                s.*,
+                t.name as template_name,
+                (SELECT COUNT(*) FROM events e
+                 WHERE e.series_id = s.id AND e.is_deleted = 0) as occurrence_count
+            FROM event_series s
+            LEFT JOIN event_templates t ON s.template_id = t.id
+        '''
+        params = ()
+        if template_id is not None:
+            query += ' WHERE s.template_id = ?'
+            params = (template_id,)
+        query += ' ORDER BY s.series_name'
+
+        cursor.execute(query, params)
+        series = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return series
+
+    def get_series(self, series_id: int) -> Optional[Dict[str, Any]]:
+        """Get a series by ID"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM event_series WHERE id = ?', (series_id,))
+        result = cursor.fetchone()
+        conn.close()
+        return dict(result) if result else None
+
+    def get_series_events(self, series_id: int) -> List[Dict[str, Any]]:
+        """Get the (non-deleted) events generated by a series"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT * FROM events
+            WHERE series_id = ? AND is_deleted = 0
+            ORDER BY event_date
+        ''', (series_id,))
+        events = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return events
+
+    def create_series(self, series_data: Dict[str, Any]) -> int:
+        """Create a series and materialize its events
+
+        Returns:
+            The new series ID
+        """
+        series_data = self._validate(series_data)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO event_series (
+                    template_id, series_name, recurrence, weekday, week_of_month,
+                    start_date, end_date, start_time, end_time, skip_closed_days
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                series_data['template_id'],
+                series_data['series_name'],
+                series_data['recurrence'],
+                series_data['weekday'],
+                series_data.get('week_of_month'),
+                str(series_data['start_date']),
+                str(series_data['end_date']),
+                series_data.get('start_time'),
+                series_data.get('end_time'),
+                series_data.get('skip_closed_days', 1)
+            ))
+            series_id = cursor.lastrowid
+
+            cursor.execute('SELECT * FROM event_series WHERE id = ?', (series_id,))
+            series = dict(cursor.fetchone())
+            event_ids = self._materialize(cursor, series, series['start_date'], series['end_date'])
+
+        self._publish_changes(series['template_id'], event_ids)
+        return series_id
+
+    def materialize_series(self, series_id: int, start_date=None, end_date=None) -> List[int]:
+        """Create any missing events for a series (defaults to its whole date range)
+
+        Returns:
+            IDs of the events that were created
+        """
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            series = self._get_series(cursor, series_id)
+            event_ids = self._materialize(cursor, series,
+                                          start_date or series['start_date'],
+                                          end_date or series['end_date'])
+
+        self._publish_changes(series['template_id'], event_ids)
+        return event_ids
+
+    def extend_series(self, series_id: int, new_end_date) -> List[int]:
+        """Move a series' end date later and create the events for the added dates
+
+        Returns:
+            IDs of the events that were created
+        """
+        new_end_date = to_date(new_end_date)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            series = self._get_series(cursor, series_id)
+            old_end_date = to_date(series['end_date'])
+            if new_end_date <= old_end_date:
+                raise ValueError("The new end date must be after the current end date")
+
+            cursor.execute('''
+                UPDATE event_series SET end_date = ?, updated_at = ? WHERE id = ?
+            ''', (new_end_date.isoformat(), datetime.now(), series_id))
+            series['end_date'] = new_end_date.isoformat()
+
+            event_ids = self._materialize(cursor, series, old_end_date + timedelta(days=1), new_end_date)
+
+        self._publish_changes(series['template_id'], event_ids)
+        return event_ids
+
+    def update_series(self, series_id: int, series_data: Dict[str, Any]) -> Dict[str, int]:
+        """Change a series' rule or details, then bring its upcoming events in line
+
+        Upcoming, not yet completed events take the new name and times;
+        past and completed events keep theirs.
+        """
+        series_data = self._validate(series_data)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE event_series SET
+                    series_name = ?,
+                    recurrence = ?,
+                    weekday = ?,
+                    week_of_month = ?,
+                    start_date = ?,
+                    end_date = ?,
+                    start_time = ?,
+                    end_time = ?,
+                    skip_closed_days = ?,
+                    updated_at = ?
+                WHERE id = ?
+            ''', (
+                series_data['series_name'],
+                series_data['recurrence'],
+                series_data['weekday'],
+                series_data.get('week_of_month'),
+                str(series_data['start_date']),
+                str(series_data['end_date']),
+                series_data.get('start_time'),
+                series_data.get('end_time'),
+                series_data.get('skip_closed_days', 1),
+                datetime.now(),
+                series_id
+            ))
+            series = self._get_series(cursor, series_id)
+            cursor.execute('''
+                UPDATE events SET event_name = ?, start_time = ?, end_time = ?
+                WHERE series_id = ? AND event_date >= ? AND is_completed = 0 AND is_deleted = 0
+            ''', (series['series_name'], series['start_time'], series['end_time'],
+                  series_id, date.today().isoformat()))
+            result = self._regenerate(cursor, series)
+
+        self._publish_changes(series['template_id'])
+        return result
+
+    def regenerate_series(self, series_id: int) -> Dict[str, int]:
+        """Bring upcoming events back in line with the series rule
+
+        Upcoming, not yet completed events on dates the rule no longer
+        produces (or that are now closed) are moved to Deleted Events and
+        unlinked from the series; missing dates from today onwards are
+        created. Past and completed events are never touched.
+
+        Returns:
+            {'created': ..., 'removed': ...}
+        """
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            series = self._get_series(cursor, series_id)
+            result = self._regenerate(cursor, series)
+
+        self._publish_changes(series['template_id'])
+        return result
+
+    def delete_series(self, series_id: int):
+        """Delete a series; its upcoming events are moved to Deleted Events"""
+        today = date.today().isoformat()
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT template_id FROM event_series WHERE id = ?', (series_id,))
+            series = cursor.fetchone()
+            cursor.execute('''
+                UPDATE events
+                SET is_deleted = 1, deleted_at = CURRENT_TIMESTAMP
+                WHERE series_id = ? AND event_date >= ? AND is_completed = 0
+            ''', (series_id, today))
+            cursor.execute('UPDATE events SET series_id = NULL WHERE series_id = ?', (series_id,))
+            cursor.execute('DELETE FROM event_series WHERE id = ?', (series_id,))
+
+        if series:
+            self._publish_changes(series['template_id'])
+
+    def _publish_changes(self, template_id: int, created_ids: Optional[List[int]] = None):
+        """Tell open views about a series' events (entity_id None = many events changed)"""
+        with self.db.changes.batch() as changes:
+            if created_ids is None:
+                changes.publish('event', None, UPDATED)
+            else:
+                for event_id in created_ids:
+                    changes.publish('event', event_id, CREATED)
+            changes.publish('template', template_id, UPDATED)
+
+    def _validate(self, series_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Check series_data; returns a copy with its times normalized to HH:MM:SS"""
+        if not series_data.get('series_name'):
+            raise ValueError("Series name is required")
+        if series_data.get('recurrence') not in RECURRENCE_RULES:
+            raise ValueError(f"Unknown recurrence rule: {series_data.get('recurrence')}")
+        if to_date(series_data['end_date']) < to_date(series_data['start_date']):
+            raise ValueError("End date must be on or after the start date")
+        if series_data['recurrence'] == 'monthly' and series_data.get('week_of_month') not in WEEK_OF_MONTH_NAMES:
+            raise ValueError("Monthly series need a week of the month")
+
+        return dict(series_data,
+                    start_time=normalize_time(series_data.get('start_time'), "Start time"),
+                    end_time=normalize_time(series_data.get('end_time'), "End time"))
+
+    def _get_series(self, cursor, series_id: int) -> Dict[str, Any]:
+        cursor.execute('SELECT * FROM event_series WHERE id = ?', (series_id,))
+        series = cursor.fetchone()
+        if not series:
+            raise ValueError(f"Series {series_id} not found")
+        return dict(series)
+
+    def _series_dates(self, cursor, series: Dict[str, Any], start_date, end_date) -> List[date]:
+        """Dates the rule produces in a range, minus closed days if the series skips them"""
+        dates = generate_series_dates(series['recurrence'], series['weekday'], series['start_date'],
+                                      start_date, end_date, series['week_of_month'])
+        if dates and series['skip_closed_days']:
+            closed = self._get_closed_dates(cursor, dates[0], dates[-1])
+            dates = [d for d in dates if d.isoformat() not in closed]
+        return dates
+
+    def _get_closed_dates(self, cursor, start_date: date, end_date: date) -> Set[str]:
+        """Dates the venue is closed: date-specific hours first, then the weekly hours"""
+        cursor.execute('''
+            SELECT specific_date, is_open FROM date_specific_hours
+            WHERE specific_date BETWEEN ? AND ?
+        ''', (start_date.isoformat(), end_date.isoformat()))
+        specific = {row['specific_date']: row['is_open'] for row in cursor.fetchall()}
+
+        cursor.execute('SELECT day_of_week FROM operating_hours WHERE is_open = 0')
+        closed_weekdays = {row['day_of_week'] for row in cursor.fetchall()}
+
+        closed = {day for day, is_open in specific.items() if not is_open}
+        if closed_weekdays:
+            current = start_date
+            while current <= end_date:
+                day = current.isoformat()
+                if day not in specific and current.weekday() in closed_weekdays:
+                    closed.add(day)
+                current += timedelta(days=1)
+        return closed
+
+    def _materialize(self, cursor, series: Dict[str, Any], start_date, end_date) -> List[int]:
+        """Create the missing events for a date range on the caller's cursor (no commit)"""
+        dates = self._series_dates(cursor, series, start_date, end_date)
+        if not dates:
+            return []
+
+        # Any existing row blocks its date, including deleted ones, so events
+        # the user removed by hand don't come back
+        cursor.execute('SELECT event_date FROM events WHERE series_id = ?', (series['id'],))
+        existing = {row['event_date'] for row in cursor.fetchall()}
+        new_dates = [d.isoformat() for d in dates if d.isoformat() not in existing]
+        if not new_dates:
+            return []
+
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM events')
+        last_id = cursor.fetchone()[0]
+
+        cursor.executemany('''
+            INSERT INTO events (
+                template_id, series_id, event_name, event_date, start_time, end_time,
+                event_type_id, playing_format_id, pairing_method_id, pairing_app_id,
+                max_capacity, description
+            )
+            SELECT id, ?, ?, ?, ?, ?,
+                   event_type_id, playing_format_id, pairing_method_id, pairing_app_id,
+                   max_capacity, description
+            FROM event_templates
+            WHERE id = ?
+        ''', [(series['id'], series['series_name'], event_date, series['start_time'],
+               series['end_time'], series['template_id']) for event_date in new_dates])
+
+        cursor.execute('SELECT id FROM events WHERE series_id = ? AND id > ? ORDER BY id',
+                       (series['id'], last_id))
+        event_ids = [row['id'] for row in cursor.fetchall()]
+
+        self.event_manager.copy_template_data(cursor, series['template_id'], event_ids)
+        return event_ids
+
+    def _regenerate(self, cursor, series: Dict[str, Any]) -> Dict[str, int]:
+        today = date.today()
+        start_date = max(to_date(series['start_date']), today)
+        end_date = to_date(series['end_date'])
+
+        wanted = set()
+        if start_date <= end_date:
+            wanted = {d.isoformat() for d in self._series_dates(cursor, series, start_date, end_date)}
+
+        cursor.execute('''
+            SELECT id, event_date FROM events
+            WHERE series_id = ? AND event_date >= ? AND is_completed = 0 AND is_deleted = 0
+        ''', (series['id'], today.isoformat()))
+        stale_ids = [row['id'] for row in cursor.fetchall() if row['event_date'] not in wanted]
+
+        # Unlinked as well as deleted, so the date is free if the rule comes back to it
+        cursor.executemany('''
+            UPDATE events
+            SET is_deleted = 1, deleted_at = CURRENT_TIMESTAMP, series_id = NULL
+            WHERE id = ?
+        ''', [(event_id,) for event_id in stale_ids])
+
+        created = []
+        if start_date <= end_date:
+            created = self._materialize(cursor, series, start_date, end_date)
+
+        return {'created': len(created), 'removed': len(stale_ids)}
@@ -0,0 +1,100 @@
+"""Process-wide in-memory cache of the settings table"""
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+TRUE_VALUES = {'1', 'true', 'yes', 'on'}
+
+
+class SettingsCache:
+    """Write-through cache of the settings table
+
+    All settings are loaded in one query on first use. Reads never touch
+    SQLite; typed accessors parse each value once and memoise the result.
+    Writes go through Database.update_setting/update_settings, which update
+    the table and then call set()/set_many() here.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, str] = {}
+        self._typed: Dict[tuple, Any] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self, conn):
+        """Bulk-load every setting from the database"""
+        cursor = conn.cursor()
+        cursor.execute('SELECT setting_key, setting_value FROM settings')
+        values = {row['setting_key']: row['setting_value'] for row in cursor.fetchall()}
+        with self._lock:
+            self._values = values
+            self._typed = {}
+            self._loaded = True
+
+    def invalidate(self):
+        """Drop everything; the next Database read reloads from the table"""
+        with self._lock:
+            self._values = {}
+            self._typed = {}
+            self._loaded = False
+
+    def get(self, key: str) -> Optional[str]:
+        return self._values.get(key)
+
+    def items_with_prefix(self, prefix: str) -> Dict[str, str]:
+        return {k: v for k, v in self._values.items() if k.startswith(prefix)}
+
+    def set(self, key: str, value: str):
+        self.set_many({key: value})
+
+    def set_many(self, values: Dict[str, str]):
+        with self._lock:
+            self._values.update(values)
+            # Only drop the parsed values for keys that changed
+            self._typed = {k: v for k, v in self._typed.items() if k[0] not in values}
+
+    def _get_typed(self, key: str, kind: str, parse: Callable[[str], Any], default):
+        cache_key = (key, kind, default)
+        try:
+            return self._typed[cache_key]
+        except KeyError:
+            pass
+
+        raw = self._values.get(key)
+        if raw is None or raw == '':
+            value = default
+        else:
+            try:
+                value = parse(raw)
+            except ValueError:
+                value = default
+
+        with self._lock:
+            self._typed[cache_key] = value
+        return value
+
+    def get_float(self, key: str, default: Optional[float] = None) -> Optional[float]:
+        return self._get_typed(key, 'float', float, default)
+
+    def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        return self._get_typed(key, 'int', lambda raw: int(float(raw)), default)
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        return self._get_typed(key, 'bool', lambda raw: raw.strip().lower() in TRUE_VALUES, default)
+
+
+_caches: Dict[str, SettingsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_settings_cache(db_path: str) -> SettingsCache:
+    """Get the shared cache for a database file (one per file per process)"""
+    key = os.path.abspath(db_path)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = SettingsCache()
+        return _caches[key]
@@ -0,0 +1,125 @@
+"""Opt-in timeline of application start-up
+
+Enable with the --trace-startup command line flag or by setting the
+TT_TRACE_STARTUP environment variable. Each named phase records wall and
+CPU time; when the dashboard has been painted the run is appended to
+startup_trace.log (one JSON object per line) and shown in Settings.
+"""
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+TRACE_ENV = 'TT_TRACE_STARTUP'
+TRACE_FLAG = '--trace-startup'
+QUIT_FLAG = '--quit-after-startup'  # Used by benchmark_startup.py
+TRACE_LOG = 'startup_trace.log'
+TRACE_LOG_RUNS = 20  # Runs kept in the log
+
+
+class StartupTracer:
+    """Records named start-up phases with wall and CPU time
+
+    Phases are measured with phase(); mark() records a point in time (e.g.
+    the first paint) relative to when the tracer was created. When disabled
+    both do nothing, so call sites don't need to check.
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.started_at = datetime.now()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self.phases: List[Dict[str, Any]] = []
+        self.marks: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the block as a named phase"""
+        if not self.enabled:
+            yield
+            return
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                'name': name,
+                'at_ms': (wall - self._wall_start) * 1000,
+                'wall_ms': (time.perf_counter() - wall) * 1000,
+                'cpu_ms': (time.process_time() - cpu) * 1000,
+            })
+
+    def mark(self, name: str):
+        """Record the time since start-up began"""
+        if not self.enabled:
+            return
+        self.marks.append({
+            'name': name,
+            'wall_ms': (time.perf_counter() - self._wall_start) * 1000,
+            'cpu_ms': (time.process_time() - self._cpu_start) * 1000,
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """This run as JSON-serialisable data"""
+        return {
+            'started_at': self.started_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'phases': self.phases,
+            'marks': self.marks,
+        }
+
+    def write_log(self, path: str = TRACE_LOG):
+        """Append this run to the trace log, keeping the last TRACE_LOG_RUNS runs"""
+        if not self.enabled:
+            return
+        try:
+            runs = []
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    runs = [line for line in f.read().splitlines() if line.strip()]
+            runs.append(json.dumps(self.to_dict()))
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(runs[-TRACE_LOG_RUNS:]) + '\n')
+        except OSError as e:
+            print(f"[STARTUP] Could not write {path}: {e}")
+
+        print(f"[STARTUP] {format_trace(self.to_dict())}")
+
+
+def format_trace(run: Dict[str, Any]) -> str:
+    """One run as a readable multi-line summary"""
+    lines = [f"Start-up on {run['started_at']}"]
+    for phase in run['phases']:
+        lines.append(f"  {phase['name']:<24} {phase['wall_ms']:8.1f} ms wall {phase['cpu_ms']:8.1f} ms CPU")
+    for mark in run['marks']:
+        lines.append(f"  {mark['name']:<24} at {mark['wall_ms']:7.1f} ms")
+    return '\n'.join(lines)
+
+
+def read_trace_log(path: str = TRACE_LOG) -> List[Dict[str, Any]]:
+    """Runs recorded in the trace log, oldest first"""
+    if not os.path.exists(path):
+        return []
+    runs = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                runs.append(json.loads(line))
+            except ValueError:
+                continue
+    return runs
+
+
+_tracer: Optional[StartupTracer] = None
+
+
+def get_tracer() -> StartupTracer:
+    """The process-wide tracer (created, and its clock started, on first call)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = StartupTracer(TRACE_FLAG in sys.argv or bool(os.environ.get(TRACE_ENV)))
+    return _tracer
@@ -1,5 +1,6 @@
 """Template management functionality"""
 from database import Database
+from change_bus import CREATED, UPDATED, DELETED
 from typing import Optional, List, Dict, Any
 
 class TemplateManager:
@@ -8,25 +9,40 @@ class TemplateManager:
     def __init__(self, db: Database):
         self.db = db
 
-    def get_all_templates(self) -> List[Dict[str, Any]]:
-        """Get all templates with related information"""
+    def get_all_templates(self, template_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """Get all templates (or just template_ids) with related information and how many events use each"""
+        where_clause = ''
+        params: List[Any] = []
+        if template_ids is not None:
+            if not template_ids:
+                return []
+            where_clause = f"WHERE t.id IN ({', '.join('?' for _ in template_ids)})"
+            params = list(template_ids)
+
         conn = self.db.get_connection()
         cursor = conn.cursor()
 
-        cursor.execute('''
+        cursor.execute(f'''
             SELECT
                 t.*,
                 et.name as event_type_name,
                 pf.name as format_name,
                 pm.name as pairing_method_name,
-                pa.name as pairing_app_name
+                pa.name as pairing_app_name,
+                COALESCE(ec.event_count, 0) as event_count
             FROM event_templates t
             LEFT JOIN event_types et ON t.event_type_id = et.id
             LEFT JOIN playing_formats pf ON t.playing_format_id = pf.id
             LEFT JOIN pairing_methods pm ON t.pairing_method_id = pm.id
             LEFT JOIN pairing_apps pa ON t.pairing_app_id = pa.id
+            LEFT JOIN (
+                SELECT template_id, COUNT(*) as event_count
+                FROM events
+                GROUP BY template_id
+            ) ec ON ec.template_id = t.id
+            {where_clause}
             ORDER BY t.name
-        ''')
+        ''', params)
 
         templates = [dict(row) for row in cursor.fetchall()]
         conn.close()
@@ -80,6 +96,8 @@ class TemplateManager:
         conn.commit()
         conn.close()
 
+        self.db.invalidate_reference_data('event_templates')
+        self.db.changes.publish('template', template_id, CREATED)
         return template_id
 
     def update_template(self, template_id: int, template_data: Dict[str, Any]):
@@ -111,6 +129,8 @@ class TemplateManager:
 
         conn.commit()
         conn.close()
+        self.db.invalidate_reference_data('event_templates')
+        self.db.changes.publish('template', template_id, UPDATED)
 
     def delete_template(self, template_id: int):
         """Delete a template (cascades to checklist items)"""
@@ -119,6 +139,8 @@ class TemplateManager:
         cursor.execute('DELETE FROM event_templates WHERE id = ?', (template_id,))
         conn.commit()
         conn.close()
+        self.db.invalidate_reference_data('event_templates')
+        self.db.changes.publish('template', template_id, DELETED)
 
     def get_template_checklist_items(self, template_id: int) -> List[Dict[str, Any]]:
         """Get checklist items for a template"""
@@ -176,42 +198,17 @@ class TemplateManager:
 
     def get_checklist_categories(self) -> List[Dict[str, Any]]:
         """Get all checklist categories"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM checklist_categories ORDER BY sort_order')
-        categories = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return categories
+        return self.db.get_reference_rows('checklist_categories')
 
     def get_reference_data(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Get all reference data for dropdowns"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        data = {}
-
-        # Event types
-        cursor.execute('SELECT * FROM event_types ORDER BY name')
-        data['event_types'] = [dict(row) for row in cursor.fetchall()]
-
-        # Playing formats
-        cursor.execute('SELECT * FROM playing_formats ORDER BY name')
-        data['playing_formats'] = [dict(row) for row in cursor.fetchall()]
-
-        # Pairing methods
-        cursor.execute('SELECT * FROM pairing_methods ORDER BY name')
-        data['pairing_methods'] = [dict(row) for row in cursor.fetchall()]
-
-        # Pairing apps
-        cursor.execute('SELECT * FROM pairing_apps ORDER BY name')
-        data['pairing_apps'] = [dict(row) for row in cursor.fetchall()]
-
-        # Checklist categories
-        cursor.execute('SELECT * FROM checklist_categories ORDER BY sort_order')
-        data['checklist_categories'] = [dict(row) for row in cursor.fetchall()]
-
-        conn.close()
-        return data
+        """Get all reference data for dropdowns (served from the reference data cache)"""
+        return {
+            'event_types': self.db.get_reference_rows('event_types'),
+            'playing_formats': self.db.get_reference_rows('playing_formats'),
+            'pairing_methods': self.db.get_reference_rows('pairing_methods'),
+            'pairing_apps': self.db.get_reference_rows('pairing_apps'),
+            'checklist_categories': self.db.get_reference_rows('checklist_categories')
+        }
 
     def count_events_using_template(self, template_id: int) -> int:
         """Count how many events use this template"""
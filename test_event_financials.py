@@ -0,0 +1,124 @@
+"""Test that the event_financials triggers match totals computed from the child tables"""
+import sqlite3
+from database import Database
+from schema_migrations import SCHEMA_VERSION
+
+# event_financials columns computed straight from the child tables
+EXPECTED_QUERY = '''
+    SELECT e.id as event_id,
+           (SELECT COALESCE(SUM(price * COALESCE(quantity_sold, 0)), 0) FROM ticket_tiers WHERE event_id = e.id) as ticket_revenue,
+           (SELECT COALESCE(SUM(quantity_sold), 0) FROM ticket_tiers WHERE event_id = e.id) as tickets_sold,
+           (SELECT COALESCE(SUM(quantity_available), 0) FROM ticket_tiers WHERE event_id = e.id) as ticket_capacity,
+           (SELECT COALESCE(SUM(price * quantity_available), 0) FROM ticket_tiers WHERE event_id = e.id) as max_ticket_revenue,
+           (SELECT COALESCE(SUM(total_cost), 0) FROM labour_costs WHERE event_id = e.id) as labour_cost,
+           (SELECT COALESCE(SUM(total_cost), 0) FROM prize_items WHERE event_id = e.id) as prize_cost,
+           (SELECT COALESCE(SUM(amount), 0) FROM event_costs WHERE event_id = e.id) as other_cost
+    FROM events e
+'''
+COLUMNS = ['ticket_revenue', 'tickets_sold', 'ticket_capacity', 'max_ticket_revenue',
+           'labour_cost', 'prize_cost', 'other_cost']
+
+
+def assert_financials_current(cursor):
+    """Every event's row matches its child tables (no row = all zeros) and no row outlives its event"""
+    cursor.execute(EXPECTED_QUERY)
+    expected = {row['event_id']: [row[c] for c in COLUMNS] for row in cursor.fetchall()}
+    cursor.execute('SELECT * FROM event_financials')
+    stored = {row['event_id']: [row[c] for c in COLUMNS] for row in cursor.fetchall()}
+
+    assert set(stored) <= set(expected), f"Rows for deleted events: {set(stored) - set(expected)}"
+    for event_id, values in expected.items():
+        assert stored.get(event_id, [0] * len(COLUMNS)) == values, f"Event {event_id}"
+
+
+def add_event(cursor, name: str) -> int:
+    cursor.execute("INSERT INTO events (event_name, event_date) VALUES (?, '2026-05-01')", (name,))
+    return cursor.lastrowid
+
+
+def add_children(cursor, event_id: int):
+    cursor.execute('''
+        INSERT INTO ticket_tiers (event_id, tier_name, price, quantity_available, quantity_sold)
+        VALUES (?, 'Regular', 15, 20, 12), (?, 'Early Bird', 10, 10, NULL)
+    ''', (event_id, event_id))
+    cursor.execute('INSERT INTO labour_costs (event_id, total_cost) VALUES (?, 80), (?, NULL)', (event_id, event_id))
+    cursor.execute("INSERT INTO prize_items (event_id, description, total_cost) VALUES (?, 'Booster Box', 150)",
+                   (event_id,))
+    cursor.execute("INSERT INTO event_costs (event_id, description, amount) VALUES (?, 'Venue', 40)", (event_id,))
+
+
+def test_triggers_keep_financials_current(db):
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    first = add_event(cursor, 'Prerelease')
+    second = add_event(cursor, 'Draft Night')
+
+    # Insert
+    add_children(cursor, first)
+    assert_financials_current(cursor)
+    cursor.execute('SELECT ticket_revenue, labour_cost FROM event_financials WHERE event_id = ?', (first,))
+    assert tuple(cursor.fetchone()) == (180, 80)
+
+    # Update
+    cursor.execute('UPDATE ticket_tiers SET quantity_sold = 8 WHERE event_id = ?', (first,))
+    cursor.execute('UPDATE labour_costs SET total_cost = 25 WHERE total_cost IS NULL')
+    cursor.execute('UPDATE prize_items SET total_cost = 90')
+    cursor.execute('UPDATE event_costs SET amount = 55')
+    assert_financials_current(cursor)
+
+    # A row moved to another event recomputes both events
+    for table in ('ticket_tiers', 'labour_costs', 'prize_items', 'event_costs'):
+        cursor.execute(f'UPDATE {table} SET event_id = ? WHERE id = (SELECT MIN(id) FROM {table})', (second,))
+        assert_financials_current(cursor)
+    cursor.execute('SELECT prize_cost, other_cost FROM event_financials WHERE event_id = ?', (first,))
+    assert tuple(cursor.fetchone()) == (0, 0)
+
+    # Delete
+    for table in ('ticket_tiers', 'labour_costs', 'prize_items', 'event_costs'):
+        cursor.execute(f'DELETE FROM {table} WHERE event_id = ?', (second,))
+        assert_financials_current(cursor)
+
+    # Deleting the event removes its row, and its leftover children don't bring it back
+    add_children(cursor, second)
+    cursor.execute('DELETE FROM events WHERE id = ?', (second,))
+    cursor.execute('SELECT COUNT(*) FROM event_financials WHERE event_id = ?', (second,))
+    assert cursor.fetchone()[0] == 0
+    cursor.execute('DELETE FROM ticket_tiers WHERE event_id = ?', (second,))
+    assert_financials_current(cursor)
+
+    conn.commit()
+    conn.close()
+
+
+def test_migration_backfills_existing_events(tmp_path):
+    """Upgrading a version 6 database fills in a row for every existing event"""
+    path = str(tmp_path / 'test.db')
+    Database(path).close()
+
+    # Turn the new database back into a version 6 one, then add data without the triggers
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_financials_%'")
+    for (name,) in cursor.fetchall():
+        cursor.execute(f'DROP TRIGGER {name}')
+    cursor.execute('DROP TABLE event_financials')
+    cursor.execute('DELETE FROM schema_migrations WHERE version >= 7')
+    cursor.execute('PRAGMA user_version = 6')
+    event_ids = [add_event(cursor, f"Event {n}") for n in range(3)]
+    for event_id in event_ids[:2]:
+        add_children(cursor, event_id)
+    conn.commit()
+    conn.close()
+
+    db = Database(path)
+    try:
+        assert db.get_schema_version() == SCHEMA_VERSION
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT COUNT(*) FROM event_financials')
+        assert cursor.fetchone()[0] == len(event_ids)
+        assert_financials_current(cursor)
+        conn.close()
+    finally:
+        db.close()
@@ -0,0 +1,104 @@
+"""Test that the events list query count doesn't grow with the number of events"""
+from database import Database
+from event_manager import EventManager
+
+
+def count_queries(db: Database, func, *args):
+    """Run func and return (result, number of SELECT statements it executed)"""
+    statements = []
+    conn = db.get_connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        result = func(*args)
+    finally:
+        conn.set_trace_callback(None)
+        conn.close()
+    selects = [s for s in statements if s.lstrip().upper().startswith(('SELECT', 'WITH'))]
+    return result, len(selects)
+
+
+def add_events(db: Database, count: int, items_per_event: int = 5):
+    """Add events that each have a few incomplete (and one completed) checklist items"""
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    for n in range(count):
+        cursor.execute('INSERT INTO events (event_name, event_date) VALUES (?, ?)',
+                       (f"Event {n}", f"2026-01-{n % 28 + 1:02d}"))
+        event_id = cursor.lastrowid
+        cursor.executemany('''
+            INSERT INTO event_checklist_items (event_id, description, sort_order, is_completed)
+            VALUES (?, ?, ?, ?)
+        ''', [(event_id, f"Task {i}", i, 1 if i == 0 else 0) for i in range(items_per_event)])
+    conn.commit()
+    conn.close()
+
+
+def test_event_list_query_count_is_constant(db):
+    """Loading 5 or 100 events runs the same number of queries"""
+    manager = EventManager(db)
+    # Warm the reference data cache so only the events queries are counted
+    manager.get_events_page('past')
+
+    add_events(db, 5)
+    (small, _), small_queries = count_queries(db, manager.get_events_page, 'past', None, 100)
+
+    add_events(db, 95)
+    (large, _), large_queries = count_queries(db, manager.get_events_page, 'past', None, 100)
+
+    assert len(small) == 5 and len(large) == 100
+    assert small_queries == large_queries
+
+    # Summary matches the per-event query it replaces: 4 incomplete, first 3 shown
+    event = large[0]
+    assert event['todo_count'] == 4
+    assert event['todo_items'] == ['Task 1', 'Task 2', 'Task 3']
+
+
+def test_event_pages_cover_every_event_once(db):
+    """Keyset pages run a fixed number of queries and return each event exactly once"""
+    manager = EventManager(db)
+    add_events(db, 120)
+    # Warm the reference data cache so only the events queries are counted
+    manager.get_events_page('past')
+
+    seen = []
+    cursor = None
+    while True:
+        page, page_queries = count_queries(db, manager.get_events_page, 'past', cursor, 25)
+        events, cursor = page
+        seen.extend(events)
+        assert page_queries <= 2
+        if cursor is None:
+            break
+
+    keys = [(event['event_date'], event['id']) for event in seen]
+    assert len(keys) == 120
+    assert keys == sorted(keys, reverse=True)
+    assert all(event['todo_count'] == 4 for event in seen)
+
+
+
+def test_upcoming_keeps_overdue_events_until_completed(db):
+    """Past events that were never completed page in ahead of future ones; completed ones don't"""
+    manager = EventManager(db)
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    cursor.executemany('INSERT INTO events (event_name, event_date, is_completed) VALUES (?, ?, ?)', [
+        ('Overdue Prerelease', '2026-01-10', 0),
+        ('Finished Draft', '2026-01-05', 1),
+    ] + [(f"Future {n}", f"2099-01-{n + 1:02d}", 0) for n in range(7)])
+    conn.commit()
+    conn.close()
+
+    seen = []
+    cursor = None
+    while True:
+        events, cursor = manager.get_events_page('upcoming', cursor, 3)
+        seen.extend(events)
+        if cursor is None:
+            break
+
+    names = [event['event_name'] for event in seen]
+    assert names[0] == 'Overdue Prerelease'
+    assert 'Finished Draft' not in names
+    assert len(names) == len(set(names)) == 8
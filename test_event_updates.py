@@ -0,0 +1,21 @@
+"""Test that saving an event only overwrites the fields the caller supplied"""
+from event_manager import EventManager
+
+
+def test_update_keeps_include_attendees_when_not_supplied(db):
+    """The event dialog leaves include_attendees out until its Players tab is built"""
+    manager = EventManager(db)
+    event_id = manager.create_event({
+        'event_name': 'Draft Night', 'event_date': '2026-03-01', 'include_attendees': 1,
+    })
+
+    # Saved from the Details tab only
+    manager.update_event(event_id, {'event_name': 'Draft Night (Renamed)', 'event_date': '2026-03-01'})
+    event = manager.get_event_by_id(event_id)
+    assert event['event_name'] == 'Draft Night (Renamed)'
+    assert event['include_attendees'] == 1
+
+    # Saved after the Players tab was opened and the box unticked
+    manager.update_event(event_id, {'event_name': 'Draft Night', 'event_date': '2026-03-01',
+                                    'include_attendees': False})
+    assert manager.get_event_by_id(event_id)['include_attendees'] == 0
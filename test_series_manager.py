@@ -0,0 +1,135 @@
+"""Test recurring event series dates and that extending or regenerating never duplicates events"""
+import pytest
+from series_manager import SeriesManager, generate_series_dates
+
+# Series dates are in 2030, far enough ahead that regenerate_series treats them all as upcoming
+MONDAY, WEDNESDAY, THURSDAY, FRIDAY = 0, 2, 3, 4
+
+
+@pytest.fixture
+def template_id(db):
+    """A template for the series to use"""
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO event_templates (name) VALUES ('Commander Night')")
+    template_id = cursor.lastrowid
+    conn.commit()
+    conn.close()
+    return template_id
+
+
+def series_dates(manager: SeriesManager, series_id: int):
+    return [event['event_date'] for event in manager.get_series_events(series_id)]
+
+
+def test_fortnightly_weeks_are_counted_from_the_series_start():
+    """A range starting mid-series keeps the series' alternate weeks"""
+    dates = generate_series_dates('fortnightly', MONDAY, '2030-01-01', '2030-01-14', '2030-03-10')
+    assert [d.isoformat() for d in dates] == ['2030-01-21', '2030-02-04', '2030-02-18', '2030-03-04']
+
+
+def test_monthly_nth_and_last_weekday():
+    second_tuesday = generate_series_dates('monthly', 1, '2030-01-01', '2030-01-01', '2030-03-31', week_of_month=2)
+    assert [d.isoformat() for d in second_tuesday] == ['2030-01-08', '2030-02-12', '2030-03-12']
+
+    last_friday = generate_series_dates('monthly', FRIDAY, '2030-01-01', '2030-01-01', '2030-03-31', week_of_month=-1)
+    assert [d.isoformat() for d in last_friday] == ['2030-01-25', '2030-02-22', '2030-03-29']
+
+
+def test_closed_days_are_skipped_and_date_specific_hours_win(db, template_id):
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    # Closed on Wednesdays except 16 January; open Thursdays except 17 January
+    cursor.execute('UPDATE operating_hours SET is_open = 0 WHERE day_of_week = ?', (WEDNESDAY,))
+    cursor.execute("INSERT INTO date_specific_hours (specific_date, is_open) VALUES ('2030-01-16', 1)")
+    cursor.execute("INSERT INTO date_specific_hours (specific_date, is_open) VALUES ('2030-01-17', 0)")
+    conn.commit()
+    conn.close()
+
+    manager = SeriesManager(db)
+    base = {'template_id': template_id, 'recurrence': 'weekly',
+            'start_date': '2030-01-01', 'end_date': '2030-01-31'}
+    wednesdays = manager.create_series(dict(base, series_name='Wednesdays', weekday=WEDNESDAY))
+    thursdays = manager.create_series(dict(base, series_name='Thursdays', weekday=THURSDAY))
+    unskipped = manager.create_series(dict(base, series_name='Every Wednesday', weekday=WEDNESDAY,
+                                           skip_closed_days=0))
+
+    assert series_dates(manager, wednesdays) == ['2030-01-16']
+    assert series_dates(manager, thursdays) == ['2030-01-03', '2030-01-10', '2030-01-24', '2030-01-31']
+    assert len(series_dates(manager, unskipped)) == 5
+
+
+def test_extend_and_regenerate_never_duplicate_events(db, template_id):
+    manager = SeriesManager(db)
+    series_data = {'template_id': template_id, 'series_name': 'Wednesdays', 'recurrence': 'weekly',
+                   'weekday': WEDNESDAY, 'start_date': '2030-01-01', 'end_date': '2030-01-31',
+                   'start_time': '18:00', 'end_time': '22:00'}
+    series_id = manager.create_series(series_data)
+    assert series_dates(manager, series_id) == [
+        '2030-01-02', '2030-01-09', '2030-01-16', '2030-01-23', '2030-01-30']
+    assert manager.get_series_events(series_id)[0]['start_time'] == '18:00:00'
+
+    created = manager.extend_series(series_id, '2030-02-14')
+    assert len(created) == 2
+    assert series_dates(manager, series_id)[-2:] == ['2030-02-06', '2030-02-13']
+
+    # Re-running over the whole range creates nothing
+    assert manager.materialize_series(series_id) == []
+    assert manager.regenerate_series(series_id) == {'created': 0, 'removed': 0}
+
+    # A date deleted by hand doesn't come back
+    conn = db.get_connection()
+    conn.execute("UPDATE events SET is_deleted = 1 WHERE series_id = ? AND event_date = '2030-01-09'",
+                 (series_id,))
+    conn.commit()
+    conn.close()
+    assert manager.regenerate_series(series_id) == {'created': 0, 'removed': 0}
+    assert '2030-01-09' not in series_dates(manager, series_id)
+
+    # Changing the rule swaps the upcoming events over, once
+    result = manager.update_series(series_id, dict(series_data, weekday=THURSDAY, end_date='2030-02-14'))
+    assert result == {'created': 7, 'removed': 6}
+    assert series_dates(manager, series_id) == [
+        '2030-01-03', '2030-01-10', '2030-01-17', '2030-01-24', '2030-01-31', '2030-02-07', '2030-02-14']
+    assert manager.regenerate_series(series_id) == {'created': 0, 'removed': 0}
+
+
+def test_series_times_must_be_valid(db, template_id):
+    manager = SeriesManager(db)
+    series_data = {'template_id': template_id, 'series_name': 'Fridays', 'recurrence': 'weekly',
+                   'weekday': FRIDAY, 'start_date': '2030-01-01', 'end_date': '2030-01-31',
+                   'start_time': '6pm'}
+    try:
+        manager.create_series(series_data)
+    except ValueError as e:
+        assert 'Start time' in str(e)
+    else:
+        raise AssertionError("Invalid start time was accepted")
+    assert manager.get_all_series() == []
+
+
+def test_updating_a_series_renames_and_retimes_upcoming_events(db, template_id):
+    manager = SeriesManager(db)
+    series_data = {'template_id': template_id, 'series_name': 'Fridays', 'recurrence': 'weekly',
+                   'weekday': FRIDAY, 'start_date': '2030-01-01', 'end_date': '2030-01-31',
+                   'start_time': '18:00', 'end_time': '22:00'}
+    series_id = manager.create_series(series_data)
+
+    # A completed event keeps the details it ran with
+    conn = db.get_connection()
+    conn.execute("UPDATE events SET is_completed = 1 WHERE series_id = ? AND event_date = '2030-01-04'",
+                 (series_id,))
+    conn.commit()
+    conn.close()
+
+    result = manager.update_series(series_id, dict(series_data, series_name='Friday Night Magic',
+                                                   start_time='18:30', end_time='23:00'))
+    assert result == {'created': 0, 'removed': 0}
+
+    events = {event['event_date']: event for event in manager.get_series_events(series_id)}
+    assert len(events) == 4
+    assert (events['2030-01-04']['event_name'], events['2030-01-04']['start_time']) == ('Fridays', '18:00:00')
+    for event_date in ('2030-01-11', '2030-01-18', '2030-01-25'):
+        event = events[event_date]
+        assert (event['event_name'], event['start_time'], event['end_time']) == (
+            'Friday Night Magic', '18:30:00', '23:00:00')
@@ -0,0 +1,108 @@
+"""Cache of the main window's top-level views"""
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import customtkinter as ctk
+
+
+class ViewCache:
+    """Keeps sidebar views alive so switching between them is instant
+
+    Views are built once, hidden with pack_forget() when another view is shown
+    and packed again when they are revisited. A view is only reloaded when
+    get_version() (the database's data_version) has changed since it was last
+    shown: views with a refresh() method are refreshed in place, others are
+    rebuilt.
+
+    Hidden views still hold their widgets, so the cache is capped: when there
+    are more than max_views views, or the hidden views hold more than
+    widget_budget widgets between them, the least recently used views are
+    destroyed.
+    """
+
+    def __init__(self, main_frame: ctk.CTkFrame, get_version: Callable[[], int],
+                 max_views: int = 6, widget_budget: int = 5000):
+        self.main_frame = main_frame
+        self.get_version = get_version
+        self.max_views = max_views
+        self.widget_budget = widget_budget
+
+        # name -> {'view', 'version', 'widgets'}, least recently used first
+        self.entries: "OrderedDict[str, dict]" = OrderedDict()
+        self.current_name: Optional[str] = None
+
+    @property
+    def current_view(self):
+        entry = self.entries.get(self.current_name)
+        return entry['view'] if entry else None
+
+    def show(self, name: str, create_view: Callable[[], ctk.CTkFrame]) -> ctk.CTkFrame:
+        """Show the named view, building it with create_view() if it isn't cached"""
+        if name != self.current_name:
+            self._hide_current()
+
+        version = self.get_version()
+        entry = self.entries.get(name)
+
+        if entry and entry['version'] != version:
+            if hasattr(entry['view'], 'refresh'):
+                entry['view'].refresh()
+                entry['version'] = version
+            else:
+                self._destroy(name)
+                entry = None
+
+        if entry is None:
+            entry = {'view': create_view(), 'version': version, 'widgets': 0}
+            self.entries[name] = entry
+
+        # Packed even if it's already current, in case a navigation sub-view had hidden it
+        self.entries.move_to_end(name)
+        entry['view'].pack(fill="both", expand=True)
+        self.current_name = name
+
+        self._evict()
+        return entry['view']
+
+    def discard(self, name: Optional[str] = None):
+        """Destroy a cached view (all of them if no name is given)"""
+        names = [name] if name else list(self.entries)
+        for view_name in names:
+            if view_name in self.entries:
+                self._destroy(view_name)
+
+    def _hide_current(self):
+        entry = self.entries.get(self.current_name)
+        self.current_name = None
+        if entry is None:
+            return
+        entry['view'].pack_forget()
+        entry['widgets'] = count_widgets(entry['view'])
+
+    def _destroy(self, name: str):
+        entry = self.entries.pop(name)
+        if name == self.current_name:
+            self.current_name = None
+        entry['view'].destroy()
+
+    def _evict(self):
+        """Destroy least recently used hidden views until the cache fits its caps"""
+        hidden = [name for name in self.entries if name != self.current_name]
+        widgets = sum(self.entries[name]['widgets'] for name in hidden)
+
+        for name in hidden:
+            if len(self.entries) <= self.max_views and widgets <= self.widget_budget:
+                break
+            widgets -= self.entries[name]['widgets']
+            self._destroy(name)
+
+
+def count_widgets(widget) -> int:
+    """Number of Tk widgets under (and including) a widget"""
+    count = 1
+    stack = list(widget.winfo_children())
+    while stack:
+        child = stack.pop()
+        count += 1
+        stack.extend(child.winfo_children())
+    return count
@@ -1,11 +1,21 @@
 """Analysis View - Post-event analysis and insights"""
 import customtkinter as ctk
-from datetime import datetime, timedelta
-from typing import Optional
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
+import io
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+import analytics_rollup
+from analytics_engine import AnalyticsEngine
+from chart_renderer import TREND_DETAILS, TrendChartRenderer, build_trend_figure
+
+PERIOD_DAYS = {
+    "Last 7 Days": 7,
+    "Last 30 Days": 30,
+    "Last 90 Days": 90,
+    "Last 6 Months": 180,
+    "Last Year": 365
+}
+COMPARISONS = ["No Comparison", "Previous Period", "Same Period Last Year"]
+
 
 class AnalysisView(ctk.CTkFrame):
     """View for post-event analysis and metrics"""
@@ -13,6 +23,8 @@ class AnalysisView(ctk.CTkFrame):
     def __init__(self, parent, database, **kwargs):
         super().__init__(parent, **kwargs)
         self.db = database
+        self.engine = AnalyticsEngine(database)
+        self.charts = TrendChartRenderer()
 
         # Title
         title = ctk.CTkLabel(
@@ -35,13 +47,16 @@ class AnalysisView(ctk.CTkFrame):
         ).pack(side="left", padx=(0, 10))
 
         self.period_var = ctk.StringVar(value="Last 30 Days")
-        periods = ["Last 7 Days", "Last 30 Days", "Last 90 Days", "Last 6 Months", "Last Year", "All Time"]
+        self.trend_detail_var = ctk.StringVar(value="Auto")
+        self.compare_var = ctk.StringVar(value="No Comparison")
+        self.period_label = ""
+        periods = list(PERIOD_DAYS) + ["All Time", "Custom Range"]
 
         self.period_menu = ctk.CTkOptionMenu(
             period_frame,
             variable=self.period_var,
             values=periods,
-            command=lambda _: self.refresh_analysis(),
+            command=self.on_period_selected,
             fg_color="#C5A8D9",
             button_color="#B491CC",
             button_hover_color="#A380BB",
@@ -61,6 +76,31 @@ class AnalysisView(ctk.CTkFrame):
             width=100
         ).pack(side="left", padx=(20, 0))
 
+        # Comparison selector
+        ctk.CTkLabel(
+            period_frame,
+            text="Compare To:",
+            font=ctk.CTkFont(size=15, weight="bold"),
+            text_color="#4A2D5E"
+        ).pack(side="left", padx=(30, 10))
+
+        ctk.CTkOptionMenu(
+            period_frame,
+            variable=self.compare_var,
+            values=COMPARISONS,
+            command=lambda _: self.refresh_analysis(),
+            fg_color="#C5A8D9",
+            button_color="#B491CC",
+            button_hover_color="#A380BB",
+            text_color="#4A2D5E",
+            width=190
+        ).pack(side="left")
+
+        # Custom range (shown when "Custom Range" is picked; date pickers made then)
+        self.custom_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.custom_start = None
+        self.custom_end = None
+
         # Scrollable content frame
         self.scroll_frame = ctk.CTkScrollableFrame(self, fg_color="white")
         self.scroll_frame.pack(fill="both", expand=True, padx=30, pady=(0, 30))
@@ -68,85 +108,239 @@ class AnalysisView(ctk.CTkFrame):
         # Load analysis
         self.refresh_analysis()
 
-    def get_date_range(self) -> Optional[str]:
-        """Get SQL date filter based on selected period"""
+    def on_period_selected(self, period: str):
+        """Refresh for a fixed period, or show the date pickers for a custom one"""
+        if period != "Custom Range":
+            self.custom_frame.pack_forget()
+            self.refresh_analysis()
+            return
+
+        if self.custom_start is None:
+            from tkcalendar import DateEntry
+
+            for label, attr, default in (("From:", 'custom_start', date.today() - timedelta(days=30)),
+                                         ("To:", 'custom_end', date.today())):
+                ctk.CTkLabel(
+                    self.custom_frame,
+                    text=label,
+                    font=ctk.CTkFont(size=15, weight="bold"),
+                    text_color="#4A2D5E"
+                ).pack(side="left", padx=(0, 10))
+                entry = DateEntry(self.custom_frame, selectmode='day', date_pattern='yyyy-mm-dd',
+                                  background='#8B5FBF', foreground='white', borderwidth=2)
+                entry.set_date(default)
+                entry.pack(side="left", padx=(0, 20))
+                setattr(self, attr, entry)
+
+            ctk.CTkButton(
+                self.custom_frame,
+                text="Apply",
+                command=self.refresh_analysis,
+                fg_color="#8B5FBF",
+                hover_color="#7A4FB0",
+                text_color="white",
+                width=100
+            ).pack(side="left")
+
+        self.custom_frame.pack(fill="x", padx=30, pady=(0, 20), before=self.scroll_frame)
+        self.refresh_analysis()
+
+    def get_period(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get the selected period as (start, end) dates (YYYY-MM-DD, inclusive); None leaves that end open"""
         period = self.period_var.get()
 
         if period == "All Time":
+            return None, None
+
+        if period == "Custom Range":
+            start, end = sorted([self.custom_start.get_date(), self.custom_end.get_date()])
+            return start.isoformat(), end.isoformat()
+
+        days = PERIOD_DAYS.get(period, 30)
+        return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d'), None
+
+    def get_comparison_period(self, start: Optional[str], end: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Get the (start, end) of the period to compare with, None when not comparing
+
+        An open-ended period is taken to run to today.
+        """
+        mode = self.compare_var.get()
+        if mode == "No Comparison" or start is None:
             return None
 
-        days_map = {
-            "Last 7 Days": 7,
-            "Last 30 Days": 30,
-            "Last 90 Days": 90,
-            "Last 6 Months": 180,
-            "Last Year": 365
-        }
+        first = datetime.strptime(start, '%Y-%m-%d').date()
+        last = datetime.strptime(end, '%Y-%m-%d').date() if end else date.today()
+
+        if mode == "Previous Period":
+            length = last - first + timedelta(days=1)
+            return (first - length).isoformat(), (first - timedelta(days=1)).isoformat()
+
+        def year_earlier(day: date) -> date:
+            try:
+                return day.replace(year=day.year - 1)
+            except ValueError:  # 29 February
+                return day.replace(year=day.year - 1, day=28)
 
-        days = days_map.get(period, 30)
-        date_threshold = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-        return f"event_date >= '{date_threshold}'"
+        # A range longer than a year would overlap its comparison, so stop that the day before
+        return year_earlier(first).isoformat(), min(year_earlier(last), first - timedelta(days=1)).isoformat()
+
+    def get_period_label(self, start: Optional[str], end: Optional[str]) -> str:
+        """Describe the selected period (the dates for a custom range)"""
+        period = self.period_var.get()
+        if period != "Custom Range":
+            return period
+        start_text = datetime.strptime(start, '%Y-%m-%d').strftime('%d %b %Y')
+        end_text = datetime.strptime(end, '%Y-%m-%d').strftime('%d %b %Y')
+        return f"{start_text} to {end_text}"
+
+    def refresh(self):
+        """Reload the view's data (called when a cached view is shown again)"""
+        self.refresh_analysis()
 
     def refresh_analysis(self):
-        """Refresh all analysis data"""
+        """Refresh all analysis data
+
+        The queries run on the database worker and a loading message is shown
+        until they finish; picking another period before then drops the
+        earlier request.
+        """
         # Clear existing widgets
         for widget in self.scroll_frame.winfo_children():
             widget.destroy()
 
-        date_filter = self.get_date_range()
-        where_clause = f"WHERE {date_filter}" if date_filter else ""
-        where_completed = f"WHERE is_completed = 1 AND {date_filter}" if date_filter else "WHERE is_completed = 1"
+        ctk.CTkLabel(
+            self.scroll_frame,
+            text="Loading analysis...",
+            font=ctk.CTkFont(size=15),
+            text_color="#999999"
+        ).pack(pady=40)
+
+        start, end = self.get_period()
+        period = self.get_period_label(start, end)
+        self.db.worker.run(
+            self, self.load_analysis, start, end, self.get_comparison_period(start, end),
+            on_done=lambda data: self.show_analysis(period, data),
+            on_error=self.show_load_error,
+            key=(str(self), 'analysis')
+        )
+
+    def load_analysis(self, start_date: Optional[str], end_date: Optional[str] = None,
+                      comparison: Optional[Tuple[str, str]] = None) -> dict:
+        """Run the analysis queries (called on the database worker, so no widgets here)
+
+        Event counts come from the analytics rollup. KPIs, the per-type table,
+        capacity, top events and the trends are computed from the analytics
+        engine's in-memory snapshot, which is only re-read after the database
+        changes; the remaining breakdowns are still queried. When comparing,
+        both periods' totals come from one query.
+        """
+        # The same SQL text for every period, so SQLite's statement cache can reuse the plans
+        period = {'start': start_date, 'end': end_date}
+        in_period = "(:start IS NULL OR e.event_date >= :start) AND (:end IS NULL OR e.event_date <= :end)"
 
         conn = self.db.get_connection()
         cursor = conn.cursor()
 
-        # Check if we have any completed events
-        cursor.execute(f"SELECT COUNT(*) as count FROM events {where_completed}")
-        completed_count = cursor.fetchone()['count']
+        counts = analytics_rollup.summarise(analytics_rollup.get_rollup_rows(cursor, start_date, end_date))
+        data = {'completed_count': counts['completed_count'], 'event_stats': counts['event_stats']}
+
+        if data['completed_count'] == 0:
+            conn.close()
+            return data
+
+        if comparison:
+            totals = analytics_rollup.get_period_totals(cursor, (start_date, end_date), comparison)
+            data['comparison'] = {
+                'period': comparison,
+                'current': analytics_rollup.summarise_totals(totals['current']),
+                'previous': analytics_rollup.summarise_totals(totals['comparison']),
+            }
+
+        data.update(self.engine.summarise(start_date, end_date))
+
+        # Cost breakdown
+        cursor.execute(f'''
+            SELECT
+                cc.name as category,
+                COUNT(ec.id) as count,
+                SUM(ec.amount) as total_cost,
+                AVG(ec.amount) as avg_cost
+            FROM event_costs ec
+            JOIN cost_categories cc ON ec.category_id = cc.id
+            JOIN events e ON ec.event_id = e.id
+            WHERE e.is_completed = 1 AND {in_period}
+            GROUP BY cc.name
+            ORDER BY total_cost DESC
+        ''', period)
+        data['cost_breakdown'] = [dict(row) for row in cursor.fetchall()]
+
+        # Ticket tier performance
+        cursor.execute(f'''
+            SELECT
+                tt.tier_name,
+                COUNT(DISTINCT tt.event_id) as events_used,
+                SUM(tt.quantity_sold) as total_sold,
+                AVG(tt.price) as avg_price,
+                SUM(tt.quantity_sold * tt.price) as total_revenue,
+                AVG(tt.quantity_sold * 100.0 / NULLIF(tt.quantity_available, 0)) as avg_sell_through
+            FROM ticket_tiers tt
+            JOIN events e ON tt.event_id = e.id
+            WHERE e.is_completed = 1 AND {in_period}
+            GROUP BY tt.tier_name
+            ORDER BY total_revenue DESC
+        ''', period)
+        data['ticket_performance'] = [dict(row) for row in cursor.fetchall()]
+
+        # Cancelled events
+        cursor.execute(f'''
+            SELECT
+                e.event_name,
+                e.event_date,
+                et.name as event_type,
+                e.cancelled_date,
+                e.cancellation_reason
+            FROM events e
+            LEFT JOIN event_types et ON e.event_type_id = et.id
+            WHERE e.is_cancelled = 1 AND {in_period}
+            ORDER BY e.cancelled_date DESC
+        ''', period)
+        data['cancelled_events'] = [dict(row) for row in cursor.fetchall()]
+
+        conn.close()
+        return data
+
+    def show_load_error(self, error: BaseException):
+        """Replace the loading message with an error"""
+        for widget in self.scroll_frame.winfo_children():
+            widget.destroy()
+        print(f"[ANALYSIS] Failed to load analysis: {error}")
+        self.create_empty_message(f"Could not load analysis: {error}")
+
+    def show_analysis(self, period: str, data: dict):
+        """Build the analysis widgets from load_analysis() results"""
+        for widget in self.scroll_frame.winfo_children():
+            widget.destroy()
+        self.period_label = period
 
+        completed_count = data['completed_count']
         if completed_count == 0:
             ctk.CTkLabel(
                 self.scroll_frame,
-                text=f"No completed events found for {self.period_var.get()}.\n\nMark events as completed to see analysis here.",
+                text=f"No completed events found for {period}.\n\nMark events as completed to see analysis here.",
                 font=ctk.CTkFont(size=15),
                 text_color="#999999"
             ).pack(pady=40)
-            conn.close()
             return
 
         # === TREND GRAPHS ===
         self.create_section_header("Trends Over Time")
-        self.create_trend_graphs(cursor, where_completed)
+        self.create_trend_graphs(data['time_series'])
 
         # === KEY PERFORMANCE INDICATORS ===
         self.create_section_header("Key Performance Indicators")
 
-        # Get KPI data
-        cursor.execute(f'''
-            SELECT
-                COUNT(*) as total_events,
-                SUM(CASE WHEN is_cancelled = 1 THEN 1 ELSE 0 END) as cancelled_events
-            FROM events
-            {where_clause}
-        ''')
-        event_stats = dict(cursor.fetchone())
-
-        cursor.execute(f'''
-            SELECT
-                COALESCE(SUM(actual_attendance), 0) as total_attendance,
-                COALESCE(AVG(actual_attendance), 0) as avg_attendance,
-                COALESCE(SUM(revenue_total), 0) as total_revenue,
-                COALESCE(AVG(revenue_total), 0) as avg_revenue,
-                COALESCE(SUM(cost_total), 0) as total_costs,
-                COALESCE(SUM(profit_margin), 0) as total_profit,
-                COALESCE(AVG(attendee_satisfaction), 0) as avg_satisfaction,
-                COALESCE(AVG(event_smoothness), 0) as avg_smoothness,
-                COALESCE(AVG(overall_success_score), 0) as avg_overall_success
-            FROM event_analysis ea
-            JOIN events e ON ea.event_id = e.id
-            {where_completed}
-        ''')
-        kpi_data = dict(cursor.fetchone())
+        event_stats = data['event_stats']
+        kpi_data = data['kpi']
 
         # Calculate averages
         avg_revenue_per_attendee = 0
@@ -199,26 +393,14 @@ class AnalysisView(ctk.CTkFrame):
         for col in range(3):
             kpi_frame.grid_columnconfigure(col, weight=1, uniform="kpi")
 
+        # === PERIOD COMPARISON ===
+        if 'comparison' in data:
+            self.create_comparison_table(data['comparison'])
+
         # === EVENT TYPE PERFORMANCE ===
         self.create_section_header("Performance by Event Type")
 
-        cursor.execute(f'''
-            SELECT
-                et.name as event_type,
-                COUNT(DISTINCT e.id) as event_count,
-                COALESCE(SUM(ea.actual_attendance), 0) as total_attendance,
-                COALESCE(AVG(ea.actual_attendance), 0) as avg_attendance,
-                COALESCE(SUM(ea.revenue_total), 0) as total_revenue,
-                COALESCE(AVG(ea.revenue_total), 0) as avg_revenue,
-                COALESCE(AVG(ea.attendee_satisfaction), 0) as avg_rating
-            FROM events e
-            LEFT JOIN event_types et ON e.event_type_id = et.id
-            LEFT JOIN event_analysis ea ON e.id = ea.event_id
-            {where_completed}
-            GROUP BY et.name
-            ORDER BY total_revenue DESC
-        ''')
-        type_performance = cursor.fetchall()
+        type_performance = data['type_performance']
 
         if type_performance:
             self.create_data_table(
@@ -242,26 +424,7 @@ class AnalysisView(ctk.CTkFrame):
         # === CAPACITY UTILIZATION ===
         self.create_section_header("Capacity Utilization")
 
-        cursor.execute(f'''
-            SELECT
-                e.event_name,
-                e.event_date,
-                COALESCE(SUM(tt.quantity_available), 0) as tickets_available,
-                ea.actual_attendance,
-                CASE
-                    WHEN COALESCE(SUM(tt.quantity_available), 0) > 0
-                    THEN (ea.actual_attendance * 100.0 / SUM(tt.quantity_available))
-                    ELSE 0
-                END as utilization_percent
-            FROM events e
-            JOIN event_analysis ea ON e.id = ea.event_id
-            LEFT JOIN ticket_tiers tt ON e.id = tt.event_id
-            {where_completed}
-            GROUP BY e.id, e.event_name, e.event_date, ea.actual_attendance
-            ORDER BY utilization_percent DESC
-            LIMIT 10
-        ''')
-        capacity_data = cursor.fetchall()
+        capacity_data = data['capacity']
 
         if capacity_data:
             self.create_data_table(
@@ -283,25 +446,7 @@ class AnalysisView(ctk.CTkFrame):
         # === TOP PERFORMING EVENTS ===
         self.create_section_header("Top 10 Events by Revenue")
 
-        cursor.execute(f'''
-            SELECT
-                e.event_name,
-                e.event_date,
-                et.name as event_type,
-                ea.actual_attendance,
-                ea.revenue_total,
-                ea.profit_margin,
-                ea.attendee_satisfaction as satisfaction,
-                ea.event_smoothness,
-                ea.overall_success_score
-            FROM events e
-            LEFT JOIN event_types et ON e.event_type_id = et.id
-            JOIN event_analysis ea ON e.id = ea.event_id
-            {where_completed}
-            ORDER BY ea.revenue_total DESC
-            LIMIT 10
-        ''')
-        top_events = cursor.fetchall()
+        top_events = data['top_events']
 
         if top_events:
             self.create_data_table(
@@ -327,20 +472,7 @@ class AnalysisView(ctk.CTkFrame):
         # === COST BREAKDOWN ===
         self.create_section_header("Cost Analysis by Category")
 
-        cursor.execute(f'''
-            SELECT
-                cc.name as category,
-                COUNT(ec.id) as count,
-                SUM(ec.amount) as total_cost,
-                AVG(ec.amount) as avg_cost
-            FROM event_costs ec
-            JOIN cost_categories cc ON ec.category_id = cc.id
-            JOIN events e ON ec.event_id = e.id
-            {where_completed}
-            GROUP BY cc.name
-            ORDER BY total_cost DESC
-        ''')
-        cost_breakdown = cursor.fetchall()
+        cost_breakdown = data['cost_breakdown']
 
         if cost_breakdown:
             self.create_data_table(
@@ -361,21 +493,7 @@ class AnalysisView(ctk.CTkFrame):
         # === TICKET TIER ANALYSIS ===
         self.create_section_header("Ticket Tier Performance")
 
-        cursor.execute(f'''
-            SELECT
-                tt.tier_name,
-                COUNT(DISTINCT tt.event_id) as events_used,
-                SUM(tt.quantity_sold) as total_sold,
-                AVG(tt.price) as avg_price,
-                SUM(tt.quantity_sold * tt.price) as total_revenue,
-                AVG(tt.quantity_sold * 100.0 / NULLIF(tt.quantity_available, 0)) as avg_sell_through
-            FROM ticket_tiers tt
-            JOIN events e ON tt.event_id = e.id
-            {where_completed}
-            GROUP BY tt.tier_name
-            ORDER BY total_revenue DESC
-        ''')
-        ticket_performance = cursor.fetchall()
+        ticket_performance = data['ticket_performance']
 
         if ticket_performance:
             self.create_data_table(
@@ -396,28 +514,10 @@ class AnalysisView(ctk.CTkFrame):
             self.create_empty_message("No ticket data available")
 
         # === CANCELLED EVENTS ===
-        cursor.execute(f'''
-            SELECT COUNT(*) as cancelled_count
-            FROM events
-            WHERE is_cancelled = 1 {f'AND {date_filter}' if date_filter else ''}
-        ''')
-        if cursor.fetchone()['cancelled_count'] > 0:
+        cancelled_events = data['cancelled_events']
+        if cancelled_events:
             self.create_section_header("Cancelled Events")
 
-            cursor.execute(f'''
-                SELECT
-                    e.event_name,
-                    e.event_date,
-                    et.name as event_type,
-                    e.cancelled_date,
-                    e.cancellation_reason
-                FROM events e
-                LEFT JOIN event_types et ON e.event_type_id = et.id
-                WHERE e.is_cancelled = 1 {f'AND {date_filter}' if date_filter else ''}
-                ORDER BY e.cancelled_date DESC
-            ''')
-            cancelled_events = cursor.fetchall()
-
             self.create_data_table(
                 ["Event Name", "Scheduled Date", "Type", "Cancelled Date", "Reason"],
                 [
@@ -432,28 +532,8 @@ class AnalysisView(ctk.CTkFrame):
                 ]
             )
 
-        conn.close()
-
-    def create_trend_graphs(self, cursor, where_completed):
+    def create_trend_graphs(self, time_series_data):
         """Create trend graphs for attendance, revenue, and satisfaction"""
-        # Get time series data
-        cursor.execute(f'''
-            SELECT
-                e.event_date,
-                e.event_name,
-                ea.actual_attendance,
-                ea.revenue_total,
-                ea.attendee_satisfaction as satisfaction,
-                ea.event_smoothness,
-                ea.overall_success_score
-            FROM events e
-            JOIN event_analysis ea ON e.id = ea.event_id
-            {where_completed}
-            ORDER BY e.event_date ASC
-        ''')
-
-        time_series_data = cursor.fetchall()
-
         if not time_series_data or len(time_series_data) < 2:
             ctk.CTkLabel(
                 self.scroll_frame,
@@ -463,96 +543,137 @@ class AnalysisView(ctk.CTkFrame):
             ).pack(pady=10, padx=10)
             return
 
-        # Parse data
-        dates = []
-        attendances = []
-        revenues = []
-        satisfactions = []
-        smoothness_ratings = []
-        success_scores = []
-
-        for row in time_series_data:
-            date = datetime.strptime(row['event_date'], '%Y-%m-%d')
-            dates.append(date)
-            attendances.append(row['actual_attendance'] if row['actual_attendance'] is not None else 0)
-            revenues.append(row['revenue_total'] if row['revenue_total'] is not None else 0)
-            satisfactions.append(row['satisfaction'] if row['satisfaction'] is not None else 0)
-            smoothness_ratings.append(row['event_smoothness'] if row['event_smoothness'] is not None else 0)
-            success_scores.append(row['overall_success_score'] if row['overall_success_score'] is not None else 0)
-
-        # Create matplotlib figure with five subplots
-        plt.style.use('default')
-        fig = Figure(figsize=(12, 14), facecolor='#F9F9F9')
-
-        # Configure colors matching the app theme
-        line_colors = ['#8B5FBF', '#C5A8D9', '#4A2D5E', '#81C784', '#4CAF50']
-
-        # Attendance graph
-        ax1 = fig.add_subplot(5, 1, 1)
-        ax1.plot(dates, attendances, marker='o', linewidth=2, markersize=8, color=line_colors[0], label='Attendance')
-        ax1.set_ylabel('Attendees', fontsize=11, fontweight='bold', color='#4A2D5E')
-        ax1.set_title('Attendance Over Time', fontsize=13, fontweight='bold', color='#8B5FBF', pad=10)
-        ax1.grid(True, alpha=0.3, linestyle='--')
-        ax1.set_facecolor('white')
-        ax1.tick_params(colors='#4A2D5E')
-
-        # Format x-axis dates
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%d %b %Y'))
-        fig.autofmt_xdate(rotation=45)
-
-        # Revenue graph
-        ax2 = fig.add_subplot(5, 1, 2)
-        ax2.plot(dates, revenues, marker='s', linewidth=2, markersize=8, color=line_colors[1], label='Revenue')
-        ax2.set_ylabel('Revenue ($)', fontsize=11, fontweight='bold', color='#4A2D5E')
-        ax2.set_title('Ticket Revenue Over Time', fontsize=13, fontweight='bold', color='#8B5FBF', pad=10)
-        ax2.grid(True, alpha=0.3, linestyle='--')
-        ax2.set_facecolor('white')
-        ax2.tick_params(colors='#4A2D5E')
-        ax2.xaxis.set_major_formatter(mdates.DateFormatter('%d %b %Y'))
-
-        # Satisfaction graph
-        ax3 = fig.add_subplot(5, 1, 3)
-        ax3.plot(dates, satisfactions, marker='^', linewidth=2, markersize=8, color=line_colors[2], label='Satisfaction')
-        ax3.set_ylabel('Satisfaction (0-10)', fontsize=11, fontweight='bold', color='#4A2D5E')
-        ax3.set_title('Attendee Satisfaction Over Time', fontsize=13, fontweight='bold', color='#8B5FBF', pad=10)
-        ax3.grid(True, alpha=0.3, linestyle='--')
-        ax3.set_facecolor('white')
-        ax3.set_ylim(0, 10)
-        ax3.tick_params(colors='#4A2D5E')
-        ax3.xaxis.set_major_formatter(mdates.DateFormatter('%d %b %Y'))
-
-        # Event Smoothness graph
-        ax4 = fig.add_subplot(5, 1, 4)
-        ax4.plot(dates, smoothness_ratings, marker='D', linewidth=2, markersize=8, color=line_colors[3], label='Smoothness')
-        ax4.set_ylabel('Smoothness (0-10)', fontsize=11, fontweight='bold', color='#4A2D5E')
-        ax4.set_title('Event Smoothness Over Time', fontsize=13, fontweight='bold', color='#8B5FBF', pad=10)
-        ax4.grid(True, alpha=0.3, linestyle='--')
-        ax4.set_facecolor('white')
-        ax4.set_ylim(0, 10)
-        ax4.tick_params(colors='#4A2D5E')
-        ax4.xaxis.set_major_formatter(mdates.DateFormatter('%d %b %Y'))
-
-        # Overall Success Score graph
-        ax5 = fig.add_subplot(5, 1, 5)
-        ax5.plot(dates, success_scores, marker='*', linewidth=2, markersize=10, color=line_colors[4], label='Success Score')
-        ax5.set_ylabel('Success Score (0-10)', fontsize=11, fontweight='bold', color='#4A2D5E')
-        ax5.set_xlabel('Event Date', fontsize=11, fontweight='bold', color='#4A2D5E')
-        ax5.set_title('Overall Event Success Score Over Time', fontsize=13, fontweight='bold', color='#8B5FBF', pad=10)
-        ax5.grid(True, alpha=0.3, linestyle='--')
-        ax5.set_facecolor('white')
-        ax5.set_ylim(0, 10)
-        ax5.tick_params(colors='#4A2D5E')
-        ax5.xaxis.set_major_formatter(mdates.DateFormatter('%d %b %Y'))
-
-        fig.tight_layout(pad=2.0)
-
-        # Embed in tkinter
+        # Detail selector (long histories are grouped by week or month in Auto)
+        detail_frame = ctk.CTkFrame(self.scroll_frame, fg_color="transparent")
+        detail_frame.pack(fill="x", padx=10, pady=(0, 5))
+
+        ctk.CTkLabel(
+            detail_frame,
+            text="Detail:",
+            font=ctk.CTkFont(size=13, weight="bold"),
+            text_color="#4A2D5E"
+        ).pack(side="left", padx=(0, 10))
+
         canvas_frame = ctk.CTkFrame(self.scroll_frame, fg_color="white", corner_radius=8)
+
+        ctk.CTkOptionMenu(
+            detail_frame,
+            variable=self.trend_detail_var,
+            values=TREND_DETAILS,
+            command=lambda _: self.draw_trend_graphs(canvas_frame, time_series_data),
+            fg_color="#C5A8D9",
+            button_color="#B491CC",
+            button_hover_color="#A380BB",
+            text_color="#4A2D5E",
+            width=130
+        ).pack(side="left")
+
         canvas_frame.pack(fill="both", expand=False, padx=10, pady=(0, 20))
+        self.draw_trend_graphs(canvas_frame, time_series_data)
+
+    def draw_trend_graphs(self, canvas_frame, time_series_data):
+        """Fill canvas_frame with the trend charts at the selected detail"""
+        for widget in canvas_frame.winfo_children():
+            widget.destroy()
+
+        # Charts are drawn to PNG on the worker; a cached image is shown straight away
+        period = self.period_label
+        detail = self.trend_detail_var.get()
+        png = self.charts.cached(period, time_series_data, detail)
+        if png is not None:
+            self.show_trend_image(canvas_frame, time_series_data, png)
+            return
+
+        loading = ctk.CTkLabel(
+            canvas_frame,
+            text="Drawing charts...",
+            font=ctk.CTkFont(size=15),
+            text_color="#999999"
+        )
+        loading.pack(pady=40)
+
+        def show_error(error):
+            print(f"[ANALYSIS] Failed to draw trend charts: {error}")
+            if loading.winfo_exists():
+                loading.configure(text=f"Could not draw charts: {error}")
+
+        self.db.worker.run(
+            self, self.charts.render, period, time_series_data, detail,
+            on_done=lambda png: self.show_trend_image(canvas_frame, time_series_data, png),
+            on_error=show_error,
+            key=(str(self), 'charts')
+        )
+
+    def show_trend_image(self, canvas_frame, time_series_data, png: bytes):
+        """Show rendered trend charts, with a button for the interactive version"""
+        if not canvas_frame.winfo_exists():
+            return
+        for widget in canvas_frame.winfo_children():
+            widget.destroy()
+
+        from PIL import Image
+        image = Image.open(io.BytesIO(png))
+        ctk.CTkLabel(
+            canvas_frame,
+            text="",
+            image=ctk.CTkImage(light_image=image, size=image.size)
+        ).pack(padx=10, pady=(10, 5))
 
-        canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
+        ctk.CTkButton(
+            canvas_frame,
+            text="Open Interactive Chart",
+            command=lambda: self.open_interactive_chart(time_series_data),
+            fg_color="#D4A5D4",
+            hover_color="#C494C4",
+            text_color="#4A2D5E",
+            width=180
+        ).pack(pady=(0, 10))
+
+    def open_interactive_chart(self, time_series_data):
+        """Show the trend charts in a window with matplotlib's zoom and pan toolbar"""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+        window = ctk.CTkToplevel(self)
+        window.title("Trends Over Time")
+        window.geometry("1000x800")
+
+        fig = build_trend_figure(time_series_data, self.trend_detail_var.get())
+        canvas = FigureCanvasTkAgg(fig, master=window)
+        NavigationToolbar2Tk(canvas, window).pack(side="bottom", fill="x")
+        canvas.get_tk_widget().pack(fill="both", expand=True)
         canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+
+        def close():
+            fig.clear()  # The figure isn't tracked by pyplot, so nothing else would free it
+            window.destroy()
+
+        window.protocol("WM_DELETE_WINDOW", close)
+
+    def create_comparison_table(self, comparison: dict):
+        """Table of this period's headline numbers against the comparison period's"""
+        first, last = (datetime.strptime(d, '%Y-%m-%d').strftime('%d %b %Y') for d in comparison['period'])
+        self.create_section_header(f"Compared With {first} to {last}")
+
+        current, previous = comparison['current'], comparison['previous']
+        metrics = [
+            ("Total Events", lambda s: s['event_stats']['total_events'], "{:.0f}"),
+            ("Completed Events", lambda s: s['completed_count'], "{:.0f}"),
+            ("Total Attendees", lambda s: s['kpi']['total_attendance'], "{:.0f}"),
+            ("Avg Attendees/Event", lambda s: s['kpi']['avg_attendance'], "{:.1f}"),
+            ("Total Revenue", lambda s: s['kpi']['total_revenue'], "${:.2f}"),
+            ("Total Costs", lambda s: s['kpi']['total_costs'], "${:.2f}"),
+            ("Total Profit", lambda s: s['kpi']['total_profit'], "${:.2f}"),
+            ("Avg Attendee Satisfaction", lambda s: s['kpi']['avg_satisfaction'], "{:.1f}/10"),
+            ("Avg Overall Success Score", lambda s: s['kpi']['avg_overall_success'], "{:.1f}/10"),
+        ]
+
+        rows = []
+        for label, value, fmt in metrics:
+            now, before = value(current), value(previous)
+            change = f"{(now - before) / abs(before) * 100:+.1f}%" if before else "N/A"
+            rows.append([label, fmt.format(now), fmt.format(before), change])
+
+        self.create_data_table(["Metric", "This Period", "Comparison Period", "Change"], rows)
 
     def create_section_header(self, text):
         """Create a section header"""
@@ -252,10 +252,7 @@ class CalendarView(ctk.CTkFrame):
         events = cursor.fetchall()
 
         # Get event type names
-        event_types = {}
-        cursor.execute('SELECT id, name FROM event_types')
-        for row in cursor.fetchall():
-            event_types[row['id']] = row['name']
+        event_types = self.db.get_reference_name_map('event_types')
 
         # Display events
         if events:
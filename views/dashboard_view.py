@@ -0,0 +1,242 @@
+"""Dashboard View - alerts that need attention"""
+import customtkinter as ctk
+from datetime import datetime
+from typing import Callable, Dict, Tuple
+
+# (kind, urgency) -> (background, border)
+URGENCY_COLORS = {
+    ('prize', 'overdue'): ("#FFEBEE", "#E57373"),     # Light red for past events
+    ('prize', 'today'): ("#FFEBEE", "#E57373"),       # Light red for today
+    ('prize', 'soon'): ("#FFF3E0", "#FFB74D"),        # Light orange for soon
+    ('prize', 'later'): ("#FFF9C4", "#FFD54F"),       # Light yellow for future
+    ('checklist', 'completed'): ("#E8F5E9", "#81C784"),
+    ('checklist', 'overdue'): ("#FFEBEE", "#E57373"),
+    ('checklist', 'today'): ("#FFF3E0", "#FFB74D"),
+    ('checklist', 'soon'): ("#FFF9C4", "#FFD54F"),
+    ('checklist', 'later'): ("#F5F5F5", "#BDBDBD"),
+    ('checklist', 'none'): ("#F5F5F5", "#BDBDBD"),
+}
+
+
+def urgency_text(alert: dict) -> str:
+    """Urgency message for an alert (e.g. DUE TODAY)"""
+    days = alert['days_until']
+    urgency = alert['urgency']
+
+    if alert['kind'] == 'prize':
+        if urgency == 'overdue':
+            return f"EVENT PASSED {abs(days)} day(s) ago"
+        if urgency == 'today':
+            return "EVENT IS TODAY"
+        if urgency == 'soon':
+            return f"Event in {days} day(s)"
+        return f"Event in {days} days"
+
+    if urgency == 'completed':
+        return "Completed"
+    if urgency == 'none':
+        return "No due date"
+    if urgency == 'overdue':
+        return f"OVERDUE by {abs(days)} day(s)"
+    if urgency == 'today':
+        return "DUE TODAY"
+    if urgency == 'soon':
+        return f"Due in {days} day(s)"
+    return f"Due in {days} days"
+
+
+class DashboardView(ctk.CTkFrame):
+    """Dashboard of unreceived prizes and checklist items marked 'Show on Dashboard'
+
+    The alerts come from the app's DeadlineScheduler, which keeps them
+    current; refresh() runs whenever they change and diffs them against the
+    cards on screen: cards for alerts that went away are destroyed, new ones
+    are created and existing cards are only re-filled if their alert changed.
+    """
+
+    def __init__(self, parent, database, scheduler, on_open_event: Callable[[int], None], **kwargs):
+        super().__init__(parent, **kwargs)
+        self.db = database
+        self.scheduler = scheduler
+        self.on_open_event = on_open_event
+        self.cards: Dict[Tuple[str, int], DashboardCard] = {}
+        self.packed: list = []
+
+        # Title
+        title = ctk.CTkLabel(
+            self,
+            text="Dashboard",
+            font=ctk.CTkFont(size=32, weight="bold"),
+            text_color="#8B5FBF"
+        )
+        title.pack(pady=30, padx=30, anchor="w")
+
+        # Scrollable frame for all dashboard items (packed only when there are any)
+        self.scroll = ctk.CTkScrollableFrame(self, fg_color="white")
+
+        self.prize_header = ctk.CTkLabel(
+            self.scroll,
+            text="Materials & Prizes Not Received",
+            font=ctk.CTkFont(size=20, weight="bold"),
+            text_color="#E57373"
+        )
+        self.checklist_header = ctk.CTkLabel(
+            self.scroll,
+            text="Important Checklist Items",
+            font=ctk.CTkFont(size=20, weight="bold"),
+            text_color="#4A2D5E"
+        )
+
+        # Message shown if nothing to display
+        self.empty_label = ctk.CTkLabel(
+            self,
+            text="No important items to display.\n\nMark checklist items as 'Show on Dashboard' to see them here.\nPrizes not yet received from suppliers will also appear here.",
+            font=ctk.CTkFont(size=15),
+            text_color="#999999"
+        )
+
+        self.refresh()
+        self.unsubscribe_alerts = scheduler.subscribe(self.refresh)
+
+    def destroy(self):
+        self.unsubscribe_alerts()
+        super().destroy()
+
+    def refresh(self):
+        """Update only the cards whose alerts changed"""
+        alerts = self.scheduler.get_alerts()
+
+        keys = {(alert['kind'], alert['alert_id']) for alert in alerts}
+        for key in [key for key in self.cards if key not in keys]:
+            self.cards.pop(key).destroy()
+
+        # Widgets in display order: each section's header, then its cards
+        layout = []
+        section = None
+        for alert in alerts:
+            key = (alert['kind'], alert['alert_id'])
+            if alert['kind'] != section:
+                section = alert['kind']
+                layout.append(self.prize_header if section == 'prize' else self.checklist_header)
+
+            card = self.cards.get(key)
+            if card is None:
+                card = self.cards[key] = DashboardCard(self.scroll, self.on_open_event)
+            if card.alert != alert:
+                card.show(alert)
+            layout.append(card)
+
+        if alerts:
+            self.empty_label.pack_forget()
+            self.scroll.pack(fill="both", expand=True, padx=30, pady=(0, 30))
+        else:
+            self.scroll.pack_forget()
+            self.empty_label.pack(pady=40, padx=30)
+
+        # Re-pack only when cards were added, removed or moved
+        if layout != self.packed:
+            for widget in self.packed:
+                if widget.winfo_exists():
+                    widget.pack_forget()
+            for widget in layout:
+                if widget is self.prize_header:
+                    widget.pack(pady=(10, 15), padx=10, anchor="w")
+                elif widget is self.checklist_header:
+                    widget.pack(pady=(20, 15), padx=10, anchor="w")
+                else:
+                    widget.pack(fill="x", padx=10, pady=5)
+            self.packed = layout
+
+
+class DashboardCard(ctk.CTkFrame):
+    """Card for one dashboard alert
+
+    The widgets and click bindings are made once; show() re-fills and
+    restyles the card when its alert changes.
+    """
+
+    def __init__(self, parent, on_open_event: Callable[[int], None]):
+        super().__init__(parent, border_width=2)
+        self.on_open_event = on_open_event
+        self.alert = None
+
+        content = ctk.CTkFrame(self, fg_color="transparent")
+        content.pack(fill="x", padx=15, pady=12)
+
+        # Left side - info
+        left_content = ctk.CTkFrame(content, fg_color="transparent")
+        left_content.pack(side="left", fill="both", expand=True)
+
+        # Event name
+        self.event_label = ctk.CTkLabel(
+            left_content,
+            text="",
+            font=ctk.CTkFont(size=15, weight="bold"),
+            text_color="#8B5FBF",
+            anchor="w"
+        )
+        self.event_label.pack(anchor="w")
+
+        # Checklist item description or materials/prize support message
+        self.message_label = ctk.CTkLabel(
+            left_content,
+            text="",
+            font=ctk.CTkFont(size=15),
+            text_color="#4A2D5E",
+            anchor="w"
+        )
+        self.message_label.pack(anchor="w", pady=(3, 0))
+
+        # Urgency and event date
+        self.info_label = ctk.CTkLabel(
+            left_content,
+            text="",
+            font=ctk.CTkFont(size=15),
+            text_color="#666666",
+            anchor="w"
+        )
+        self.info_label.pack(anchor="w", pady=(3, 0))
+
+        # Right side - button
+        right_content = ctk.CTkFrame(content, fg_color="transparent")
+        right_content.pack(side="right", padx=(10, 0))
+
+        ctk.CTkButton(
+            right_content,
+            text="View/Edit Event",
+            command=self.open_event,
+            fg_color="#8B5FBF",
+            hover_color="#7A4FB0",
+            text_color="white",
+            width=120,
+            height=32
+        ).pack()
+
+        # Make the whole card clickable
+        for widget in (self, content, left_content, self.event_label, self.message_label, self.info_label):
+            widget.bind("<Button-1>", self.open_event)
+            widget.configure(cursor="hand2")
+
+    def show(self, alert: dict):
+        """Fill the card in for an alert"""
+        self.alert = alert
+
+        if alert['kind'] == 'prize':
+            message = f"{alert['unreceived_count']} item(s) not yet received from supplier"
+        else:
+            message = alert['description']
+
+        info_text = urgency_text(alert)
+        if alert['event_date']:
+            formatted_date = datetime.strptime(alert['event_date'], '%Y-%m-%d').strftime('%A, %d %B %Y')
+            info_text += f" - {formatted_date}"
+
+        bg_color, border_color = URGENCY_COLORS[(alert['kind'], alert['urgency'])]
+        self.configure(fg_color=bg_color, border_color=border_color)
+        self.event_label.configure(text=alert['event_name'])
+        self.message_label.configure(text=message)
+        self.info_label.configure(text=info_text)
+
+    def open_event(self, event=None):
+        """Open the alert's event (from the button or a click anywhere on the card)"""
+        self.on_open_event(self.alert['event_id'])
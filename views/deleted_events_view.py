@@ -2,6 +2,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from event_manager import EventManager
+from widgets.virtual_list import VirtualList
 from datetime import datetime
 
 
@@ -83,166 +84,37 @@ class DeletedEventsView(ctk.CTkFrame):
         btn_empty_trash.pack(side="left", padx=5)
 
     def create_deleted_events_list(self):
-        """Create the scrollable deleted events list"""
+        """Create the deleted events list (only the visible cards are built)"""
         # Container frame with border
         list_container = ctk.CTkFrame(self, fg_color="white", corner_radius=10)
         list_container.pack(fill="both", expand=True, padx=30, pady=(0, 30))
 
-        # Scrollable frame
-        self.events_scroll = ctk.CTkScrollableFrame(
+        self.events_list = VirtualList(
             list_container,
-            fg_color="white",
+            create_row=lambda parent: DeletedEventCard(parent, self),
+            bind_row=lambda card, event: card.show(event),
+            estimate_height=lambda event: 130 if event.get('deleted_at') else 105,
+            empty_text="No deleted events.\nDeleted events will appear here and can be restored or permanently deleted.",
             corner_radius=10
         )
-        self.events_scroll.pack(fill="both", expand=True, padx=2, pady=2)
+        self.events_list.pack(fill="both", expand=True, padx=2, pady=2)
+
+    def refresh(self):
+        """Reload the view's data (called when a cached view is shown again)"""
+        self.load_deleted_events()
 
     def load_deleted_events(self):
         """Load and display deleted events"""
-        # Clear existing widgets
-        for widget in self.events_scroll.winfo_children():
-            widget.destroy()
-
         # Clear selection
         self.selected_events.clear()
 
         # Get deleted events
         events = self.event_manager.get_deleted_events()
+        self.events_list.set_items(events)
 
-        if not events:
-            # No deleted events message
-            no_events = ctk.CTkLabel(
-                self.events_scroll,
-                text="No deleted events.\nDeleted events will appear here and can be restored or permanently deleted.",
-                font=ctk.CTkFont(size=16),
-                text_color="#999999"
-            )
-            no_events.pack(pady=40)
-            return
-
-        # Display events
-        for event in events:
-            self.create_deleted_event_card(event)
-
-    def create_deleted_event_card(self, event: dict):
-        """Create a card for a deleted event"""
-        # Card frame
-        card = ctk.CTkFrame(
-            self.events_scroll,
-            fg_color="#FFE6E6",  # Light red background for deleted items
-            corner_radius=8,
-            border_width=1,
-            border_color="#FFCCCC"
-        )
-        card.pack(fill="x", padx=10, pady=5)
-
-        # Main content frame
-        content = ctk.CTkFrame(card, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=20, pady=15)
-
-        # Left side - Checkbox and Event info
-        left_frame = ctk.CTkFrame(content, fg_color="transparent")
-        left_frame.pack(side="left", fill="both", expand=True)
-
-        # Checkbox for selection
-        checkbox_var = ctk.BooleanVar(value=False)
-        checkbox = ctk.CTkCheckBox(
-            left_frame,
-            text="",
-            variable=checkbox_var,
-            command=lambda e_id=event['id'], var=checkbox_var: self.toggle_selection(e_id, var),
-            fg_color="#8B5FBF",
-            hover_color="#7A4FB0",
-            border_color="#8B5FBF",
-            checkmark_color="white",
-            width=20
-        )
-        checkbox.pack(side="left", padx=(0, 15))
-
-        # Event details frame
-        details_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
-        details_frame.pack(side="left", fill="both", expand=True)
-
-        # Event name
-        name_label = ctk.CTkLabel(
-            details_frame,
-            text=event['event_name'],
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color="#4A2D5E",
-            anchor="w"
-        )
-        name_label.pack(anchor="w")
-
-        # Event details
-        details_text = []
-
-        # Format date nicely
-        try:
-            event_date = datetime.strptime(event['event_date'], '%Y-%m-%d')
-            formatted_date = event_date.strftime('%A, %d %B %Y')
-            details_text.append(formatted_date)
-        except:
-            details_text.append(event['event_date'])
-
-        if event.get('event_type_name'):
-            details_text.append(event['event_type_name'])
-
-        details_label = ctk.CTkLabel(
-            details_frame,
-            text=" • ".join(details_text),
-            font=ctk.CTkFont(size=15),
-            text_color="#666666",
-            anchor="w"
-        )
-        details_label.pack(anchor="w", pady=(5, 0))
-
-        # Deleted date
-        if event.get('deleted_at'):
-            try:
-                deleted_dt = datetime.strptime(event['deleted_at'], '%Y-%m-%d %H:%M:%S')
-                deleted_text = f"Deleted: {deleted_dt.strftime('%d %B %Y at %I:%M %p')}"
-            except:
-                deleted_text = f"Deleted: {event['deleted_at']}"
-
-            deleted_label = ctk.CTkLabel(
-                details_frame,
-                text=deleted_text,
-                font=ctk.CTkFont(size=13, slant="italic"),
-                text_color="#999999",
-                anchor="w"
-            )
-            deleted_label.pack(anchor="w", pady=(5, 0))
-
-        # Right side - Quick Actions
-        right_frame = ctk.CTkFrame(content, fg_color="transparent")
-        right_frame.pack(side="right")
-
-        # Restore button
-        btn_restore = ctk.CTkButton(
-            right_frame,
-            text="Restore",
-            command=lambda e=event: self.restore_event(e['id'], e['event_name']),
-            fg_color="#4CAF50",
-            hover_color="#45A049",
-            text_color="white",
-            width=100
-        )
-        btn_restore.pack(pady=2)
-
-        # Permanent delete button
-        btn_delete = ctk.CTkButton(
-            right_frame,
-            text="Delete Forever",
-            command=lambda e=event: self.permanently_delete_event(e['id'], e['event_name']),
-            fg_color="#E57373",
-            hover_color="#D32F2F",
-            text_color="white",
-            width=100
-        )
-        btn_delete.pack(pady=2)
-
-    def toggle_selection(self, event_id: int, checkbox_var):
+    def toggle_selection(self, event_id: int, selected: bool):
         """Toggle selection of an event"""
-        if checkbox_var.get():
+        if selected:
             self.selected_events.add(event_id)
         else:
             self.selected_events.discard(event_id)
@@ -327,3 +199,131 @@ class DeletedEventsView(ctk.CTkFrame):
 
             self.load_deleted_events()
             messagebox.showinfo("Trash Emptied", f"{len(deleted_events)} event(s) have been permanently deleted.")
+
+
+class DeletedEventCard(ctk.CTkFrame):
+    """Card for one deleted event; recycled by the VirtualList as the user scrolls"""
+
+    def __init__(self, parent, view: DeletedEventsView):
+        super().__init__(
+            parent,
+            fg_color="#FFE6E6",  # Light red background for deleted items
+            corner_radius=8,
+            border_width=1,
+            border_color="#FFCCCC"
+        )
+        self.view = view
+        self.event = None
+
+        # Main content frame
+        content = ctk.CTkFrame(self, fg_color="transparent")
+        content.pack(fill="both", expand=True, padx=20, pady=15)
+
+        # Left side - Checkbox and Event info
+        left_frame = ctk.CTkFrame(content, fg_color="transparent")
+        left_frame.pack(side="left", fill="both", expand=True)
+
+        # Checkbox for selection (state comes from view.selected_events)
+        self.checkbox_var = ctk.BooleanVar(value=False)
+        checkbox = ctk.CTkCheckBox(
+            left_frame,
+            text="",
+            variable=self.checkbox_var,
+            command=lambda: self.view.toggle_selection(self.event['id'], self.checkbox_var.get()),
+            fg_color="#8B5FBF",
+            hover_color="#7A4FB0",
+            border_color="#8B5FBF",
+            checkmark_color="white",
+            width=20
+        )
+        checkbox.pack(side="left", padx=(0, 15))
+
+        # Event details frame
+        details_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
+        details_frame.pack(side="left", fill="both", expand=True)
+
+        # Event name
+        self.name_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color="#4A2D5E",
+            anchor="w"
+        )
+        self.name_label.pack(anchor="w")
+
+        # Event details
+        self.details_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=ctk.CTkFont(size=15),
+            text_color="#666666",
+            anchor="w"
+        )
+        self.details_label.pack(anchor="w", pady=(5, 0))
+
+        # Deleted date (packed only when known)
+        self.deleted_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=ctk.CTkFont(size=13, slant="italic"),
+            text_color="#999999",
+            anchor="w"
+        )
+
+        # Right side - Quick Actions
+        right_frame = ctk.CTkFrame(content, fg_color="transparent")
+        right_frame.pack(side="right")
+
+        # Restore button
+        ctk.CTkButton(
+            right_frame,
+            text="Restore",
+            command=lambda: self.view.restore_event(self.event['id'], self.event['event_name']),
+            fg_color="#4CAF50",
+            hover_color="#45A049",
+            text_color="white",
+            width=100
+        ).pack(pady=2)
+
+        # Permanent delete button
+        ctk.CTkButton(
+            right_frame,
+            text="Delete Forever",
+            command=lambda: self.view.permanently_delete_event(self.event['id'], self.event['event_name']),
+            fg_color="#E57373",
+            hover_color="#D32F2F",
+            text_color="white",
+            width=100
+        ).pack(pady=2)
+
+    def show(self, event: dict):
+        """Fill the card in for a deleted event"""
+        self.event = event
+        self.checkbox_var.set(event['id'] in self.view.selected_events)
+        self.name_label.configure(text=event['event_name'])
+
+        details_text = []
+
+        # Format date nicely
+        try:
+            event_date = datetime.strptime(event['event_date'], '%Y-%m-%d')
+            details_text.append(event_date.strftime('%A, %d %B %Y'))
+        except:
+            details_text.append(event['event_date'])
+
+        if event.get('event_type_name'):
+            details_text.append(event['event_type_name'])
+        self.details_label.configure(text=" • ".join(details_text))
+
+        # Deleted date
+        if event.get('deleted_at'):
+            try:
+                deleted_dt = datetime.strptime(event['deleted_at'], '%Y-%m-%d %H:%M:%S')
+                deleted_text = f"Deleted: {deleted_dt.strftime('%d %B %Y at %I:%M %p')}"
+            except:
+                deleted_text = f"Deleted: {event['deleted_at']}"
+            self.deleted_label.configure(text=deleted_text)
+            self.deleted_label.pack(anchor="w", pady=(5, 0))
+        else:
+            self.deleted_label.pack_forget()
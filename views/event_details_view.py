@@ -1,7 +1,7 @@
 """Detailed event view with all functionality"""
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
-from event_manager import EventManager
+from event_manager import EVENT_CHILD_QUERIES, EventManager, summarise_financials
 from datetime import datetime
 from typing import Optional
 import os
@@ -2093,30 +2093,13 @@ class EventDetailsView(ctk.CTkToplevel):
         # Get notes
         notes = self.text_analysis_notes.get("1.0", "end-1c").strip()
 
-        # Calculate totals
-        total_labour = self.event_manager.get_total_labour_cost(self.event_id)
-
-        # Get revenue from ticket sales
-        cursor.execute('''
-            SELECT SUM(price * quantity_sold) as revenue
-            FROM ticket_tiers
-            WHERE event_id = ?
-        ''', (self.event_id,))
+        # Revenue and costs from the event's financials row (kept current by triggers)
+        cursor.execute(EVENT_CHILD_QUERIES['financials'], (self.event_id,))
         result = cursor.fetchone()
-        revenue = result['revenue'] if result and result['revenue'] else 0.0
-
-        # Get other costs
-        cursor.execute('''
-            SELECT SUM(amount) as costs
-            FROM event_costs
-            WHERE event_id = ?
-        ''', (self.event_id,))
-        result = cursor.fetchone()
-        other_costs = result['costs'] if result and result['costs'] else 0.0
-
-        # Calculate totals
-        total_cost = total_labour + other_costs
-        profit_margin = revenue - total_cost
+        financials = summarise_financials(dict(result) if result else None)
+        revenue = financials['ticket_revenue']
+        total_cost = financials['cost_total']
+        profit_margin = financials['profit']
 
         # Save or update analysis
         cursor.execute('SELECT id FROM event_analysis WHERE event_id = ?', (self.event_id,))
@@ -2301,11 +2284,7 @@ class EventDetailsView(ctk.CTkToplevel):
             return
 
         # Get list of templates to choose from
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, name FROM event_templates ORDER BY name')
-        templates = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        templates = self.db.get_reference_rows('event_templates')
 
         if not templates:
             messagebox.showwarning("No Templates", "No templates available. Create a template first.")
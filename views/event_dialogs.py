@@ -1,7 +1,6 @@
 """Dialog classes for event management"""
 import customtkinter as ctk
 from tkinter import messagebox
-from tkcalendar import DateEntry
 from typing import Optional
 
 
@@ -819,6 +818,7 @@ class ChecklistItemDialog(ctk.CTkToplevel):
         # Due Date
         ctk.CTkLabel(frame, text="Due Date", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
         ctk.CTkLabel(frame, text="Optional - leave blank if no specific due date", text_color="#666666", font=ctk.CTkFont(size=10)).pack(anchor="w", pady=(0, 5))
+        from tkcalendar import DateEntry
         self.entry_due_date = DateEntry(
             frame,
             selectmode='day',
@@ -1086,9 +1086,9 @@ class LabourCostDialog(ctk.CTkToplevel):
 
         # Get rate from settings based on type
         if rate_type == "Public Holiday":
-            rate = float(self.db.get_setting('public_holiday_rate') or 40.0)
+            rate = self.db.get_setting_float('public_holiday_rate', 40.0)
         else:  # Weekday
-            rate = float(self.db.get_setting('weekday_after_6pm_rate') or 25.5)
+            rate = self.db.get_setting_float('weekday_after_6pm_rate', 25.5)
 
         self.entry_rate.delete(0, 'end')
         self.entry_rate.insert(0, f"{rate:.2f}")
@@ -1458,11 +1458,11 @@ class LaborProjectionDialog(ctk.CTkToplevel):
         ctk.CTkLabel(frame, text="Rate Type *", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
 
         # Get rates from settings
-        weekday_before_6pm = float(self.db.get_setting('weekday_before_6pm_rate') or 22.00)
-        weekday_after_6pm = float(self.db.get_setting('weekday_after_6pm_rate') or 25.50)
-        saturday = float(self.db.get_setting('saturday_rate') or 30.00)
-        sunday = float(self.db.get_setting('sunday_rate') or 35.00)
-        public_holiday = float(self.db.get_setting('public_holiday_rate') or 40.00)
+        weekday_before_6pm = self.db.get_setting_float('weekday_before_6pm_rate', 22.00)
+        weekday_after_6pm = self.db.get_setting_float('weekday_after_6pm_rate', 25.50)
+        saturday = self.db.get_setting_float('saturday_rate', 30.00)
+        sunday = self.db.get_setting_float('sunday_rate', 35.00)
+        public_holiday = self.db.get_setting_float('public_holiday_rate', 40.00)
 
         self.rate_map = {
             "Weekday Before 6pm": weekday_before_6pm,
@@ -231,16 +231,10 @@ class EventFormView(NavigableView):
 
     def load_reference_data(self):
         """Load dropdown options from database"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
         # Event types
-        cursor.execute('SELECT id, name FROM event_types ORDER BY name')
-        self.event_types = {row['name']: row['id'] for row in cursor.fetchall()}
+        self.event_types = {row['name']: row['id'] for row in self.db.get_reference_rows('event_types')}
         self.event_type_names = list(self.event_types.keys())
 
-        conn.close()
-
     def populate_form(self):
         """Populate form with existing event data"""
         if not self.event_data:
@@ -1,10 +1,10 @@
 """Events view UI"""
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
-from tkcalendar import DateEntry
-from event_manager import EventManager
-from pdf_generator import EventPDFGenerator
+from event_manager import EventManager, summarise_financials
+from change_bus import DELETED, UPDATED
 from views.event_dialogs import TicketTierDialog, PrizeDialog, NoteDialog, ChecklistItemDialog
+from widgets.virtual_list import VirtualList
 from datetime import datetime
 from typing import Optional
 import os
@@ -12,6 +12,20 @@ import os
 class EventsView(ctk.CTkFrame):
     """Events list and management view"""
 
+    PAGE_SIZE = 50
+
+    # Filter labels -> get_events_page() values
+    EVENT_ORDERS = {"Upcoming": 'upcoming', "Past": 'past'}
+    STATUS_FILTERS = {
+        "All": None,
+        "Needs Organising": 'not_organised',
+        "Organised": 'organised',
+        "Tickets Live": 'tickets_live',
+        "Not Advertised": 'not_advertised',
+        "Advertised": 'advertised',
+        "Cancelled": 'cancelled',
+    }
+
     def __init__(self, parent, db, navigation_manager=None, **kwargs):
         super().__init__(parent, **kwargs)
         self.db = db
@@ -29,6 +43,13 @@ class EventsView(ctk.CTkFrame):
         # Load events
         self.load_events()
 
+        # Keep cards up to date as events are changed elsewhere
+        self.unsubscribe_changes = self.db.changes.subscribe(self.on_event_changed, 'event')
+
+    def destroy(self):
+        self.unsubscribe_changes()
+        super().destroy()
+
     def create_header(self):
         """Create the header with title and buttons"""
         header_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -105,252 +126,155 @@ class EventsView(ctk.CTkFrame):
         )
         chk_completed.pack(side="left")
 
+        # Upcoming / past, type, template and status filters
+        self.order_filter = self.create_filter_menu(filter_frame, "Show:", list(self.EVENT_ORDERS))
+        self.type_filter = self.create_filter_menu(filter_frame, "Type:", ["All"])
+        self.template_filter = self.create_filter_menu(filter_frame, "Template:", ["All"])
+        self.status_filter = self.create_filter_menu(filter_frame, "Status:", list(self.STATUS_FILTERS))
+        self.populate_filter_menus()
+
+    def create_filter_menu(self, parent, label: str, values: list) -> ctk.CTkOptionMenu:
+        """Create a labelled filter drop-down that reloads the list when changed"""
+        ctk.CTkLabel(
+            parent,
+            text=label,
+            font=ctk.CTkFont(size=15),
+            text_color="#4A2D5E"
+        ).pack(side="left", padx=(20, 5))
+
+        menu = ctk.CTkOptionMenu(
+            parent,
+            values=values,
+            command=lambda _: self.load_events(),
+            fg_color="#C5A8D9",
+            button_color="#B491CC",
+            button_hover_color="#A380BB",
+            text_color="#4A2D5E",
+            width=140
+        )
+        menu.set(values[0])
+        menu.pack(side="left")
+        return menu
+
+    def populate_filter_menus(self):
+        """Fill the type and template filters from the (cached) reference data"""
+        self.event_type_ids = {row['name']: row['id'] for row in self.db.get_reference_rows('event_types')}
+        self.template_ids = {row['name']: row['id'] for row in self.db.get_reference_rows('event_templates')}
+
+        for menu, names in ((self.type_filter, self.event_type_ids), (self.template_filter, self.template_ids)):
+            menu.configure(values=["All"] + list(names))
+            if menu.get() not in names:
+                menu.set("All")
+
     def create_events_list(self):
-        """Create the scrollable events list"""
+        """Create the events list (only the visible cards are built)"""
         # Container frame with border
         list_container = ctk.CTkFrame(self, fg_color="white", corner_radius=10)
         list_container.pack(fill="both", expand=True, padx=30, pady=(0, 30))
 
-        # Scrollable frame
-        self.events_scroll = ctk.CTkScrollableFrame(
+        self.events_list = VirtualList(
             list_container,
-            fg_color="white",
+            create_row=lambda parent: EventCard(parent, self),
+            bind_row=lambda card, event: card.show(event),
+            estimate_height=self.estimate_card_height,
+            empty_text="No events yet. Create your first event!",
+            on_near_end=self.load_more_events,
             corner_radius=10
         )
-        self.events_scroll.pack(fill="both", expand=True, padx=2, pady=2)
+        self.events_list.pack(fill="both", expand=True, padx=2, pady=2)
 
     def refresh(self):
         """Refresh the view (called when navigating back)"""
+        self.populate_filter_menus()
         self.load_events()
 
-    def load_events(self):
-        """Load and display events"""
-        # Clear existing widgets
-        for widget in self.events_scroll.winfo_children():
-            widget.destroy()
-
-        # Get events
-        events = self.event_manager.get_all_events(
-            include_completed=self.show_completed_var.get()
-        )
-
-        if not events:
-            # No events message
-            no_events = ctk.CTkLabel(
-                self.events_scroll,
-                text="No events yet. Create your first event!",
-                font=ctk.CTkFont(size=16),
-                text_color="#999999"
-            )
-            no_events.pack(pady=40)
-            return
+    def get_page_filters(self) -> dict:
+        """Current filter settings as get_events_page() arguments"""
+        return {
+            'order': self.EVENT_ORDERS[self.order_filter.get()],
+            'include_completed': self.show_completed_var.get(),
+            'event_type_id': self.event_type_ids.get(self.type_filter.get()),
+            'template_id': self.template_ids.get(self.template_filter.get()),
+            'status': self.STATUS_FILTERS[self.status_filter.get()],
+        }
 
-        # Display events
-        for event in events:
-            self.create_event_card(event)
+    def load_events(self):
+        """Load and display the first page of events; later pages load as the user scrolls"""
+        self.page_filters = self.get_page_filters()
 
-    def create_event_card(self, event: dict):
-        """Create a card for an event"""
-        # Card frame
-        card = ctk.CTkFrame(
-            self.events_scroll,
-            fg_color="#F9F5FA",
-            corner_radius=8,
-            border_width=1,
-            border_color="#E6D9F2"
-        )
-        card.pack(fill="x", padx=10, pady=5)
+        # Events come with their to-do summaries, so cards don't query per event
+        events, self.next_page = self.event_manager.get_events_page(limit=self.PAGE_SIZE, **self.page_filters)
 
-        # Main content frame
-        content = ctk.CTkFrame(card, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=20, pady=15)
+        if self.page_filters['order'] == 'past':
+            self.events_list.set_empty_text("No past events match these filters.")
+        else:
+            self.events_list.set_empty_text("No upcoming events. Create your first event!")
+        self.events_list.set_items(events)
 
-        # Left side - Event info
-        left_frame = ctk.CTkFrame(content, fg_color="transparent")
-        left_frame.pack(side="left", fill="both", expand=True)
+    def load_more_events(self):
+        """Append the next page when the user scrolls near the end of the list"""
+        if not self.next_page:
+            return
 
-        # Event name
-        name_label = ctk.CTkLabel(
-            left_frame,
-            text=event['event_name'],
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color="#4A2D5E",
-            anchor="w"
+        events, self.next_page = self.event_manager.get_events_page(
+            after=self.next_page, limit=self.PAGE_SIZE, **self.page_filters
         )
-        name_label.pack(anchor="w")
+        self.events_list.append_items(events)
 
-        # Event details
-        details_text = []
+    def on_event_changed(self, change):
+        """Update, add or remove just the card for a changed event"""
+        if change.entity_id is None:
+            # Many events changed at once (e.g. a series was regenerated)
+            self.load_events()
+            return
 
-        # Format date nicely
-        try:
-            event_date = datetime.strptime(event['event_date'], '%Y-%m-%d')
-            formatted_date = event_date.strftime('%A, %d %B %Y')
-            details_text.append(formatted_date)
-        except:
-            details_text.append(event['event_date'])
+        index = self.events_list.find(lambda e: e['id'] == change.entity_id)
+        event = None
+        if change.kind != DELETED:
+            matches = self.event_manager.get_events_by_ids([change.entity_id], **self.page_filters)
+            event = matches[0] if matches else None
 
-        if event.get('event_type_name'):
-            details_text.append(event['event_type_name'])
-        if event.get('format_name'):
-            details_text.append(event['format_name'])
-        if event.get('pairing_method_name'):
-            details_text.append(event['pairing_method_name'])
+        if event is None:
+            # Deleted, or no longer matches the filters
+            if index is not None:
+                self.events_list.remove_item(index)
+            return
 
-        details_label = ctk.CTkLabel(
-            left_frame,
-            text=" • ".join(details_text),
-            font=ctk.CTkFont(size=15),
-            text_color="#666666",
-            anchor="w"
+        self.events_list.upsert_sorted(
+            event,
+            key=lambda e: (e['event_date'], e['id']),
+            index=index,
+            reverse=self.page_filters['order'] == 'past',
+            has_more=self.next_page is not None
         )
-        details_label.pack(anchor="w", pady=(5, 0))
 
-        # Tables booked
+    def estimate_card_height(self, event: dict) -> int:
+        """Rough card height, used until the card has been drawn and measured"""
+        height = 150
         if event.get('tables_booked'):
-            tables_label = ctk.CTkLabel(
-                left_frame,
-                text=f"Tables Booked: {event['tables_booked']}",
-                font=ctk.CTkFont(size=15),
-                text_color="#8B5FBF",
-                anchor="w"
-            )
-            tables_label.pack(anchor="w", pady=(5, 0))
-
-        # Status badges frame
-        badges_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
-        badges_frame.pack(anchor="w", pady=(10, 0))
-
-        # Status badges
-        if event.get('is_organised'):
-            self.create_badge(badges_frame, "Organised", "#4CAF50")
-        if event.get('tickets_live'):
-            self.create_badge(badges_frame, "Tickets Live", "#2196F3")
-        if event.get('is_advertised'):
-            self.create_badge(badges_frame, "Advertised", "#FF9800")
-        if event.get('is_completed'):
-            self.create_badge(badges_frame, "Completed", "#9C27B0")
-
-        # Incomplete checklist items
-        incomplete_items = self.get_incomplete_checklist_items(event['id'])
-        if incomplete_items:
-            checklist_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
-            checklist_frame.pack(anchor="w", pady=(10, 0))
-
-            ctk.CTkLabel(
-                checklist_frame,
-                text="To Do:",
-                font=ctk.CTkFont(size=15, weight="bold"),
-                text_color="#999999",
-                anchor="w"
-            ).pack(anchor="w")
-
-            for item in incomplete_items[:3]:  # Show max 3 items
-                item_label = ctk.CTkLabel(
-                    checklist_frame,
-                    text=f"☐ {item['description']}",
-                    font=ctk.CTkFont(size=15),
-                    text_color="#AAAAAA",
-                    anchor="w"
-                )
-                item_label.pack(anchor="w", padx=(10, 0))
-
-            if len(incomplete_items) > 3:
-                more_label = ctk.CTkLabel(
-                    checklist_frame,
-                    text=f"   +{len(incomplete_items) - 3} more...",
-                    font=ctk.CTkFont(size=15),
-                    text_color="#CCCCCC",
-                    anchor="w"
-                )
-                more_label.pack(anchor="w", padx=(10, 0))
-
-        # Right side - Actions
-        right_frame = ctk.CTkFrame(content, fg_color="transparent")
-        right_frame.pack(side="right")
-
-        # View/Edit button
-        btn_edit = ctk.CTkButton(
-            right_frame,
-            text="View/Edit",
-            command=lambda e=event: self.show_event_details(e['id']),
-            fg_color="#8B5FBF",
-            hover_color="#7A4FB0",
-            text_color="white",
-            width=100
-        )
-        btn_edit.pack(pady=2)
-
-        # Delete button
-        btn_delete = ctk.CTkButton(
-            right_frame,
-            text="Delete",
-            command=lambda e=event: self.delete_event(e['id'], e['event_name']),
-            fg_color="#E57373",
-            hover_color="#D32F2F",
-            text_color="white",
-            width=100
-        )
-        btn_delete.pack(pady=2)
-
-        # Make into Template button
-        btn_template = ctk.CTkButton(
-            right_frame,
-            text="Make Template",
-            command=lambda e=event: self.make_into_template(e['id']),
-            fg_color="#9C27B0",
-            hover_color="#7B1FA2",
-            text_color="white",
-            width=100
-        )
-        btn_template.pack(pady=2)
-
-    def create_badge(self, parent, text: str, color: str):
-        """Create a status badge"""
-        badge = ctk.CTkLabel(
-            parent,
-            text=text,
-            fg_color=color,
-            text_color="white",
-            corner_radius=4,
-            font=ctk.CTkFont(size=15),
-            padx=8,
-            pady=2
-        )
-        badge.pack(side="left", padx=(0, 5))
-
-    def get_incomplete_checklist_items(self, event_id: int):
-        """Get incomplete checklist items for an event"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM event_checklist_items
-            WHERE event_id = ? AND is_completed = 0
-            ORDER BY sort_order
-        ''', (event_id,))
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+            height += 30
+        if event['todo_count']:
+            height += 35 + 25 * len(event['todo_items'])
+            if event['todo_count'] > len(event['todo_items']):
+                height += 25
+        return height
 
     def show_new_event_dialog(self):
         """Show dialog to create a new event"""
         dialog = EventEditDialog(self, self.db, None)
         self.wait_window(dialog)
-        self.load_events()
 
     def show_template_selection_dialog(self):
         """Show dialog to select a template and create event"""
         dialog = TemplateSelectionDialog(self, self.db, self.event_manager)
         self.wait_window(dialog)
         if dialog.created_event_id:
-            self.load_events()
             messagebox.showinfo("Event Created", f"Event '{dialog.created_event_name}' has been created from template!")
 
     def show_event_details(self, event_id: int):
         """Show event details/edit dialog"""
         dialog = EventEditDialog(self, self.db, event_id)
         self.wait_window(dialog)
-        self.load_events()
 
     def delete_event(self, event_id: int, event_name: str):
         """Delete an event after confirmation"""
@@ -360,7 +284,6 @@ class EventsView(ctk.CTkFrame):
         )
         if result:
             self.event_manager.delete_event(event_id)
-            self.load_events()
             messagebox.showinfo("Moved to Trash", f"'{event_name}' has been moved to Deleted Events.\n\nYou can restore it from the Deleted Events page.")
 
     def make_into_template(self, event_id: int):
@@ -483,7 +406,8 @@ class EventsView(ctk.CTkFrame):
     def export_all_events_pdf(self):
         """Export all upcoming events to a printable PDF"""
         try:
-            # Create PDF generator
+            # Create PDF generator (reportlab is only loaded when a PDF is made)
+            from pdf_generator import EventPDFGenerator
             pdf_gen = EventPDFGenerator(self.db)
 
             # Ask user where to save the PDF
@@ -496,25 +420,235 @@ class EventsView(ctk.CTkFrame):
             if not output_path:
                 return  # User cancelled
 
-            # Generate the PDF
-            result_path = pdf_gen.generate_upcoming_events_list(output_path)
-
-            # Show success message
-            messagebox.showinfo(
-                "PDF Generated",
-                f"Upcoming events PDF has been generated successfully!\n\nSaved to:\n{result_path}"
+            # Generate the PDF on the database worker so the window stays responsive
+            self.db.worker.run(
+                self, pdf_gen.generate_upcoming_events_list, output_path,
+                on_done=self.on_events_pdf_generated,
+                on_error=self.on_events_pdf_failed
             )
 
-            # Ask if user wants to open the file
-            if messagebox.askyesno("Open PDF", "Would you like to open the PDF now?"):
-                os.startfile(result_path)
-
-        except ValueError as e:
-            # No upcoming events
-            messagebox.showwarning("No Events", str(e))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate PDF:\n{str(e)}")
 
+    def on_events_pdf_generated(self, result_path: str):
+        """Tell the user where the upcoming events PDF was saved"""
+        # Show success message
+        messagebox.showinfo(
+            "PDF Generated",
+            f"Upcoming events PDF has been generated successfully!\n\nSaved to:\n{result_path}"
+        )
+
+        # Ask if user wants to open the file
+        if messagebox.askyesno("Open PDF", "Would you like to open the PDF now?"):
+            os.startfile(result_path)
+
+    def on_events_pdf_failed(self, error: BaseException):
+        """Report why the upcoming events PDF couldn't be generated"""
+        if isinstance(error, ValueError):
+            # No upcoming events
+            messagebox.showwarning("No Events", str(error))
+        else:
+            messagebox.showerror("Error", f"Failed to generate PDF:\n{str(error)}")
+
+
+class EventCard(ctk.CTkFrame):
+    """Card for one event in the events list
+
+    Cards are recycled by the VirtualList as the user scrolls: widgets are
+    built once and show() re-fills them for a different event.
+    """
+
+    BADGES = [
+        ('is_organised', "Organised", "#4CAF50"),
+        ('tickets_live', "Tickets Live", "#2196F3"),
+        ('is_advertised', "Advertised", "#FF9800"),
+        ('is_completed', "Completed", "#9C27B0"),
+    ]
+
+    def __init__(self, parent, view: EventsView):
+        super().__init__(
+            parent,
+            fg_color="#F9F5FA",
+            corner_radius=8,
+            border_width=1,
+            border_color="#E6D9F2"
+        )
+        self.view = view
+        self.event = None
+
+        # Main content frame
+        content = ctk.CTkFrame(self, fg_color="transparent")
+        content.pack(fill="both", expand=True, padx=20, pady=15)
+
+        # Left side - Event info
+        left_frame = ctk.CTkFrame(content, fg_color="transparent")
+        left_frame.pack(side="left", fill="both", expand=True)
+
+        # Event name
+        self.name_label = ctk.CTkLabel(
+            left_frame,
+            text="",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color="#4A2D5E",
+            anchor="w"
+        )
+        self.name_label.pack(anchor="w")
+
+        # Event details
+        self.details_label = ctk.CTkLabel(
+            left_frame,
+            text="",
+            font=ctk.CTkFont(size=15),
+            text_color="#666666",
+            anchor="w"
+        )
+        self.details_label.pack(anchor="w", pady=(5, 0))
+
+        # Tables booked (packed only when set)
+        self.tables_label = ctk.CTkLabel(
+            left_frame,
+            text="",
+            font=ctk.CTkFont(size=15),
+            text_color="#8B5FBF",
+            anchor="w"
+        )
+
+        # Status badges frame
+        self.badges_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
+        self.badges_frame.pack(anchor="w", pady=(10, 0))
+
+        self.badges = {}
+        for key, text, color in self.BADGES:
+            self.badges[key] = ctk.CTkLabel(
+                self.badges_frame,
+                text=text,
+                fg_color=color,
+                text_color="white",
+                corner_radius=4,
+                font=ctk.CTkFont(size=15),
+                padx=8,
+                pady=2
+            )
+
+        # Incomplete checklist items (packed only when there are any)
+        self.checklist_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
+
+        ctk.CTkLabel(
+            self.checklist_frame,
+            text="To Do:",
+            font=ctk.CTkFont(size=15, weight="bold"),
+            text_color="#999999",
+            anchor="w"
+        ).pack(anchor="w")
+
+        self.todo_labels = []
+        for _ in range(3):  # Show max 3 items
+            self.todo_labels.append(ctk.CTkLabel(
+                self.checklist_frame,
+                text="",
+                font=ctk.CTkFont(size=15),
+                text_color="#AAAAAA",
+                anchor="w"
+            ))
+
+        self.more_label = ctk.CTkLabel(
+            self.checklist_frame,
+            text="",
+            font=ctk.CTkFont(size=15),
+            text_color="#CCCCCC",
+            anchor="w"
+        )
+
+        # Right side - Actions
+        right_frame = ctk.CTkFrame(content, fg_color="transparent")
+        right_frame.pack(side="right")
+
+        # View/Edit button
+        ctk.CTkButton(
+            right_frame,
+            text="View/Edit",
+            command=lambda: self.view.show_event_details(self.event['id']),
+            fg_color="#8B5FBF",
+            hover_color="#7A4FB0",
+            text_color="white",
+            width=100
+        ).pack(pady=2)
+
+        # Delete button
+        ctk.CTkButton(
+            right_frame,
+            text="Delete",
+            command=lambda: self.view.delete_event(self.event['id'], self.event['event_name']),
+            fg_color="#E57373",
+            hover_color="#D32F2F",
+            text_color="white",
+            width=100
+        ).pack(pady=2)
+
+        # Make into Template button
+        ctk.CTkButton(
+            right_frame,
+            text="Make Template",
+            command=lambda: self.view.make_into_template(self.event['id']),
+            fg_color="#9C27B0",
+            hover_color="#7B1FA2",
+            text_color="white",
+            width=100
+        ).pack(pady=2)
+
+    def show(self, event: dict):
+        """Fill the card in for an event"""
+        self.event = event
+        self.name_label.configure(text=event['event_name'])
+
+        details_text = []
+
+        # Format date nicely
+        try:
+            event_date = datetime.strptime(event['event_date'], '%Y-%m-%d')
+            details_text.append(event_date.strftime('%A, %d %B %Y'))
+        except:
+            details_text.append(event['event_date'])
+
+        if event.get('event_type_name'):
+            details_text.append(event['event_type_name'])
+        if event.get('format_name'):
+            details_text.append(event['format_name'])
+        if event.get('pairing_method_name'):
+            details_text.append(event['pairing_method_name'])
+        self.details_label.configure(text=" • ".join(details_text))
+
+        # Tables booked
+        if event.get('tables_booked'):
+            self.tables_label.configure(text=f"Tables Booked: {event['tables_booked']}")
+            self.tables_label.pack(anchor="w", pady=(5, 0), before=self.badges_frame)
+        else:
+            self.tables_label.pack_forget()
+
+        # Status badges
+        for badge in self.badges.values():
+            badge.pack_forget()
+        for key, _, _ in self.BADGES:
+            if event.get(key):
+                self.badges[key].pack(side="left", padx=(0, 5))
+
+        # Incomplete checklist items
+        for label in self.todo_labels + [self.more_label]:
+            label.pack_forget()
+
+        if event['todo_count']:
+            for label, description in zip(self.todo_labels, event['todo_items']):
+                label.configure(text=f"☐ {description}")
+                label.pack(anchor="w", padx=(10, 0))
+
+            if event['todo_count'] > len(event['todo_items']):
+                self.more_label.configure(text=f"   +{event['todo_count'] - len(event['todo_items'])} more...")
+                self.more_label.pack(anchor="w", padx=(10, 0))
+
+            self.checklist_frame.pack(anchor="w", pady=(10, 0))
+        else:
+            self.checklist_frame.pack_forget()
+
 
 class TemplateSelectionDialog(ctk.CTkToplevel):
     """Dialog for selecting a template and creating an event"""
@@ -705,6 +839,7 @@ class EventFromTemplateDialog(ctk.CTkToplevel):
         )
         date_label.pack(anchor="w", pady=(10, 5))
 
+        from tkcalendar import DateEntry
         self.date_entry = DateEntry(
             main_frame,
             background='#C5A8D9',
@@ -785,6 +920,14 @@ class EventEditDialog(ctk.CTkToplevel):
         self.event_data = None
         self.analysis_data = None
 
+        # Tabs write child rows directly, so open views are told about the event when the dialog closes
+        self.published_version = db.data_version
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+        # Every tab's child rows in one batched read; the tabs themselves are built when first selected
+        self.prefetched_rows = self.event_manager.get_event_children(event_id) if event_id else {}
+        self.prefetched_version = db.data_version
+
         # Configure window
         if event_id:
             self.title("Edit Event")
@@ -814,19 +957,39 @@ class EventEditDialog(ctk.CTkToplevel):
         if self.event_data:
             self.populate_fields()
 
+    def destroy(self):
+        if self.event_id and self.db.data_version != self.published_version:
+            self.published_version = self.db.data_version
+            self.db.changes.publish('event', self.event_id, UPDATED)
+        super().destroy()
+
     def load_analysis_data(self):
         """Load post-event analysis data if it exists"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM event_analysis WHERE event_id = ?', (self.event_id,))
-        row = cursor.fetchone()
-        conn.close()
-        return dict(row) if row else None
+        rows = self.get_child_rows('analysis')
+        return rows[0] if rows else None
+
+    def get_child_rows(self, table: str, sort_key=None, reverse: bool = False) -> list:
+        """Child rows of this event (see EVENT_CHILD_QUERIES) for a tab
+
+        Served from the batch read when the dialog opened until something is
+        written; after that each table is read again once and kept until the
+        next write.
+        """
+        if self.db.data_version != self.prefetched_version:
+            self.prefetched_rows = {}
+            self.prefetched_version = self.db.data_version
+        if table not in self.prefetched_rows:
+            self.prefetched_rows.update(self.event_manager.get_event_children(self.event_id, [table]))
+
+        rows = self.prefetched_rows[table]
+        if sort_key:
+            rows = sorted(rows, key=sort_key, reverse=reverse)
+        return rows
 
     def create_tabs(self):
         """Create tabbed interface"""
         # Create tab view
-        self.tabview = ctk.CTkTabview(self, fg_color="#F5F0F6")
+        self.tabview = ctk.CTkTabview(self, fg_color="#F5F0F6", command=self.on_tab_selected)
         self.tabview.pack(fill="both", expand=True, padx=20, pady=(20, 10))
 
         # Add tabs
@@ -842,21 +1005,33 @@ class EventEditDialog(ctk.CTkToplevel):
             self.tab_pre_event = self.tabview.add("Pre-Event Analysis")
             self.tab_post_event = self.tabview.add("Post-Event Analysis")
 
-        # Create content for each tab
+        # Create content for the details tab; the others are built the first time they are selected
         self.create_details_tab()
+        self.built_tabs = {"Event Details"}
+        self.tab_builders = {}
 
         if self.event_id:
-            self.create_tickets_tab()
-            self.create_prizes_tab()
-            self.create_players_tab()
-            self.create_checklist_tab()
-            self.create_notes_tab()
-            self.create_pre_event_tab()
-            self.create_post_event_tab()
+            self.tab_builders = {
+                "Ticket Tiers": self.create_tickets_tab,
+                "Prize Support and Materials": self.create_prizes_tab,
+                "Players": self.create_players_tab,
+                "Checklist": self.create_checklist_tab,
+                "Notes": self.create_notes_tab,
+                "Pre-Event Analysis": self.create_pre_event_tab,
+                "Post-Event Analysis": self.create_post_event_tab,
+            }
 
         # Save/Cancel buttons at bottom (outside tabs)
         self.create_buttons()
 
+    def on_tab_selected(self):
+        """Build the selected tab if this is the first time it has been shown"""
+        name = self.tabview.get()
+        if name in self.built_tabs or name not in self.tab_builders:
+            return
+        self.built_tabs.add(name)
+        self.tab_builders[name]()
+
     def create_buttons(self):
         """Create save/cancel buttons"""
         # Destroy existing button frame if it exists to prevent duplicates
@@ -953,6 +1128,7 @@ class EventEditDialog(ctk.CTkToplevel):
 
         # Event Date
         ctk.CTkLabel(scroll, text="Event Date *", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        from tkcalendar import DateEntry
         self.entry_date = DateEntry(scroll, selectmode='day', date_pattern='yyyy-mm-dd',
                                     background='#8B5FBF', foreground='white', borderwidth=2)
         self.entry_date.pack(fill="x", pady=(0, 15))
@@ -1105,15 +1281,7 @@ class EventEditDialog(ctk.CTkToplevel):
             widget.destroy()
 
         # Get tickets
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM ticket_tiers
-            WHERE event_id = ?
-            ORDER BY price
-        ''', (self.event_id,))
-        tickets = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        tickets = self.get_child_rows('ticket_tiers')
 
         if not tickets:
             ctk.CTkLabel(
@@ -1247,15 +1415,7 @@ class EventEditDialog(ctk.CTkToplevel):
             widget.destroy()
 
         # Get prizes
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM prize_items
-            WHERE event_id = ?
-            ORDER BY created_at
-        ''', (self.event_id,))
-        prizes = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        prizes = self.get_child_rows('prize_items')
 
         if not prizes:
             ctk.CTkLabel(
@@ -1432,15 +1592,7 @@ class EventEditDialog(ctk.CTkToplevel):
             widget.destroy()
 
         # Get players
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM event_players
-            WHERE event_id = ?
-            ORDER BY sort_order, player_name
-        ''', (self.event_id,))
-        players = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        players = self.get_child_rows('players')
 
         if not players:
             ctk.CTkLabel(
@@ -1591,19 +1743,10 @@ class EventEditDialog(ctk.CTkToplevel):
         # Clear existing widgets
         for widget in self.checklist_items_frame.winfo_children():
             widget.destroy()
+        self.checklist_labels = {}
 
         # Get checklist items grouped by category
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT ci.*, cc.name as category_name
-            FROM event_checklist_items ci
-            LEFT JOIN checklist_categories cc ON ci.category_id = cc.id
-            WHERE ci.event_id = ?
-            ORDER BY cc.sort_order, ci.sort_order, ci.description
-        ''', (self.event_id,))
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        items = self.get_child_rows('checklist_items')
 
         if not items:
             ctk.CTkLabel(
@@ -1720,6 +1863,7 @@ class EventEditDialog(ctk.CTkToplevel):
             text_color="#4A2D5E" if not item.get('is_completed') else "#999999"
         )
         desc_label.pack(side="left")
+        self.checklist_labels[item['id']] = desc_label
 
         # Additional info
         info_parts = []
@@ -1863,7 +2007,12 @@ class EventEditDialog(ctk.CTkToplevel):
         ''', (1 if var.get() else 0, item['id']))
         conn.commit()
         conn.close()
-        self.refresh_checklist_items()
+
+        # Only this row changes, so restyle it rather than rebuilding the whole checklist
+        item['is_completed'] = 1 if var.get() else 0
+        self.checklist_labels[item['id']].configure(
+            text_color="#4A2D5E" if not item['is_completed'] else "#999999"
+        )
 
     def add_checklist_item(self):
         """Show dialog to add a new checklist item"""
@@ -1926,15 +2075,7 @@ class EventEditDialog(ctk.CTkToplevel):
             widget.destroy()
 
         # Get notes (only those marked to show in Notes tab)
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM event_notes
-            WHERE event_id = ? AND show_in_notes_tab = 1
-            ORDER BY created_at DESC
-        ''', (self.event_id,))
-        notes = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        notes = [note for note in self.get_child_rows('notes') if note.get('show_in_notes_tab') == 1]
 
         if not notes:
             ctk.CTkLabel(
@@ -2100,18 +2241,8 @@ class EventEditDialog(ctk.CTkToplevel):
         for widget in self.labor_entries_frame.winfo_children():
             widget.destroy()
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
         # Check if we have labor projections stored for this event
-        cursor.execute('''
-            SELECT * FROM labour_costs
-            WHERE event_id = ?
-            ORDER BY id
-        ''', (self.event_id,))
-
-        labor_entries = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        labor_entries = self.get_child_rows('labour_costs')
 
         if not labor_entries:
             ctk.CTkLabel(
@@ -2224,15 +2355,7 @@ class EventEditDialog(ctk.CTkToplevel):
 
     def load_revenue_projection(self, parent):
         """Load revenue projection from ticket tiers"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM ticket_tiers
-            WHERE event_id = ?
-            ORDER BY price DESC
-        ''', (self.event_id,))
-        ticket_tiers = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        ticket_tiers = self.get_child_rows('ticket_tiers', sort_key=lambda t: t['price'], reverse=True)
 
         if not ticket_tiers:
             ctk.CTkLabel(
@@ -2277,29 +2400,16 @@ class EventEditDialog(ctk.CTkToplevel):
         for widget in self.breakeven_frame.winfo_children():
             widget.destroy()
 
-        # Get costs from database
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        # Get labor costs from labour_costs table
-        cursor.execute('SELECT SUM(total_cost) as labor_total FROM labour_costs WHERE event_id = ?', (self.event_id,))
-        result = cursor.fetchone()
-        labor_cost = result['labor_total'] if result and result['labor_total'] else 0.0
-
-        cursor.execute('SELECT SUM(total_cost) as prize_total FROM prize_items WHERE event_id = ?', (self.event_id,))
-        result = cursor.fetchone()
-        prize_cost = result['prize_total'] if result and result['prize_total'] else 0.0
-
-        cursor.execute('SELECT SUM(amount) as other_total FROM event_costs WHERE event_id = ?', (self.event_id,))
-        result = cursor.fetchone()
-        other_cost = result['other_total'] if result and result['other_total'] else 0.0
+        # Get costs (labour, prizes and other costs) and ticket totals
+        financials = self.get_financials()
+        labor_cost = financials['labour_cost']
+        prize_cost = financials['prize_cost']
+        other_cost = financials['other_cost']
 
         total_costs = labor_cost + prize_cost + other_cost
 
         # Get ticket tiers
-        cursor.execute('SELECT * FROM ticket_tiers WHERE event_id = ? ORDER BY price DESC', (self.event_id,))
-        ticket_tiers = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        ticket_tiers = self.get_child_rows('ticket_tiers', sort_key=lambda t: t['price'], reverse=True)
 
         # Display cost summary
         ctk.CTkLabel(
@@ -2343,8 +2453,8 @@ class EventEditDialog(ctk.CTkToplevel):
         be_content.pack(fill="x", padx=15, pady=15)
 
         # Calculate per-tier break-even
-        total_capacity = sum(tier['quantity_available'] for tier in ticket_tiers)
-        max_revenue = sum(tier['price'] * tier['quantity_available'] for tier in ticket_tiers)
+        total_capacity = financials['ticket_capacity']
+        max_revenue = financials['max_ticket_revenue']
 
         if total_capacity > 0:
             # Calculate how many tickets at average price
@@ -2571,7 +2681,7 @@ class EventEditDialog(ctk.CTkToplevel):
             self.populate_fields()
 
         # Refresh the post-event analysis tab to show updated completion status
-        if hasattr(self, 'tab_post_event'):
+        if "Post-Event Analysis" in self.built_tabs:
             # Clear the tab and recreate it
             for widget in self.tab_post_event.winfo_children():
                 widget.destroy()
@@ -2610,7 +2720,7 @@ class EventEditDialog(ctk.CTkToplevel):
             self.populate_fields()
 
         # Refresh the post-event analysis tab to show updated completion status
-        if hasattr(self, 'tab_post_event'):
+        if "Post-Event Analysis" in self.built_tabs:
             # Clear the tab and recreate it
             for widget in self.tab_post_event.winfo_children():
                 widget.destroy()
@@ -2620,15 +2730,7 @@ class EventEditDialog(ctk.CTkToplevel):
 
     def load_ticket_sales_tracking(self, parent):
         """Load ticket sales tracking for post-event"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM ticket_tiers
-            WHERE event_id = ?
-            ORDER BY tier_name
-        ''', (self.event_id,))
-        ticket_tiers = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        ticket_tiers = self.get_child_rows('ticket_tiers', sort_key=lambda t: t['tier_name'])
 
         if not ticket_tiers:
             ctk.CTkLabel(
@@ -2714,15 +2816,7 @@ class EventEditDialog(ctk.CTkToplevel):
 
     def load_prize_handout_tracking(self, parent):
         """Load prize handout tracking for post-event"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM prize_items
-            WHERE event_id = ?
-            ORDER BY description
-        ''', (self.event_id,))
-        prizes = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        prizes = self.get_child_rows('prize_items', sort_key=lambda p: p['description'] or '')
 
         if not prizes:
             ctk.CTkLabel(
@@ -2811,12 +2905,7 @@ class EventEditDialog(ctk.CTkToplevel):
     def load_event_analysis(self, parent):
         """Load comprehensive event analysis form"""
         # Get existing analysis data
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM event_analysis WHERE event_id = ?', (self.event_id,))
-        row = cursor.fetchone()
-        analysis = dict(row) if row else None
-        conn.close()
+        analysis = self.load_analysis_data()
 
         # Actual Attendance
         ctk.CTkLabel(parent, text="Actual Attendance", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(5, 2))
@@ -3119,15 +3208,7 @@ class EventEditDialog(ctk.CTkToplevel):
         for widget in self.post_event_notes_frame.winfo_children():
             widget.destroy()
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT * FROM event_notes
-            WHERE event_id = ?
-            ORDER BY created_at DESC
-        ''', (self.event_id,))
-        notes = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        notes = self.get_child_rows('notes')
 
         if not notes:
             ctk.CTkLabel(
@@ -3252,11 +3333,7 @@ class EventEditDialog(ctk.CTkToplevel):
     def save_note_to_template(self, note_data: dict):
         """Save a note to template(s)"""
         # Get list of templates to choose from
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, name FROM event_templates ORDER BY name')
-        templates = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        templates = self.db.get_reference_rows('event_templates')
 
         if not templates:
             messagebox.showwarning("No Templates", "No templates available. Create a template first.")
@@ -3464,44 +3541,17 @@ class EventEditDialog(ctk.CTkToplevel):
         if self.analysis_data:
             self.populate_analysis_fields()
 
+    def get_financials(self) -> dict:
+        """This event's revenue and cost totals (see summarise_financials)"""
+        rows = self.get_child_rows('financials')
+        return summarise_financials(rows[0] if rows else None)
+
     def calculate_financial_summary(self):
         """Calculate total revenue, costs, and profit"""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        # Get ticket revenue
-        cursor.execute('''
-            SELECT SUM(price * quantity_sold) as revenue
-            FROM ticket_tiers
-            WHERE event_id = ?
-        ''', (self.event_id,))
-        revenue_row = cursor.fetchone()
-        revenue = float(revenue_row['revenue']) if revenue_row and revenue_row['revenue'] else 0.0
-
-        # Get costs (event_costs + labour_costs)
-        cursor.execute('''
-            SELECT SUM(amount) as total_costs
-            FROM event_costs
-            WHERE event_id = ?
-        ''', (self.event_id,))
-        event_costs_row = cursor.fetchone()
-        event_costs = float(event_costs_row['total_costs']) if event_costs_row and event_costs_row['total_costs'] else 0.0
-
-        cursor.execute('''
-            SELECT SUM(total_cost) as labour_total
-            FROM labour_costs
-            WHERE event_id = ?
-        ''', (self.event_id,))
-        labour_row = cursor.fetchone()
-        labour_costs = float(labour_row['labour_total']) if labour_row and labour_row['labour_total'] else 0.0
-
-        total_costs = event_costs + labour_costs
-
-        conn.close()
-
+        financials = self.get_financials()
         return {
-            'revenue': revenue,
-            'costs': total_costs
+            'revenue': float(financials['ticket_revenue']),
+            'costs': float(financials['cost_total'])
         }
 
     def populate_analysis_fields(self):
@@ -3621,22 +3671,29 @@ class EventEditDialog(ctk.CTkToplevel):
             if not file_path:
                 return  # User cancelled
 
-            # Generate PDF
+            # Generate PDF on the database worker so the dialog stays responsive
+            from pdf_generator import EventPDFGenerator
             pdf_generator = EventPDFGenerator(self.db)
-            output_path = pdf_generator.generate_event_sheet(self.event_id, file_path)
-
-            messagebox.showinfo(
-                "Success",
-                f"Event sheet saved successfully!\n\nLocation: {output_path}"
+            self.db.worker.run(
+                self, pdf_generator.generate_event_sheet, self.event_id, file_path,
+                on_done=self.on_event_sheet_generated,
+                on_error=lambda e: messagebox.showerror("Error", f"Failed to generate PDF: {str(e)}")
             )
 
-            # Ask if user wants to open the PDF
-            if messagebox.askyesno("Open PDF?", "Would you like to open the PDF now?"):
-                os.startfile(output_path)  # Windows-specific
-
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate PDF: {str(e)}")
 
+    def on_event_sheet_generated(self, output_path: str):
+        """Tell the user where the event sheet was saved"""
+        messagebox.showinfo(
+            "Success",
+            f"Event sheet saved successfully!\n\nLocation: {output_path}"
+        )
+
+        # Ask if user wants to open the PDF
+        if messagebox.askyesno("Open PDF?", "Would you like to open the PDF now?"):
+            os.startfile(output_path)  # Windows-specific
+
     def populate_dropdowns(self):
         """Populate dropdown values from reference data"""
         # Event types
@@ -3739,6 +3796,7 @@ class EventEditDialog(ctk.CTkToplevel):
         new_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        self.db.invalidate_reference_data(table)
 
         # Refresh reference data
         self.ref_data = self.event_manager.get_reference_data()
@@ -3843,20 +3901,25 @@ class EventEditDialog(ctk.CTkToplevel):
             'is_organised': self.var_organised.get(),
             'tickets_live': self.var_tickets_live.get(),
             'is_advertised': self.var_advertised.get(),
-            'is_completed': self.event_data.get('is_completed') if self.event_data else False,
-            'include_attendees': self.var_include_attendees.get() if hasattr(self, 'var_include_attendees') else False
+            'is_completed': self.event_data.get('is_completed') if self.event_data else False
         }
+        # Owned by the Players tab; left out (so the saved value is kept) until that tab is built
+        if "Players" in self.built_tabs:
+            event_data['include_attendees'] = self.var_include_attendees.get()
 
         # Save to database
         try:
             if self.event_id:
                 self.event_manager.update_event(self.event_id, event_data)
-                # If post-event analysis tab exists, save analysis data
-                if hasattr(self, 'tab_post_event'):
+                # If post-event analysis tab has been opened, save analysis data
+                if "Post-Event Analysis" in self.built_tabs:
                     self.save_event_analysis(show_success_message=False)
+                # update_event() already announced the change
+                self.published_version = self.db.data_version
                 messagebox.showinfo("Success", "Event updated successfully!")
             else:
                 new_event_id = self.event_manager.create_event(event_data)
+                self.published_version = self.db.data_version
                 messagebox.showinfo("Success", "Event created successfully!")
                 # Update dialog to edit mode for the newly created event
                 self.event_id = new_event_id
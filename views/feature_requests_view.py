@@ -2,6 +2,7 @@
 import customtkinter as ctk
 from datetime import datetime
 from tkinter import messagebox
+from widgets.virtual_list import VirtualList
 
 class FeatureRequestsView(ctk.CTkFrame):
     """View for managing feature requests and ideas"""
@@ -96,19 +97,26 @@ class FeatureRequestsView(ctk.CTkFrame):
         self.priority_filter.set("All")
         self.priority_filter.pack(side="left")
 
-        # Scrollable frame for requests
-        self.scroll_frame = ctk.CTkScrollableFrame(self, fg_color="white")
-        self.scroll_frame.pack(fill="both", expand=True, padx=30, pady=(0, 30))
+        # Requests list (only the visible cards are built)
+        self.requests_list = VirtualList(
+            self,
+            create_row=lambda parent: RequestCard(parent, self),
+            bind_row=lambda card, request: card.show(request),
+            estimate_height=self.estimate_card_height,
+            row_pady=8,
+            empty_text="No feature requests found.\nClick 'Add New Request' to create one!"
+        )
+        self.requests_list.pack(fill="both", expand=True, padx=30, pady=(0, 30))
 
         # Load requests
         self.load_requests()
 
+    def refresh(self):
+        """Reload the view's data (called when a cached view is shown again)"""
+        self.load_requests()
+
     def load_requests(self):
         """Load and display all feature requests"""
-        # Clear existing items
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
-
         conn = self.db.get_connection()
         cursor = conn.cursor()
 
@@ -129,122 +137,129 @@ class FeatureRequestsView(ctk.CTkFrame):
         query += " ORDER BY CASE priority WHEN 'High' THEN 1 WHEN 'Medium' THEN 2 WHEN 'Low' THEN 3 END, submitted_date DESC"
 
         cursor.execute(query, params)
-        requests = cursor.fetchall()
+        requests = [dict(row) for row in cursor.fetchall()]
         conn.close()
 
-        if not requests:
-            ctk.CTkLabel(
-                self.scroll_frame,
-                text="No feature requests found.\nClick 'Add New Request' to create one!",
-                font=ctk.CTkFont(size=15),
-                text_color="#999999"
-            ).pack(pady=40)
-            return
+        self.requests_list.set_items(requests)
 
-        for req in requests:
-            self.create_request_card(dict(req))
+    def estimate_card_height(self, request: dict) -> int:
+        """Rough card height from the description length, until the card is measured"""
+        lines = sum(len(line) // 110 + 1 for line in (request['description'] or '').split('\n'))
+        return 120 + 22 * lines
 
-    def create_request_card(self, request):
-        """Create a card for displaying a request"""
-        # Determine colors based on priority and status
-        if request['priority'] == 'High':
-            border_color = "#E57373"
-            priority_bg = "#FFEBEE"
-        elif request['priority'] == 'Medium':
-            border_color = "#FFB74D"
-            priority_bg = "#FFF3E0"
-        else:
-            border_color = "#81C784"
-            priority_bg = "#E8F5E9"
+    def add_request(self):
+        """Open dialog to add a new request"""
+        dialog = RequestDialog(self, self.db, title="Add Feature Request")
+        self.wait_window(dialog)
+        self.load_requests()
 
-        if request['status'] == 'Completed':
-            border_color = "#81C784"
-        elif request['status'] == 'Declined':
-            border_color = "#9E9E9E"
+    def edit_request(self, request):
+        """Open dialog to edit a request"""
+        dialog = RequestDialog(self, self.db, request=request, title="Edit Feature Request")
+        self.wait_window(dialog)
+        self.load_requests()
 
-        # Card frame
-        card = ctk.CTkFrame(
-            self.scroll_frame,
-            fg_color="white",
-            border_width=2,
-            border_color=border_color
-        )
-        card.pack(fill="x", padx=10, pady=8)
+    def delete_request(self, request):
+        """Delete a feature request"""
+        if messagebox.askyesno(
+            "Confirm Delete",
+            f"Are you sure you want to delete this feature request?\n\n{request['title']}"
+        ):
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM feature_requests WHERE id = ?", (request['id'],))
+            conn.commit()
+            conn.close()
+            self.load_requests()
+
+
+class RequestCard(ctk.CTkFrame):
+    """Card for one feature request; recycled by the VirtualList as the user scrolls"""
+
+    PRIORITY_COLORS = {
+        # priority: (border color, badge color)
+        'High': ("#E57373", "#FFEBEE"),
+        'Medium': ("#FFB74D", "#FFF3E0"),
+        'Low': ("#81C784", "#E8F5E9"),
+    }
+
+    STATUS_COLORS = {
+        'Submitted': '#E3F2FD',
+        'Under Review': '#FFF9C4',
+        'Planned': '#F3E5F5',
+        'In Progress': '#E1F5FE',
+        'Completed': '#E8F5E9',
+        'Declined': '#F5F5F5'
+    }
+
+    def __init__(self, parent, view: FeatureRequestsView):
+        super().__init__(parent, fg_color="white", border_width=2)
+        self.view = view
+        self.request = None
 
         # Header frame
-        header = ctk.CTkFrame(card, fg_color="transparent")
+        header = ctk.CTkFrame(self, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=(15, 5))
 
         # Title
-        ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             header,
-            text=request['title'],
+            text="",
             font=ctk.CTkFont(size=16, weight="bold"),
             text_color="#8B5FBF",
             anchor="w"
-        ).pack(side="left", fill="x", expand=True)
+        )
+        self.title_label.pack(side="left", fill="x", expand=True)
 
         # Priority badge
-        priority_badge = ctk.CTkLabel(
+        self.priority_badge = ctk.CTkLabel(
             header,
-            text=request['priority'],
+            text="",
             font=ctk.CTkFont(size=11, weight="bold"),
             text_color="#4A2D5E",
-            fg_color=priority_bg,
             corner_radius=5,
             padx=10,
             pady=3
         )
-        priority_badge.pack(side="right", padx=(10, 0))
+        self.priority_badge.pack(side="right", padx=(10, 0))
 
         # Status badge
-        status_colors = {
-            'Submitted': '#E3F2FD',
-            'Under Review': '#FFF9C4',
-            'Planned': '#F3E5F5',
-            'In Progress': '#E1F5FE',
-            'Completed': '#E8F5E9',
-            'Declined': '#F5F5F5'
-        }
-        status_badge = ctk.CTkLabel(
+        self.status_badge = ctk.CTkLabel(
             header,
-            text=request['status'],
+            text="",
             font=ctk.CTkFont(size=11, weight="bold"),
             text_color="#4A2D5E",
-            fg_color=status_colors.get(request['status'], '#F5F5F5'),
             corner_radius=5,
             padx=10,
             pady=3
         )
-        status_badge.pack(side="right")
+        self.status_badge.pack(side="right")
 
         # Description
-        desc_label = ctk.CTkLabel(
-            card,
-            text=request['description'],
+        self.desc_label = ctk.CTkLabel(
+            self,
+            text="",
             font=ctk.CTkFont(size=15),
             text_color="#4A2D5E",
             anchor="w",
             justify="left",
             wraplength=1000
         )
-        desc_label.pack(fill="x", padx=20, pady=(5, 10), anchor="w")
+        self.desc_label.pack(fill="x", padx=20, pady=(5, 10), anchor="w")
 
         # Footer with metadata
-        footer = ctk.CTkFrame(card, fg_color="transparent")
+        footer = ctk.CTkFrame(self, fg_color="transparent")
         footer.pack(fill="x", padx=20, pady=(5, 15))
 
         # Submitted by and date
-        submitted_date = datetime.strptime(request['submitted_date'], '%Y-%m-%d %H:%M:%S').strftime('%d %b %Y')
-        meta_text = f"Submitted by: {request['submitted_by'] or 'Unknown'} | {submitted_date}"
-
-        ctk.CTkLabel(
+        self.meta_label = ctk.CTkLabel(
             footer,
-            text=meta_text,
+            text="",
             font=ctk.CTkFont(size=15),
             text_color="#999999",
             anchor="w"
-        ).pack(side="left")
+        )
+        self.meta_label.pack(side="left")
 
         # Action buttons
         btn_frame = ctk.CTkFrame(footer, fg_color="transparent")
@@ -253,7 +268,7 @@ class FeatureRequestsView(ctk.CTkFrame):
         ctk.CTkButton(
             btn_frame,
             text="Edit",
-            command=lambda: self.edit_request(request),
+            command=lambda: self.view.edit_request(self.request),
             fg_color="#C5A8D9",
             hover_color="#B491CC",
             text_color="#4A2D5E",
@@ -265,7 +280,7 @@ class FeatureRequestsView(ctk.CTkFrame):
         ctk.CTkButton(
             btn_frame,
             text="Delete",
-            command=lambda: self.delete_request(request),
+            command=lambda: self.view.delete_request(self.request),
             fg_color="#E57373",
             hover_color="#D76C6C",
             text_color="white",
@@ -274,30 +289,26 @@ class FeatureRequestsView(ctk.CTkFrame):
             font=ctk.CTkFont(size=15)
         ).pack(side="left")
 
-    def add_request(self):
-        """Open dialog to add a new request"""
-        dialog = RequestDialog(self, self.db, title="Add Feature Request")
-        self.wait_window(dialog)
-        self.load_requests()
+    def show(self, request: dict):
+        """Fill the card in for a request"""
+        self.request = request
 
-    def edit_request(self, request):
-        """Open dialog to edit a request"""
-        dialog = RequestDialog(self, self.db, request=request, title="Edit Feature Request")
-        self.wait_window(dialog)
-        self.load_requests()
+        # Determine colors based on priority and status
+        border_color, priority_bg = self.PRIORITY_COLORS.get(request['priority'], self.PRIORITY_COLORS['Low'])
+        if request['status'] == 'Completed':
+            border_color = "#81C784"
+        elif request['status'] == 'Declined':
+            border_color = "#9E9E9E"
+        self.configure(border_color=border_color)
 
-    def delete_request(self, request):
-        """Delete a feature request"""
-        if messagebox.askyesno(
-            "Confirm Delete",
-            f"Are you sure you want to delete this feature request?\n\n{request['title']}"
-        ):
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM feature_requests WHERE id = ?", (request['id'],))
-            conn.commit()
-            conn.close()
-            self.load_requests()
+        self.title_label.configure(text=request['title'])
+        self.priority_badge.configure(text=request['priority'], fg_color=priority_bg)
+        self.status_badge.configure(text=request['status'],
+                                    fg_color=self.STATUS_COLORS.get(request['status'], '#F5F5F5'))
+        self.desc_label.configure(text=request['description'])
+
+        submitted_date = datetime.strptime(request['submitted_date'], '%Y-%m-%d %H:%M:%S').strftime('%d %b %Y')
+        self.meta_label.configure(text=f"Submitted by: {request['submitted_by'] or 'Unknown'} | {submitted_date}")
 
 
 class RequestDialog(ctk.CTkToplevel):
@@ -1,6 +1,8 @@
 """Feedback view for displaying feedback items from events"""
 import customtkinter as ctk
+from datetime import datetime
 from tkinter import messagebox
+from widgets.virtual_list import VirtualList
 
 
 class FeedbackView(ctk.CTkFrame):
@@ -29,18 +31,26 @@ class FeedbackView(ctk.CTkFrame):
         )
         info.pack(padx=30, anchor="w", pady=(0, 20))
 
-        # Scrollable frame for feedback cards
-        self.feedback_scroll = ctk.CTkScrollableFrame(self, fg_color="white")
-        self.feedback_scroll.pack(fill="both", expand=True, padx=30, pady=(0, 30))
+        # Feedback list (only the visible cards are built)
+        self.feedback_list = VirtualList(
+            self,
+            create_row=lambda parent: FeedbackCard(parent, self),
+            bind_row=lambda card, item: card.show(item),
+            estimate_height=lambda item: 110 + 22 * (len(item['feedback_text']) // 100 + 1),
+            row_pady=8,
+            empty_text="No feedback items yet.\n\nAdd feedback from the post-event analysis page."
+        )
+        self.feedback_list.pack(fill="both", expand=True, padx=30, pady=(0, 30))
 
         # Load feedback
         self.load_feedback()
 
+    def refresh(self):
+        """Reload the view's data (called when a cached view is shown again)"""
+        self.load_feedback()
+
     def load_feedback(self):
         """Load all non-dismissed feedback items"""
-        for widget in self.feedback_scroll.winfo_children():
-            widget.destroy()
-
         conn = self.db.get_connection()
         cursor = conn.cursor()
 
@@ -62,113 +72,114 @@ class FeedbackView(ctk.CTkFrame):
         feedback_items = [dict(row) for row in cursor.fetchall()]
         conn.close()
 
-        if not feedback_items:
-            ctk.CTkLabel(
-                self.feedback_scroll,
-                text="No feedback items yet.\n\nAdd feedback from the post-event analysis page.",
-                font=ctk.CTkFont(size=15),
-                text_color="#999999"
-            ).pack(pady=40)
+        self.feedback_list.set_items(feedback_items)
+
+    def dismiss_feedback(self, feedback_id: int):
+        """Dismiss a feedback item"""
+        if not messagebox.askyesno("Dismiss Feedback",
+            "Dismiss this feedback item from the Feedback menu?\n\nNote: It will remain on the original event."):
             return
 
-        for item in feedback_items:
-            self.create_feedback_card(item)
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            UPDATE feedback_items
+            SET is_dismissed = 1
+            WHERE id = ?
+        ''', (feedback_id,))
+
+        conn.commit()
+        conn.close()
+
+        # Reload feedback
+        self.load_feedback()
+
 
-    def create_feedback_card(self, item: dict):
-        """Create a visual card for a feedback item"""
-        card = ctk.CTkFrame(self.feedback_scroll, fg_color="#F9F5FA", border_width=2, border_color="#E6D9F2")
-        card.pack(fill="x", padx=10, pady=8)
+class FeedbackCard(ctk.CTkFrame):
+    """Card for one feedback item; recycled by the VirtualList as the user scrolls"""
 
-        content = ctk.CTkFrame(card, fg_color="transparent")
+    def __init__(self, parent, view: FeedbackView):
+        super().__init__(parent, fg_color="#F9F5FA", border_width=2, border_color="#E6D9F2")
+        self.view = view
+        self.item = None
+
+        content = ctk.CTkFrame(self, fg_color="transparent")
         content.pack(fill="x", padx=15, pady=15)
 
         # Top row - event name and date
         top_row = ctk.CTkFrame(content, fg_color="transparent")
         top_row.pack(fill="x", pady=(0, 10))
 
-        ctk.CTkLabel(
+        self.event_label = ctk.CTkLabel(
             top_row,
-            text=item['event_name'],
+            text="",
             font=ctk.CTkFont(size=15, weight="bold"),
             text_color="#8B5FBF",
             anchor="w"
-        ).pack(side="left")
+        )
+        self.event_label.pack(side="left")
 
         # Event date badge
-        from datetime import datetime
-        event_date = datetime.strptime(item['event_date'], '%Y-%m-%d')
-        date_str = event_date.strftime('%d %b %Y')
-
-        ctk.CTkLabel(
+        self.date_badge = ctk.CTkLabel(
             top_row,
-            text=date_str,
+            text="",
             fg_color="#C5A8D9",
             text_color="white",
             corner_radius=8,
             padx=8,
             pady=4,
             font=ctk.CTkFont(size=15)
-        ).pack(side="right")
+        )
+        self.date_badge.pack(side="right")
 
         # Feedback text
-        text_label = ctk.CTkLabel(
+        self.text_label = ctk.CTkLabel(
             content,
-            text=item['feedback_text'],
+            text="",
             text_color="#4A2D5E",
             font=ctk.CTkFont(size=15),
             anchor="w",
             wraplength=900,
             justify="left"
         )
-        text_label.pack(fill="x", pady=(0, 10))
+        self.text_label.pack(fill="x", pady=(0, 10))
 
         # Bottom row - created date and dismiss button
         bottom_row = ctk.CTkFrame(content, fg_color="transparent")
         bottom_row.pack(fill="x")
 
-        # Created date
-        created_date = datetime.strptime(item['created_at'], '%Y-%m-%d %H:%M:%S')
-        created_str = created_date.strftime('%d %b %Y at %H:%M')
-
-        ctk.CTkLabel(
+        self.created_label = ctk.CTkLabel(
             bottom_row,
-            text=f"Added: {created_str}",
+            text="",
             text_color="#999999",
             font=ctk.CTkFont(size=15),
             anchor="w"
-        ).pack(side="left")
+        )
+        self.created_label.pack(side="left")
 
         # Dismiss button
-        btn_dismiss = ctk.CTkButton(
+        ctk.CTkButton(
             bottom_row,
             text="Dismiss",
-            command=lambda i=item: self.dismiss_feedback(i['id']),
+            command=lambda: self.view.dismiss_feedback(self.item['id']),
             fg_color="#E57373",
             hover_color="#D32F2F",
             text_color="white",
             width=80,
             height=28,
             font=ctk.CTkFont(size=15)
-        )
-        btn_dismiss.pack(side="right")
+        ).pack(side="right")
 
-    def dismiss_feedback(self, feedback_id: int):
-        """Dismiss a feedback item"""
-        if not messagebox.askyesno("Dismiss Feedback",
-            "Dismiss this feedback item from the Feedback menu?\n\nNote: It will remain on the original event."):
-            return
+    def show(self, item: dict):
+        """Fill the card in for a feedback item"""
+        self.item = item
+        self.event_label.configure(text=item['event_name'])
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            UPDATE feedback_items
-            SET is_dismissed = 1
-            WHERE id = ?
-        ''', (feedback_id,))
+        event_date = datetime.strptime(item['event_date'], '%Y-%m-%d')
+        self.date_badge.configure(text=event_date.strftime('%d %b %Y'))
 
-        conn.commit()
-        conn.close()
+        self.text_label.configure(text=item['feedback_text'])
 
-        # Reload feedback
-        self.load_feedback()
+        created_date = datetime.strptime(item['created_at'], '%Y-%m-%d %H:%M:%S')
+        self.created_label.configure(text=f"Added: {created_date.strftime('%d %b %Y at %H:%M')}")
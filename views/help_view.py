@@ -985,11 +985,7 @@ class HelpView(ctk.CTkFrame):
         ).pack(side="left", padx=10)
 
         # Get event types
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, name FROM event_types ORDER BY name')
-        event_types = cursor.fetchall()
-        conn.close()
+        event_types = self.db.get_reference_rows('event_types')
 
         if not event_types:
             ctk.CTkLabel(
@@ -2,8 +2,8 @@
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
 from database import Database
+from startup_trace import TRACE_ENV, TRACE_FLAG, read_trace_log
 from typing import Optional
-import shutil
 from datetime import datetime
 import os
 
@@ -48,6 +48,7 @@ class SettingsView(ctk.CTkFrame):
         self.tabview.add("Pairing Apps")
         self.tabview.add("Award Rates")
         self.tabview.add("Backup")
+        self.tabview.add("Diagnostics")
 
         # Populate tabs
         self.create_event_types_tab()
@@ -56,6 +57,7 @@ class SettingsView(ctk.CTkFrame):
         self.create_apps_tab()
         self.create_rates_tab()
         self.create_backup_tab()
+        self.create_diagnostics_tab()
 
     def create_event_types_tab(self):
         """Create event types management tab"""
@@ -203,6 +205,7 @@ class SettingsView(ctk.CTkFrame):
             cursor.execute(f'DELETE FROM {table_name} WHERE id = ?', (item['id'],))
             conn.commit()
             conn.close()
+            self.db.invalidate_reference_data(table_name)
 
             messagebox.showinfo("Deleted", f"'{item['name']}' has been deleted.")
             self.reload_current_tab(table_name)
@@ -343,11 +346,13 @@ class SettingsView(ctk.CTkFrame):
                 return
 
             # Save to database
-            self.db.update_setting('weekday_before_6pm_rate', str(weekday_before))
-            self.db.update_setting('weekday_after_6pm_rate', str(weekday_after))
-            self.db.update_setting('saturday_rate', str(saturday))
-            self.db.update_setting('sunday_rate', str(sunday))
-            self.db.update_setting('public_holiday_rate', str(public_holiday))
+            self.db.update_settings({
+                'weekday_before_6pm_rate': str(weekday_before),
+                'weekday_after_6pm_rate': str(weekday_after),
+                'saturday_rate': str(saturday),
+                'sunday_rate': str(sunday),
+                'public_holiday_rate': str(public_holiday)
+            })
 
             messagebox.showinfo("Success", "Award rates updated successfully!")
 
@@ -397,6 +402,71 @@ class SettingsView(ctk.CTkFrame):
             font=ctk.CTkFont(size=15)
         ).pack(anchor="w", pady=(10, 0))
 
+    def create_diagnostics_tab(self):
+        """Create the start-up timing tab (from startup_trace.log)"""
+        tab = self.tabview.tab("Diagnostics")
+
+        ctk.CTkLabel(
+            tab,
+            text="Start-up Timing",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            text_color="#4A2D5E"
+        ).pack(anchor="w", padx=10, pady=(10, 20))
+
+        runs = read_trace_log()
+        if not runs:
+            ctk.CTkLabel(
+                tab,
+                text=f"No start-up trace recorded yet.\n\nStart the app with {TRACE_FLAG} "
+                     f"(or set {TRACE_ENV}=1) to record one.",
+                text_color="#666666",
+                font=ctk.CTkFont(size=15),
+                justify="left"
+            ).pack(anchor="w", padx=10)
+            return
+
+        last_run = runs[-1]
+        summary_frame = ctk.CTkScrollableFrame(tab, fg_color="white")
+        summary_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        summary_frame.grid_columnconfigure(0, weight=1)
+
+        ctk.CTkLabel(
+            summary_frame,
+            text=f"Last traced start-up: {last_run['started_at']}",
+            font=ctk.CTkFont(size=15, weight="bold"),
+            text_color="#4A2D5E"
+        ).grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 10))
+
+        rows = [("Phase", "Wall time", "CPU time")]
+        rows += [(phase['name'], f"{phase['wall_ms']:.0f} ms", f"{phase['cpu_ms']:.0f} ms")
+                 for phase in last_run['phases']]
+        rows += [(mark['name'], f"at {mark['wall_ms']:.0f} ms", f"{mark['cpu_ms']:.0f} ms")
+                 for mark in last_run['marks']]
+
+        for row_index, row in enumerate(rows, start=1):
+            for column, text in enumerate(row):
+                ctk.CTkLabel(
+                    summary_frame,
+                    text=text,
+                    font=ctk.CTkFont(size=14, weight="bold" if row_index == 1 else "normal"),
+                    text_color="#4A2D5E",
+                    anchor="w" if column == 0 else "e"
+                ).grid(row=row_index, column=column, sticky="ew", padx=10, pady=2)
+
+        # Time to dashboard across the runs kept in the log
+        paint_times = sorted(
+            mark['wall_ms'] for run in runs for mark in run['marks'] if mark['name'] == "dashboard painted"
+        )
+        if len(paint_times) > 1:
+            ctk.CTkLabel(
+                summary_frame,
+                text=f"Time to dashboard over the last {len(paint_times)} traced start-ups: "
+                     f"median {paint_times[len(paint_times) // 2]:.0f} ms, "
+                     f"best {paint_times[0]:.0f} ms, worst {paint_times[-1]:.0f} ms",
+                text_color="#666666",
+                font=ctk.CTkFont(size=14)
+            ).grid(row=len(rows) + 1, column=0, columnspan=3, sticky="w", padx=10, pady=(15, 10))
+
     def backup_database(self):
         """Backup the database file"""
         try:
@@ -409,8 +479,8 @@ class SettingsView(ctk.CTkFrame):
             )
 
             if backup_path:
-                # Copy the database file
-                shutil.copy2("events.db", backup_path)
+                # Copy the database (includes changes still in the WAL file)
+                self.db.backup_to(backup_path)
                 messagebox.showinfo("Success", f"Database backed up successfully!\n\nSaved to:\n{backup_path}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to backup database:\n{str(e)}")
@@ -529,6 +599,7 @@ class EditItemDialog(ctk.CTkToplevel):
 
             conn.commit()
             conn.close()
+            self.db.invalidate_reference_data(self.table_name)
             self.destroy()
 
         except Exception as e:
@@ -3,6 +3,7 @@ import customtkinter as ctk
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
 import calendar
+from change_bus import CREATED, UPDATED, DELETED
 
 
 class TableBookingView(ctk.CTkFrame):
@@ -14,6 +15,9 @@ class TableBookingView(ctk.CTkFrame):
         self.navigation_manager = navigation_manager
         self.selected_date = datetime.now().date()
         self.current_week_start = self._get_week_start(self.selected_date)
+        self.day_cards = {}             # date -> overview card
+        self.week_event_dates = {}      # event id -> date, for events shown this week
+        self.daily_booking_ids = set()  # standalone bookings shown in the daily view
 
         # Main container
         main_container = ctk.CTkFrame(self, fg_color="transparent")
@@ -34,6 +38,15 @@ class TableBookingView(ctk.CTkFrame):
         # Load initial data
         self.refresh_view()
 
+        # Redraw only the days affected when events or bookings change
+        self.unsubscribe_changes = self.db.changes.subscribe(
+            self.on_data_changed, 'event', 'table_booking'
+        )
+
+    def destroy(self):
+        self.unsubscribe_changes()
+        super().destroy()
+
     def create_header(self, parent):
         """Create header with title and settings"""
         header_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -75,7 +88,7 @@ class TableBookingView(ctk.CTkFrame):
         export_btn.pack(side="right")
 
         # Current capacity display
-        total_tables = int(self.db.get_setting('total_tables_available') or 10)
+        total_tables = self.db.get_setting_int('total_tables_available', 10)
         capacity_label = ctk.CTkLabel(
             header_frame,
             text=f"Total Tables: {total_tables}",
@@ -155,6 +168,10 @@ class TableBookingView(ctk.CTkFrame):
         self.current_week_start = self._get_week_start(self.selected_date)
         self.refresh_view()
 
+    def refresh(self):
+        """Reload the view's data (called when a cached view is shown again)"""
+        self.refresh_view()
+
     def refresh_view(self):
         """Refresh all data displays"""
         # Update week label
@@ -170,95 +187,187 @@ class TableBookingView(ctk.CTkFrame):
         self.refresh_daily_view()
 
     def refresh_week_overview(self):
-        """Refresh the weekly overview grid"""
+        """Refresh the weekly overview grid
+
+        The week is loaded on the database worker. Paging through weeks
+        quickly supersedes the earlier loads, so only the last week clicked
+        is drawn.
+        """
         # Clear existing widgets
+        for widget in self.week_overview_frame.winfo_children():
+            widget.destroy()
+        self.day_cards = {}
+        self.week_event_dates = {}
+
+        ctk.CTkLabel(
+            self.week_overview_frame,
+            text="Loading week...",
+            font=ctk.CTkFont(size=14),
+            text_color="#999999"
+        ).grid(row=0, column=0, columnspan=7, pady=40)
+
+        week_start = self.current_week_start
+        self.db.worker.run(
+            self, self._load_week, week_start,
+            on_done=lambda days: self._show_week_overview(week_start, days),
+            on_error=lambda e: self._show_load_error(self.week_overview_frame, e),
+            key=(str(self), 'week')
+        )
+
+    def _load_week(self, week_start: datetime.date) -> List[tuple]:
+        """Capacity override and events for each day of a week (runs on the database worker)"""
+        return [self._load_day(week_start + timedelta(days=i)) for i in range(7)]
+
+    def _load_day(self, date: datetime.date) -> tuple:
+        """Capacity override and events for one day"""
+        return self._get_capacity_override(date), self._get_events_for_date(date)
+
+    def _show_week_overview(self, week_start: datetime.date, days: List[tuple]):
+        """Draw the day cards once the week has loaded"""
         for widget in self.week_overview_frame.winfo_children():
             widget.destroy()
 
         # Get total tables available
-        total_tables = int(self.db.get_setting('total_tables_available') or 10)
+        total_tables = self.db.get_setting_int('total_tables_available', 10)
 
         # Create day cards for the week
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
-        for i, day_name in enumerate(days):
-            current_date = self.current_week_start + timedelta(days=i)
+        for i, day_name in enumerate(day_names):
+            self._create_day_card(i, day_name, week_start + timedelta(days=i), total_tables, days[i])
 
-            # Check for capacity override
-            override_capacity = self._get_capacity_override(current_date)
-            day_capacity = override_capacity if override_capacity else total_tables
+    def _create_day_card(self, column: int, day_name: str, current_date: datetime.date, total_tables: int,
+                         day_data: Optional[tuple] = None):
+        """Create (or re-create) the overview card for one day
 
-            # Get events for this day
-            events = self._get_events_for_date(current_date)
-
-            # Calculate table usage
-            scheduled_tables = sum(e['tables_booked'] or 0 for e in events if e['start_time'])
-            unscheduled_tables = sum(e['tables_booked'] or 0 for e in events if not e['start_time'])
-
-            # Determine color based on usage
-            utilization = (scheduled_tables / day_capacity * 100) if day_capacity > 0 else 0
-            if utilization < 70:
-                color = "#C8E6C9"  # Green
-            elif utilization < 90:
-                color = "#FFF9C4"  # Yellow
-            elif utilization <= 100:
-                color = "#FFCCBC"  # Orange
-            else:
-                color = "#FFCDD2"  # Red (overbooked)
+        day_data is the day's (capacity override, events) if already loaded.
+        """
+        override_capacity, events = day_data if day_data is not None else self._load_day(current_date)
+        day_capacity = override_capacity if override_capacity else total_tables
 
-            # Create day card
-            day_card = ctk.CTkFrame(self.week_overview_frame, fg_color=color, corner_radius=8)
-            day_card.grid(row=0, column=i, padx=5, pady=10, sticky="nsew")
-            self.week_overview_frame.grid_columnconfigure(i, weight=1, uniform="day")
+        for event in events:
+            self.week_event_dates[event['id']] = current_date
+
+        # Calculate table usage
+        scheduled_tables = sum(e['tables_booked'] or 0 for e in events if e['start_time'])
+        unscheduled_tables = sum(e['tables_booked'] or 0 for e in events if not e['start_time'])
+
+        # Determine color based on usage
+        utilization = (scheduled_tables / day_capacity * 100) if day_capacity > 0 else 0
+        if utilization < 70:
+            color = "#C8E6C9"  # Green
+        elif utilization < 90:
+            color = "#FFF9C4"  # Yellow
+        elif utilization <= 100:
+            color = "#FFCCBC"  # Orange
+        else:
+            color = "#FFCDD2"  # Red (overbooked)
+
+        # Create day card (replacing the old one when a single day is redrawn)
+        old_card = self.day_cards.pop(current_date, None)
+        if old_card is not None:
+            old_card.destroy()
+        day_card = ctk.CTkFrame(self.week_overview_frame, fg_color=color, corner_radius=8)
+        day_card.grid(row=0, column=column, padx=5, pady=10, sticky="nsew")
+        self.day_cards[current_date] = day_card
+        self.week_overview_frame.grid_columnconfigure(column, weight=1, uniform="day")
+
+        # Day name and date
+        is_today = current_date == datetime.now().date()
+        day_text = f"{day_name}\n{current_date.strftime('%d %b')}"
+        if is_today:
+            day_text += "\n(Today)"
+
+        day_label = ctk.CTkLabel(
+            day_card,
+            text=day_text,
+            font=ctk.CTkFont(size=12, weight="bold" if is_today else "normal"),
+            text_color="#4A2D5E"
+        )
+        day_label.pack(pady=(10, 5))
 
-            # Day name and date
-            is_today = current_date == datetime.now().date()
-            day_text = f"{day_name}\n{current_date.strftime('%d %b')}"
-            if is_today:
-                day_text += "\n(Today)"
+        # Table usage
+        usage_text = f"{scheduled_tables}/{day_capacity} tables"
+        usage_label = ctk.CTkLabel(
+            day_card,
+            text=usage_text,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color="#4A2D5E"
+        )
+        usage_label.pack(pady=5)
+
+        # Event count
+        event_count_text = f"{len(events)} event{'s' if len(events) != 1 else ''}"
+        event_count_label = ctk.CTkLabel(
+            day_card,
+            text=event_count_text,
+            font=ctk.CTkFont(size=11),
+            text_color="#666666"
+        )
+        event_count_label.pack(pady=5)
 
-            day_label = ctk.CTkLabel(
+        # Unscheduled warning
+        if unscheduled_tables > 0:
+            warning_label = ctk.CTkLabel(
                 day_card,
-                text=day_text,
-                font=ctk.CTkFont(size=12, weight="bold" if is_today else "normal"),
-                text_color="#4A2D5E"
+                text=f"⚠ {unscheduled_tables} tables\nunscheduled",
+                font=ctk.CTkFont(size=10),
+                text_color="#D32F2F"
             )
-            day_label.pack(pady=(10, 5))
+            warning_label.pack(pady=(0, 5))
 
-            # Table usage
-            usage_text = f"{scheduled_tables}/{day_capacity} tables"
-            usage_label = ctk.CTkLabel(
-                day_card,
-                text=usage_text,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color="#4A2D5E"
-            )
-            usage_label.pack(pady=5)
+        # Click to view day
+        day_card.bind("<Button-1>", lambda e, d=current_date: self.select_date(d))
+        for child in day_card.winfo_children():
+            child.bind("<Button-1>", lambda e, d=current_date: self.select_date(d))
 
-            # Event count
-            event_count_text = f"{len(events)} event{'s' if len(events) != 1 else ''}"
-            event_count_label = ctk.CTkLabel(
-                day_card,
-                text=event_count_text,
-                font=ctk.CTkFont(size=11),
-                text_color="#666666"
-            )
-            event_count_label.pack(pady=5)
-
-            # Unscheduled warning
-            if unscheduled_tables > 0:
-                warning_label = ctk.CTkLabel(
-                    day_card,
-                    text=f"⚠ {unscheduled_tables} tables\nunscheduled",
-                    font=ctk.CTkFont(size=10),
-                    text_color="#D32F2F"
-                )
-                warning_label.pack(pady=(0, 5))
+    def on_data_changed(self, change):
+        """Redraw only the days an event or booking change touches"""
+        if change.entity_id is None:
+            self.refresh_view()
+            return
+
+        if change.entity == 'event':
+            affected = {self.week_event_dates.get(change.entity_id)}
+            if change.kind != DELETED:
+                affected.add(self._get_event_date(change.entity_id))
+
+            if self.db.worker.is_pending((str(self), 'week')):
+                # The week is still loading and may have been read before the change
+                self.refresh_week_overview()
+            else:
+                total_tables = self.db.get_setting_int('total_tables_available', 10)
+                for day in affected:
+                    if day is None:
+                        continue
+                    offset = (day - self.current_week_start).days
+                    if 0 <= offset < 7:
+                        self._create_day_card(offset, calendar.day_name[day.weekday()], day, total_tables)
+        else:
+            affected = {self._get_booking_date(change.entity_id)}
+            if change.entity_id in self.daily_booking_ids:
+                affected.add(self.selected_date)
+
+        if self.selected_date in affected:
+            self.refresh_daily_view()
 
-            # Click to view day
-            day_card.bind("<Button-1>", lambda e, d=current_date: self.select_date(d))
-            for child in day_card.winfo_children():
-                child.bind("<Button-1>", lambda e, d=current_date: self.select_date(d))
+    def _get_event_date(self, event_id: int) -> Optional[datetime.date]:
+        """Date of an event, or None if it has been deleted"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT event_date FROM events WHERE id = ? AND is_deleted = 0', (event_id,))
+        row = cursor.fetchone()
+        conn.close()
+        return datetime.strptime(row['event_date'], '%Y-%m-%d').date() if row else None
+
+    def _get_booking_date(self, booking_id: int) -> Optional[datetime.date]:
+        """Date of a standalone booking, or None if it has been deleted"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT booking_date FROM standalone_bookings WHERE id = ? AND is_deleted = 0', (booking_id,))
+        row = cursor.fetchone()
+        conn.close()
+        return datetime.strptime(row['booking_date'], '%Y-%m-%d').date() if row else None
 
     def select_date(self, date: datetime.date):
         """Select a specific date for detailed view"""
@@ -266,18 +375,64 @@ class TableBookingView(ctk.CTkFrame):
         self.refresh_daily_view()
 
     def refresh_daily_view(self):
-        """Refresh the daily detail view"""
+        """Refresh the daily detail view (loaded on the database worker)"""
         # Clear existing widgets
         for widget in self.daily_view_frame.winfo_children():
             widget.destroy()
 
+        ctk.CTkLabel(
+            self.daily_view_frame,
+            text="Loading...",
+            font=ctk.CTkFont(size=14),
+            text_color="#999999"
+        ).pack(pady=40)
+
+        date = self.selected_date
+        self.db.worker.run(
+            self, self._load_daily_detail, date,
+            on_done=lambda detail: self._show_daily_view(date, detail),
+            on_error=lambda e: self._show_load_error(self.daily_view_frame, e),
+            key=(str(self), 'day')
+        )
+
+    def _show_load_error(self, frame: ctk.CTkFrame, error: BaseException):
+        """Replace a loading message with an error"""
+        for widget in frame.winfo_children():
+            widget.destroy()
+        print(f"[TABLE BOOKING] Failed to load: {error}")
+        error_label = ctk.CTkLabel(
+            frame,
+            text=f"Could not load bookings: {error}",
+            font=ctk.CTkFont(size=14),
+            text_color="#D32F2F"
+        )
+        # The week overview lays out its day cards with grid, the daily view with pack
+        if frame is self.week_overview_frame:
+            error_label.grid(row=0, column=0, columnspan=7, pady=40)
+        else:
+            error_label.pack(pady=40)
+
+    def _load_daily_detail(self, date: datetime.date) -> dict:
+        """Everything the daily view shows for a date (runs on the database worker)"""
+        return {
+            'hours': self._get_operating_hours_for_date(date),
+            'events': self._get_events_for_date(date),
+            'bookings': self._get_standalone_bookings_for_date(date),
+            'capacity_override': self._get_capacity_override(date),
+        }
+
+    def _show_daily_view(self, date: datetime.date, detail: dict):
+        """Draw the daily detail view once its data has loaded"""
+        for widget in self.daily_view_frame.winfo_children():
+            widget.destroy()
+
         # Header with selected date and add booking button
         header_frame = ctk.CTkFrame(self.daily_view_frame, fg_color="transparent")
         header_frame.pack(fill="x", pady=(10, 20), padx=10)
 
         date_header = ctk.CTkLabel(
             header_frame,
-            text=f"Details for {self.selected_date.strftime('%A, %d %B %Y')}",
+            text=f"Details for {date.strftime('%A, %d %B %Y')}",
             font=ctk.CTkFont(size=20, weight="bold"),
             text_color="#8B5FBF"
         )
@@ -297,7 +452,7 @@ class TableBookingView(ctk.CTkFrame):
         add_booking_btn.pack(side="right")
 
         # Operating hours display
-        hours_info = self._get_operating_hours_for_date(self.selected_date)
+        hours_info = detail['hours']
         hours_frame = ctk.CTkFrame(self.daily_view_frame, fg_color="#E8F5E9" if hours_info['is_open'] else "#FFEBEE", corner_radius=8)
         hours_frame.pack(fill="x", padx=10, pady=(0, 10))
 
@@ -336,12 +491,13 @@ class TableBookingView(ctk.CTkFrame):
         edit_hours_btn.pack(side="right")
 
         # Get events and standalone bookings for selected date
-        events = self._get_events_for_date(self.selected_date)
-        standalone_bookings = self._get_standalone_bookings_for_date(self.selected_date)
+        events = detail['events']
+        standalone_bookings = detail['bookings']
+        self.daily_booking_ids = {booking['id'] for booking in standalone_bookings}
 
         # Get capacity for this day
-        total_tables = int(self.db.get_setting('total_tables_available') or 10)
-        override_capacity = self._get_capacity_override(self.selected_date)
+        total_tables = self.db.get_setting_int('total_tables_available', 10)
+        override_capacity = detail['capacity_override']
         day_capacity = override_capacity if override_capacity else total_tables
 
         # Separate scheduled and unscheduled items (both events and bookings)
@@ -604,7 +760,7 @@ class TableBookingView(ctk.CTkFrame):
             cursor.execute('UPDATE standalone_bookings SET is_deleted = 1 WHERE id = ?', (booking_id,))
             conn.commit()
             conn.close()
-            self.refresh_view()
+            self.db.changes.publish('table_booking', booking_id, DELETED)
 
     def _detect_time_conflicts(self, events: List[dict]) -> set:
         """Detect events that have overlapping times and return their IDs"""
@@ -705,7 +861,6 @@ class TableBookingView(ctk.CTkFrame):
         from views.events_view import EventEditDialog
         dialog = EventEditDialog(self, self.db, event_id)
         dialog.wait_window()
-        self.refresh_view()
 
     def _create_booking_card(self, booking: dict, is_unscheduled: bool):
         """Create a standalone booking card in the daily view"""
@@ -825,7 +980,6 @@ class TableBookingView(ctk.CTkFrame):
         """Open dialog to add or edit a standalone booking"""
         dialog = StandaloneBookingDialog(self, self.db, self.selected_date, booking)
         dialog.wait_window()
-        self.refresh_view()
 
     def edit_date_hours(self):
         """Open dialog to edit operating hours for the selected date"""
@@ -892,7 +1046,7 @@ class TableBookingView(ctk.CTkFrame):
             story.append(Spacer(1, 10*mm))
 
             # Get capacity
-            total_tables = int(self.db.get_setting('total_tables_available') or 10)
+            total_tables = self.db.get_setting_int('total_tables_available', 10)
             override_capacity = self._get_capacity_override(self.selected_date)
             day_capacity = override_capacity if override_capacity else total_tables
 
@@ -1015,9 +1169,12 @@ class TableBookingView(ctk.CTkFrame):
                 scheduled_table.setStyle(TableStyle(table_style))
                 story.append(scheduled_table)
 
-            # Build PDF
-            doc.build(story)
-            messagebox.showinfo("Export Complete", f"Schedule exported to:\n{filename}")
+            # Build PDF on the database worker so the window stays responsive
+            self.db.worker.run(
+                self, doc.build, story,
+                on_done=lambda _: messagebox.showinfo("Export Complete", f"Schedule exported to:\n{filename}"),
+                on_error=lambda e: messagebox.showerror("Export Error", f"Failed to export schedule: {str(e)}")
+            )
 
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export schedule: {str(e)}")
@@ -1219,9 +1376,11 @@ class TableSettingsDialog(ctk.CTkToplevel):
                 raise ValueError("Breakdown padding cannot be negative")
 
             # Save to database
-            self.db.update_setting('total_tables_available', str(total_tables))
-            self.db.update_setting('default_setup_padding_minutes', str(setup_padding))
-            self.db.update_setting('default_breakdown_padding_minutes', str(breakdown_padding))
+            self.db.update_settings({
+                'total_tables_available': str(total_tables),
+                'default_setup_padding_minutes': str(setup_padding),
+                'default_breakdown_padding_minutes': str(breakdown_padding)
+            })
 
             self.destroy()
 
@@ -1547,10 +1706,12 @@ class StandaloneBookingDialog(ctk.CTkToplevel):
                     VALUES (?, ?, ?, ?, ?, ?, ?)
                 ''', (booking_name, booking_description, booking_date, start_time, end_time,
                       tables_booked, notes))
+            booking_id = self.booking['id'] if self.booking else cursor.lastrowid
 
             conn.commit()
             conn.close()
 
+            self.db.changes.publish('table_booking', booking_id, UPDATED if self.booking else CREATED)
             self.destroy()
 
         except ValueError as e:
@@ -1,11 +1,13 @@
 """Templates view UI"""
 import customtkinter as ctk
 from tkinter import messagebox
-from tkcalendar import DateEntry
 from template_manager import TemplateManager
 from event_manager import EventManager
+from series_manager import SeriesManager, RECURRENCE_RULES, WEEKDAY_NAMES, WEEK_OF_MONTH_NAMES
+from widgets.virtual_list import VirtualList
+from change_bus import DELETED
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 class TemplatesView(ctk.CTkFrame):
     """Templates list and management view"""
@@ -27,6 +29,13 @@ class TemplatesView(ctk.CTkFrame):
         # Load templates
         self.load_templates()
 
+        # Keep cards up to date as templates (and their event counts) change
+        self.unsubscribe_changes = self.db.changes.subscribe(self.on_template_changed, 'template')
+
+    def destroy(self):
+        self.unsubscribe_changes()
+        super().destroy()
+
     def create_header(self):
         """Create the header with title and buttons"""
         header_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -55,57 +64,97 @@ class TemplatesView(ctk.CTkFrame):
         btn_new.pack(side="right")
 
     def create_templates_list(self):
-        """Create the scrollable templates list"""
+        """Create the templates list (only the visible cards are built)"""
         # Container frame with border
         list_container = ctk.CTkFrame(self, fg_color="white", corner_radius=10)
         list_container.pack(fill="both", expand=True, padx=30, pady=(0, 30))
 
-        # Scrollable frame
-        self.templates_scroll = ctk.CTkScrollableFrame(
+        self.templates_list = VirtualList(
             list_container,
-            fg_color="white",
+            create_row=lambda parent: TemplateCard(parent, self),
+            bind_row=lambda card, template: card.show(template),
+            estimate_height=175,
+            empty_text="No templates yet. Create your first template!",
             corner_radius=10
         )
-        self.templates_scroll.pack(fill="both", expand=True, padx=2, pady=2)
+        self.templates_list.pack(fill="both", expand=True, padx=2, pady=2)
+
+    def refresh(self):
+        """Reload the view's data (called when a cached view is shown again)"""
+        self.load_templates()
 
     def load_templates(self):
         """Load and display templates"""
-        # Clear existing widgets
-        for widget in self.templates_scroll.winfo_children():
-            widget.destroy()
-
-        # Get templates
         templates = self.template_manager.get_all_templates()
+        self.templates_list.set_items(templates)
 
-        if not templates:
-            # No templates message
-            no_templates = ctk.CTkLabel(
-                self.templates_scroll,
-                text="No templates yet. Create your first template!",
-                font=ctk.CTkFont(size=16),
-                text_color="#999999"
-            )
-            no_templates.pack(pady=40)
+    def on_template_changed(self, change):
+        """Update, add or remove just the card for a changed template"""
+        if change.entity_id is None:
+            self.load_templates()
             return
 
-        # Display templates
-        for template in templates:
-            self.create_template_card(template)
+        index = self.templates_list.find(lambda t: t['id'] == change.entity_id)
+        matches = [] if change.kind == DELETED else self.template_manager.get_all_templates([change.entity_id])
 
-    def create_template_card(self, template: dict):
-        """Create a card for a template"""
-        # Card frame
-        card = ctk.CTkFrame(
-            self.templates_scroll,
+        if not matches:
+            if index is not None:
+                self.templates_list.remove_item(index)
+            return
+
+        self.templates_list.upsert_sorted(matches[0], key=lambda t: t['name'], index=index)
+
+    def show_new_template_dialog(self):
+        """Show dialog to create a new template"""
+        dialog = TemplateEditDialog(self, self.db, None)
+        self.wait_window(dialog)
+
+    def show_template_details(self, template_id: int):
+        """Show template details/edit dialog"""
+        dialog = TemplateEditDialog(self, self.db, template_id)
+        self.wait_window(dialog)
+
+    def delete_template(self, template_id: int, template_name: str):
+        """Delete a template after confirmation"""
+        event_count = self.template_manager.count_events_using_template(template_id)
+
+        if event_count > 0:
+            message = f"'{template_name}' has been used to create {event_count} event(s).\n\nDeleting this template will not delete those events, but they will no longer be linked to this template.\n\nAre you sure?"
+        else:
+            message = f"Are you sure you want to delete '{template_name}'?\n\nThis cannot be undone."
+
+        result = messagebox.askyesno("Confirm Delete", message)
+        if result:
+            self.template_manager.delete_template(template_id)
+            messagebox.showinfo("Deleted", f"'{template_name}' has been deleted.")
+
+    def create_event_from_template(self, template_id: int, template_name: str):
+        """Show dialog to create an event from this template"""
+        dialog = CreateFromTemplateDialog(self, self.db, template_id, template_name)
+        self.wait_window(dialog)
+
+    def show_series_dialog(self, template_id: int, template_name: str):
+        """Show dialog to create and manage recurring series for this template"""
+        dialog = EventSeriesDialog(self, self.db, template_id, template_name)
+        self.wait_window(dialog)
+
+
+class TemplateCard(ctk.CTkFrame):
+    """Card for one template; recycled by the VirtualList as the user scrolls"""
+
+    def __init__(self, parent, view: TemplatesView):
+        super().__init__(
+            parent,
             fg_color="#F9F5FA",
             corner_radius=8,
             border_width=1,
             border_color="#E6D9F2"
         )
-        card.pack(fill="x", padx=10, pady=5)
+        self.view = view
+        self.template = None
 
         # Main content frame
-        content = ctk.CTkFrame(card, fg_color="transparent")
+        content = ctk.CTkFrame(self, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=20, pady=15)
 
         # Left side - Template info
@@ -113,118 +162,107 @@ class TemplatesView(ctk.CTkFrame):
         left_frame.pack(side="left", fill="both", expand=True)
 
         # Template name
-        name_label = ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(
             left_frame,
-            text=template['name'],
+            text="",
             font=ctk.CTkFont(size=18, weight="bold"),
             text_color="#4A2D5E",
             anchor="w"
         )
-        name_label.pack(anchor="w")
+        self.name_label.pack(anchor="w")
 
-        # Template details
-        details_text = []
-        if template.get('event_type_name'):
-            details_text.append(template['event_type_name'])
-        if template.get('format_name'):
-            details_text.append(template['format_name'])
-        if template.get('pairing_method_name'):
-            details_text.append(template['pairing_method_name'])
-        if template.get('max_capacity'):
-            details_text.append(f"Max: {template['max_capacity']} players")
-
-        if details_text:
-            details_label = ctk.CTkLabel(
-                left_frame,
-                text=" • ".join(details_text),
-                font=ctk.CTkFont(size=15),
-                text_color="#666666",
-                anchor="w"
-            )
-            details_label.pack(anchor="w", pady=(5, 0))
+        # Template details (packed only when there are any)
+        self.details_label = ctk.CTkLabel(
+            left_frame,
+            text="",
+            font=ctk.CTkFont(size=15),
+            text_color="#666666",
+            anchor="w"
+        )
 
         # Events count
-        event_count = self.template_manager.count_events_using_template(template['id'])
-        count_label = ctk.CTkLabel(
+        self.count_label = ctk.CTkLabel(
             left_frame,
-            text=f"{event_count} event{'s' if event_count != 1 else ''} created from this template",
+            text="",
             font=ctk.CTkFont(size=15),
             text_color="#999999",
             anchor="w"
         )
-        count_label.pack(anchor="w", pady=(5, 0))
+        self.count_label.pack(anchor="w", pady=(5, 0))
 
         # Right side - Actions
         right_frame = ctk.CTkFrame(content, fg_color="transparent")
         right_frame.pack(side="right")
 
         # Create event from template button
-        btn_create = ctk.CTkButton(
+        ctk.CTkButton(
             right_frame,
             text="Create Event",
-            command=lambda t=template: self.create_event_from_template(t['id'], t['name']),
+            command=lambda: self.view.create_event_from_template(self.template['id'], self.template['name']),
             fg_color="#4CAF50",
             hover_color="#45a049",
             text_color="white",
             width=120
-        )
-        btn_create.pack(pady=2)
+        ).pack(pady=2)
+
+        # Recurring series button
+        ctk.CTkButton(
+            right_frame,
+            text="Series",
+            command=lambda: self.view.show_series_dialog(self.template['id'], self.template['name']),
+            fg_color="#5C9BD5",
+            hover_color="#4A88C2",
+            text_color="white",
+            width=120
+        ).pack(pady=2)
 
         # Edit button
-        btn_edit = ctk.CTkButton(
+        ctk.CTkButton(
             right_frame,
             text="Edit",
-            command=lambda t=template: self.show_template_details(t['id']),
+            command=lambda: self.view.show_template_details(self.template['id']),
             fg_color="#8B5FBF",
             hover_color="#7A4FB0",
             text_color="white",
             width=120
-        )
-        btn_edit.pack(pady=2)
+        ).pack(pady=2)
 
         # Delete button
-        btn_delete = ctk.CTkButton(
+        ctk.CTkButton(
             right_frame,
             text="Delete",
-            command=lambda t=template: self.delete_template(t['id'], t['name']),
+            command=lambda: self.view.delete_template(self.template['id'], self.template['name']),
             fg_color="#E57373",
             hover_color="#D32F2F",
             text_color="white",
             width=120
-        )
-        btn_delete.pack(pady=2)
+        ).pack(pady=2)
 
-    def show_new_template_dialog(self):
-        """Show dialog to create a new template"""
-        dialog = TemplateEditDialog(self, self.db, None)
-        self.wait_window(dialog)
-        self.load_templates()
+    def show(self, template: dict):
+        """Fill the card in for a template"""
+        self.template = template
+        self.name_label.configure(text=template['name'])
 
-    def show_template_details(self, template_id: int):
-        """Show template details/edit dialog"""
-        dialog = TemplateEditDialog(self, self.db, template_id)
-        self.wait_window(dialog)
-        self.load_templates()
-
-    def delete_template(self, template_id: int, template_name: str):
-        """Delete a template after confirmation"""
-        event_count = self.template_manager.count_events_using_template(template_id)
+        details_text = []
+        if template.get('event_type_name'):
+            details_text.append(template['event_type_name'])
+        if template.get('format_name'):
+            details_text.append(template['format_name'])
+        if template.get('pairing_method_name'):
+            details_text.append(template['pairing_method_name'])
+        if template.get('max_capacity'):
+            details_text.append(f"Max: {template['max_capacity']} players")
 
-        if event_count > 0:
-            message = f"'{template_name}' has been used to create {event_count} event(s).\n\nDeleting this template will not delete those events, but they will no longer be linked to this template.\n\nAre you sure?"
+        if details_text:
+            self.details_label.configure(text=" • ".join(details_text))
+            self.details_label.pack(anchor="w", pady=(5, 0), before=self.count_label)
         else:
-            message = f"Are you sure you want to delete '{template_name}'?\n\nThis cannot be undone."
+            self.details_label.pack_forget()
 
-        result = messagebox.askyesno("Confirm Delete", message)
-        if result:
-            self.template_manager.delete_template(template_id)
-            self.load_templates()
-            messagebox.showinfo("Deleted", f"'{template_name}' has been deleted.")
-
-    def create_event_from_template(self, template_id: int, template_name: str):
-        """Show dialog to create an event from this template"""
-        dialog = CreateFromTemplateDialog(self, self.db, template_id, template_name)
-        self.wait_window(dialog)
+        event_count = template['event_count']
+        self.count_label.configure(
+            text=f"{event_count} event{'s' if event_count != 1 else ''} created from this template"
+        )
 
 
 class TemplateEditDialog(ctk.CTkToplevel):
@@ -1161,6 +1199,7 @@ class TemplateEditDialog(ctk.CTkToplevel):
         new_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        self.db.invalidate_reference_data(table)
 
         # Refresh reference data
         self.ref_data = self.template_manager.get_reference_data()
@@ -1361,6 +1400,7 @@ class CreateFromTemplateDialog(ctk.CTkToplevel):
 
         # Event Date
         ctk.CTkLabel(frame, text="Event Date *", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        from tkcalendar import DateEntry
         self.entry_date = DateEntry(frame, selectmode='day', date_pattern='yyyy-mm-dd',
                                     background='#8B5FBF', foreground='white', borderwidth=2)
         self.entry_date.pack(fill="x", pady=(0, 15))
@@ -1419,6 +1459,240 @@ class CreateFromTemplateDialog(ctk.CTkToplevel):
             messagebox.showerror("Error", f"Failed to create event: {str(e)}")
 
 
+class EventSeriesDialog(ctk.CTkToplevel):
+    """Dialog for creating, extending and regenerating recurring event series"""
+
+    def __init__(self, parent, db, template_id: int, template_name: str):
+        super().__init__(parent)
+
+        self.db = db
+        self.series_manager = SeriesManager(db)
+        self.template_id = template_id
+        self.template_name = template_name
+
+        self.title(f"Event Series: {template_name}")
+        self.geometry("600x700")
+        self.configure(fg_color="#F5F0F6")
+
+        self.transient(parent)
+        self.grab_set()
+
+        self.create_form()
+        self.load_series()
+
+    def create_form(self):
+        """Create the existing-series list and the new series form"""
+        frame = ctk.CTkScrollableFrame(self, fg_color="#F5F0F6")
+        frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        ctk.CTkLabel(frame, text="Existing Series", text_color="#4A2D5E",
+                     font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=(0, 5))
+        self.series_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        self.series_frame.pack(fill="x", pady=(0, 20))
+
+        ctk.CTkLabel(frame, text="New Series", text_color="#4A2D5E",
+                     font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=(0, 5))
+
+        # Series Name
+        ctk.CTkLabel(frame, text="Event Name", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        self.entry_name = ctk.CTkEntry(frame, placeholder_text=f"Leave blank to use '{self.template_name}'")
+        self.entry_name.pack(fill="x", pady=(0, 15))
+
+        # Recurrence
+        ctk.CTkLabel(frame, text="Repeats", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        self.combo_recurrence = ctk.CTkComboBox(frame, values=list(RECURRENCE_RULES.values()), state="readonly")
+        self.combo_recurrence.set(RECURRENCE_RULES['weekly'])
+        self.combo_recurrence.pack(fill="x", pady=(0, 15))
+
+        # Weekday
+        ctk.CTkLabel(frame, text="Day", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        self.combo_weekday = ctk.CTkComboBox(frame, values=WEEKDAY_NAMES, state="readonly")
+        self.combo_weekday.set(WEEKDAY_NAMES[datetime.now().weekday()])
+        self.combo_weekday.pack(fill="x", pady=(0, 15))
+
+        # Week of month (monthly series only)
+        ctk.CTkLabel(frame, text="Week of Month (monthly only)", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        self.combo_week_of_month = ctk.CTkComboBox(frame, values=list(WEEK_OF_MONTH_NAMES.values()), state="readonly")
+        self.combo_week_of_month.set(WEEK_OF_MONTH_NAMES[1])
+        self.combo_week_of_month.pack(fill="x", pady=(0, 15))
+
+        # Date range
+        ctk.CTkLabel(frame, text="Start Date *", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        from tkcalendar import DateEntry
+        self.entry_start_date = DateEntry(frame, selectmode='day', date_pattern='yyyy-mm-dd',
+                                          background='#8B5FBF', foreground='white', borderwidth=2)
+        self.entry_start_date.pack(fill="x", pady=(0, 15))
+
+        ctk.CTkLabel(frame, text="End Date *", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        self.entry_end_date = DateEntry(frame, selectmode='day', date_pattern='yyyy-mm-dd',
+                                        background='#8B5FBF', foreground='white', borderwidth=2)
+        self.entry_end_date.set_date(datetime.now() + timedelta(days=90))
+        self.entry_end_date.pack(fill="x", pady=(0, 15))
+
+        # Times
+        ctk.CTkLabel(frame, text="Start Time (HH:MM)", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        self.entry_start_time = ctk.CTkEntry(frame, placeholder_text="e.g., 18:00")
+        self.entry_start_time.pack(fill="x", pady=(0, 15))
+
+        ctk.CTkLabel(frame, text="End Time (HH:MM)", text_color="#4A2D5E", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 5))
+        self.entry_end_time = ctk.CTkEntry(frame, placeholder_text="e.g., 22:00")
+        self.entry_end_time.pack(fill="x", pady=(0, 15))
+
+        self.checkbox_skip_closed = ctk.CTkCheckBox(
+            frame,
+            text="Skip days the store is closed",
+            text_color="#4A2D5E"
+        )
+        self.checkbox_skip_closed.select()
+        self.checkbox_skip_closed.pack(anchor="w", pady=(0, 15))
+
+        # Buttons
+        button_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        button_frame.pack(fill="x", pady=(10, 0))
+
+        btn_create = ctk.CTkButton(
+            button_frame,
+            text="Create Series",
+            command=self.create_series,
+            fg_color="#8B5FBF",
+            hover_color="#7A4FB0",
+            text_color="white",
+            height=40
+        )
+        btn_create.pack(side="left", expand=True, fill="x", padx=(0, 5))
+
+        btn_close = ctk.CTkButton(
+            button_frame,
+            text="Close",
+            command=self.destroy,
+            fg_color="#CCCCCC",
+            hover_color="#BBBBBB",
+            text_color="#4A2D5E",
+            height=40
+        )
+        btn_close.pack(side="left", expand=True, fill="x", padx=(5, 0))
+
+    def load_series(self):
+        """Show the series already created from this template"""
+        for widget in self.series_frame.winfo_children():
+            widget.destroy()
+
+        series_list = self.series_manager.get_all_series(self.template_id)
+        if not series_list:
+            ctk.CTkLabel(self.series_frame, text="No series yet", text_color="#999999").pack(anchor="w")
+            return
+
+        for series in series_list:
+            card = ctk.CTkFrame(self.series_frame, fg_color="white", corner_radius=8)
+            card.pack(fill="x", pady=3)
+
+            rule = f"{RECURRENCE_RULES[series['recurrence']]}, {WEEKDAY_NAMES[series['weekday']]}"
+            if series['recurrence'] == 'monthly':
+                rule = f"{WEEK_OF_MONTH_NAMES[series['week_of_month']]} {WEEKDAY_NAMES[series['weekday']]} of each month"
+
+            ctk.CTkLabel(
+                card,
+                text=f"{series['series_name']}\n{rule} until {series['end_date']} • {series['occurrence_count']} events",
+                text_color="#4A2D5E",
+                justify="left",
+                anchor="w"
+            ).pack(side="left", padx=10, pady=8)
+
+            ctk.CTkButton(
+                card, text="Delete", width=70,
+                command=lambda s=series: self.delete_series(s),
+                fg_color="#E57373", hover_color="#D32F2F", text_color="white"
+            ).pack(side="right", padx=(2, 10))
+            ctk.CTkButton(
+                card, text="Regenerate", width=90,
+                command=lambda s=series: self.regenerate_series(s),
+                fg_color="#8B5FBF", hover_color="#7A4FB0", text_color="white"
+            ).pack(side="right", padx=2)
+            ctk.CTkButton(
+                card, text="Extend", width=70,
+                command=lambda s=series: self.extend_series(s),
+                fg_color="#4CAF50", hover_color="#45a049", text_color="white"
+            ).pack(side="right", padx=2)
+
+    def create_series(self):
+        """Create the series and all of its events"""
+        try:
+            datetime.strptime(self.entry_start_date.get(), '%Y-%m-%d')
+            datetime.strptime(self.entry_end_date.get(), '%Y-%m-%d')
+        except ValueError:
+            messagebox.showerror("Validation Error", "Dates must be in YYYY-MM-DD format")
+            return
+
+        recurrence = next(key for key, label in RECURRENCE_RULES.items() if label == self.combo_recurrence.get())
+        week_of_month = next(key for key, label in WEEK_OF_MONTH_NAMES.items() if label == self.combo_week_of_month.get())
+
+        series_data = {
+            'template_id': self.template_id,
+            'series_name': self.entry_name.get().strip() or self.template_name,
+            'recurrence': recurrence,
+            'weekday': WEEKDAY_NAMES.index(self.combo_weekday.get()),
+            'week_of_month': week_of_month if recurrence == 'monthly' else None,
+            'start_date': self.entry_start_date.get(),
+            'end_date': self.entry_end_date.get(),
+            'start_time': self.entry_start_time.get().strip() or None,
+            'end_time': self.entry_end_time.get().strip() or None,
+            'skip_closed_days': 1 if self.checkbox_skip_closed.get() else 0
+        }
+
+        try:
+            series_id = self.series_manager.create_series(series_data)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to create series: {str(e)}")
+            return
+
+        count = len(self.series_manager.get_series_events(series_id))
+        messagebox.showinfo("Success", f"Series created with {count} event{'s' if count != 1 else ''}.")
+        self.load_series()
+
+    def extend_series(self, series: dict):
+        """Ask for a new end date and create the added events"""
+        dialog = ctk.CTkInputDialog(
+            text=f"'{series['series_name']}' currently ends on {series['end_date']}.\n\nNew end date (YYYY-MM-DD):",
+            title="Extend Series"
+        )
+        new_end_date = dialog.get_input()
+        if not new_end_date:
+            return
+
+        try:
+            created = self.series_manager.extend_series(series['id'], new_end_date.strip())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to extend series: {str(e)}")
+            return
+
+        messagebox.showinfo("Success", f"Added {len(created)} event{'s' if len(created) != 1 else ''}.")
+        self.load_series()
+
+    def regenerate_series(self, series: dict):
+        """Bring the upcoming events back in line with the series rule and store hours"""
+        try:
+            result = self.series_manager.regenerate_series(series['id'])
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to regenerate series: {str(e)}")
+            return
+
+        messagebox.showinfo(
+            "Series Regenerated",
+            f"Created {result['created']} event(s), moved {result['removed']} to Deleted Events."
+        )
+        self.load_series()
+
+    def delete_series(self, series: dict):
+        """Delete a series after confirmation"""
+        result = messagebox.askyesno(
+            "Confirm Delete",
+            f"Delete the series '{series['series_name']}'?\n\nUpcoming events from this series will be moved to Deleted Events. Past events are kept."
+        )
+        if result:
+            self.series_manager.delete_series(series['id'])
+            self.load_series()
+
+
 class TemplateTicketTierDialog(ctk.CTkToplevel):
     """Dialog for adding/editing template ticket tiers"""
 
@@ -0,0 +1,340 @@
+"""Virtualized list widget for long lists of cards"""
+import sys
+import tkinter as tk
+from bisect import bisect_right
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import customtkinter as ctk
+
+
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list that only builds widgets for the rows on screen
+
+    Drop-in replacement for a CTkScrollableFrame full of cards. Instead of one
+    card per item, the list keeps a small pool of row widgets (the visible rows
+    plus buffer_rows above and below) and re-binds them to different items as
+    the user scrolls, so a list of thousands of items costs about the same as
+    a list of ten.
+
+    Args:
+        create_row: Builds an empty row widget; called with the parent to use
+        bind_row: Fills a row widget in for an item; called as bind_row(row, item)
+        estimate_height: Row height before a row has been measured, either a
+            number or a function of the item. Rows are measured after binding,
+            so this only needs to be close.
+        buffer_rows: Extra rows kept bound above and below the visible ones
+        empty_text: Message shown when there are no items
+        on_near_end: Called when the user scrolls to within buffer_rows of the
+            last item, e.g. to load the next page with append_items()
+    """
+
+    def __init__(self, master, create_row: Callable[[tk.Misc], tk.Widget],
+                 bind_row: Callable[[tk.Widget, Any], None],
+                 estimate_height: Union[int, Callable[[Any], int]] = 120,
+                 buffer_rows: int = 3, row_padx: int = 10, row_pady: int = 5,
+                 empty_text: str = "", on_near_end: Optional[Callable[[], None]] = None, **kwargs):
+        kwargs.setdefault('fg_color', 'white')
+        super().__init__(master, **kwargs)
+
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.estimate_height = estimate_height
+        self.buffer_rows = buffer_rows
+        self.row_padx = row_padx
+        self.row_pady = row_pady
+        self.on_near_end = on_near_end
+
+        self._items: List[Any] = []
+        self._heights: List[int] = []
+        self._offsets: List[int] = [0]
+        self._bound: Dict[int, int] = {}     # item index -> canvas window id
+        self._free: List[int] = []           # unbound canvas window ids
+        self._widgets: Dict[int, tk.Widget] = {}
+        self._measured = set()
+        self._render_pending = False
+        self._width = 1
+
+        self.canvas = tk.Canvas(
+            self,
+            highlightthickness=0,
+            borderwidth=0,
+            bg=self._apply_appearance_mode(self.cget('fg_color')),
+            yscrollincrement=20
+        )
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 2), pady=2)
+        self.canvas.pack(side="left", fill="both", expand=True, padx=(2, 0), pady=2)
+
+        self.empty_label = ctk.CTkLabel(
+            self.canvas,
+            text=empty_text,
+            font=ctk.CTkFont(size=16),
+            text_color="#999999"
+        )
+        self._empty_window = self.canvas.create_window(0, 40, window=self.empty_label, anchor="n", state="hidden")
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        # Same approach as CTkScrollableFrame: one global binding that checks the pointer is over this list
+        self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-4>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-5>", self._on_mousewheel, add="+")
+
+    @property
+    def items(self) -> List[Any]:
+        return self._items
+
+    def set_items(self, items: List[Any], keep_scroll: bool = False):
+        """Replace the list contents; only the visible rows are (re)bound"""
+        self._items = list(items)
+        self._heights = [self._estimate(item) for item in self._items]
+        self._measured.clear()
+        self._update_offsets()
+
+        for window_id in self._bound.values():
+            self._free.append(window_id)
+        self._bound.clear()
+
+        has_items = bool(self._items)
+        self.canvas.itemconfigure(self._empty_window, state="hidden" if has_items else "normal")
+        if not keep_scroll:
+            self.canvas.yview_moveto(0)
+        self._render()
+
+    def append_items(self, items: List[Any]):
+        """Add items to the end of the list (e.g. the next page) without rebinding rows"""
+        if not items:
+            return
+        self._items.extend(items)
+        self._heights.extend(self._estimate(item) for item in items)
+        self._update_offsets()
+        self.canvas.itemconfigure(self._empty_window, state="hidden")
+        self._schedule_render()
+
+    def set_empty_text(self, text: str):
+        self.empty_label.configure(text=text)
+
+    def refresh(self):
+        """Re-bind the visible rows, e.g. after items were changed in place"""
+        for index, window_id in self._bound.items():
+            self.bind_row(self._widgets[window_id], self._items[index])
+        self._measure(list(self._bound))
+
+    def scroll_to_top(self):
+        self.canvas.yview_moveto(0)
+
+    def find(self, predicate: Callable[[Any], bool]) -> Optional[int]:
+        """Index of the first item matching predicate, or None"""
+        return next((i for i, item in enumerate(self._items) if predicate(item)), None)
+
+    def update_item(self, index: int, item: Any):
+        """Replace one item; only its row is re-bound (if it is on screen)"""
+        self._items[index] = item
+        window_id = self._bound.get(index)
+        if window_id is not None:
+            self.bind_row(self._widgets[window_id], item)
+            self._measure([index])
+        else:
+            self._measured.discard(index)
+
+    def insert_item(self, index: int, item: Any):
+        """Insert one item; rows below it move down without being re-bound"""
+        self._items.insert(index, item)
+        self._heights.insert(index, self._estimate(item))
+        self._shift_indices(index, 1)
+        self._after_resize()
+
+    def remove_item(self, index: int):
+        """Remove one item; its row is recycled and rows below it move up"""
+        del self._items[index]
+        del self._heights[index]
+        window_id = self._bound.pop(index, None)
+        if window_id is not None:
+            self._free.append(window_id)
+            self.canvas.itemconfigure(window_id, state="hidden")
+        self._measured.discard(index)
+        self._shift_indices(index + 1, -1)
+        self._after_resize()
+
+    def upsert_sorted(self, item: Any, key: Callable[[Any], Any], index: Optional[int] = None,
+                      reverse: bool = False, has_more: bool = False):
+        """Put an item where it belongs in a list sorted by key
+
+        index is the item's current position, if it is already in the list.
+        With has_more (later pages not loaded yet) an item that sorts after
+        the last loaded one is left out, as it belongs to a later page.
+        """
+        item_key = key(item)
+        position = 0
+        for i, other in enumerate(self._items):
+            if i == index:
+                continue
+            other_key = key(other)
+            if (other_key > item_key) if reverse else (other_key < item_key):
+                position += 1
+
+        others = len(self._items) - (index is not None)
+        if has_more and position >= others:
+            if index is not None:
+                self.remove_item(index)
+            return
+
+        if position == index:
+            self.update_item(index, item)
+            return
+        if index is not None:
+            self.remove_item(index)
+        self.insert_item(position, item)
+
+    def _shift_indices(self, start: int, delta: int):
+        """Move bound rows and measurements at index >= start by delta"""
+        self._bound = {(i + delta if i >= start else i): w for i, w in self._bound.items()}
+        self._measured = {(i + delta if i >= start else i) for i in self._measured}
+
+    def _after_resize(self):
+        self._update_offsets()
+        self._place_rows()
+        self.canvas.itemconfigure(self._empty_window, state="hidden" if self._items else "normal")
+        self._schedule_render()
+
+    def _place_rows(self):
+        for index, window_id in self._bound.items():
+            self.canvas.coords(window_id, self._apply_widget_scaling(self.row_padx),
+                               self._offsets[index] + self._apply_widget_scaling(self.row_pady))
+
+    def _estimate(self, item) -> int:
+        height = self.estimate_height(item) if callable(self.estimate_height) else self.estimate_height
+        return int(self._apply_widget_scaling(height + 2 * self.row_pady))
+
+    def _update_offsets(self):
+        offsets = [0]
+        for height in self._heights:
+            offsets.append(offsets[-1] + height)
+        self._offsets = offsets
+        self.canvas.configure(scrollregion=(0, 0, self._width, max(offsets[-1], 1)))
+
+    def _schedule_render(self):
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def _render(self):
+        """Bind rows for the visible range (plus buffer) and park the rest"""
+        self._render_pending = False
+        count = len(self._items)
+
+        if count:
+            top = self.canvas.canvasy(0)
+            bottom = top + max(self.canvas.winfo_height(), 1)
+            first = max(bisect_right(self._offsets, top) - 1, 0)
+            last = min(bisect_right(self._offsets, bottom), count)
+            needed = range(max(first - self.buffer_rows, 0), min(last + self.buffer_rows, count))
+        else:
+            needed = range(0)
+
+        for index in [i for i in self._bound if i not in needed]:
+            self._free.append(self._bound.pop(index))
+
+        newly_bound = []
+        for index in needed:
+            if index in self._bound:
+                continue
+            window_id = self._free.pop() if self._free else self._new_row()
+            self._bound[index] = window_id
+            self.bind_row(self._widgets[window_id], self._items[index])
+            self.canvas.coords(window_id, self._apply_widget_scaling(self.row_padx),
+                               self._offsets[index] + self._apply_widget_scaling(self.row_pady))
+            self.canvas.itemconfigure(window_id, state="normal")
+            newly_bound.append(index)
+
+        for window_id in self._free:
+            self.canvas.itemconfigure(window_id, state="hidden")
+
+        unmeasured = [i for i in newly_bound if i not in self._measured]
+        if unmeasured:
+            self._measure(unmeasured)
+
+        if self.on_near_end and count and needed.stop >= count:
+            self.after_idle(self.on_near_end)
+
+    def _new_row(self) -> int:
+        widget = self.create_row(self.canvas)
+        window_id = self.canvas.create_window(
+            0, 0, window=widget, anchor="nw",
+            width=max(self._width - 2 * self._apply_widget_scaling(self.row_padx), 1)
+        )
+        self._widgets[window_id] = widget
+        return window_id
+
+    def _measure(self, indices: List[int]):
+        """Replace estimated heights with real ones, keeping the top row in place"""
+        self.canvas.update_idletasks()
+        pady = 2 * self._apply_widget_scaling(self.row_pady)
+
+        changed = False
+        for index in indices:
+            window_id = self._bound.get(index)
+            if window_id is None:
+                continue
+            height = int(self._widgets[window_id].winfo_reqheight() + pady)
+            self._measured.add(index)
+            if height != self._heights[index]:
+                self._heights[index] = height
+                changed = True
+
+        if not changed:
+            return
+
+        # Remember which row is at the top so rows above growing/shrinking doesn't jump the view
+        top = self.canvas.canvasy(0)
+        anchor_index = max(bisect_right(self._offsets, top) - 1, 0)
+        anchor_shift = top - self._offsets[anchor_index] if self._items else 0
+
+        self._update_offsets()
+        self._place_rows()
+
+        if self._items and top > 0:
+            new_top = self._offsets[min(anchor_index, len(self._items) - 1)] + anchor_shift
+            self.canvas.yview_moveto(new_top / max(self._offsets[-1], 1))
+
+        # Heights changed, so a different set of rows may now be visible
+        self._schedule_render()
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_render()
+
+    def _on_configure(self, event):
+        if event.width == self._width:
+            self._schedule_render()
+            return
+
+        # Wider or narrower rows can wrap differently, so measure them again
+        self._width = event.width
+        row_width = max(event.width - 2 * self._apply_widget_scaling(self.row_padx), 1)
+        for window_id in self._widgets:
+            self.canvas.itemconfigure(window_id, width=row_width)
+        self.canvas.coords(self._empty_window, event.width / 2, 40)
+        self._measured.clear()
+        self._update_offsets()
+        self._schedule_render()
+        if self._bound:
+            self.after_idle(lambda: self._measure(list(self._bound)))
+
+    def _on_mousewheel(self, event):
+        try:
+            if not self.winfo_exists() or not str(event.widget).startswith(str(self.canvas)):
+                return
+        except (tk.TclError, AttributeError):
+            return
+
+        if event.num == 4:
+            steps = -3
+        elif event.num == 5:
+            steps = 3
+        elif sys.platform == "darwin":
+            steps = -event.delta
+        else:
+            steps = -int(event.delta / 40)
+        if steps:
+            self.canvas.yview_scroll(steps, "units")